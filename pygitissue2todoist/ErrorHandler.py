@@ -22,6 +22,8 @@ from wx import MessageDialog
 
 from pygitissue2todoist.general.Preferences import Preferences
 
+from pygitissue2todoist.strategy.TodoistReplica import TODOIST_REPLICA_DIRECTORY_NAME
+
 INVALID_TEMP_ID: int = 16
 MAX_PROJECTS:    int = 50
 
@@ -30,7 +32,7 @@ HandledErrors = NewType('HandledErrors', List[int])
 
 class ErrorHandler:
 
-    TODOIST_CACHE_DIRECTORY_NAME: str = '.todoist-sync'
+    TODOIST_CACHE_DIRECTORY_NAME: str = TODOIST_REPLICA_DIRECTORY_NAME
 
     def __init__(self):
 
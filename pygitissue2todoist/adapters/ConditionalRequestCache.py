@@ -0,0 +1,192 @@
+
+from typing import Dict
+from typing import NewType
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from sqlite3 import Connection
+from sqlite3 import connect
+
+from threading import RLock
+
+from time import time
+
+CacheKey = NewType('CacheKey', str)
+
+SCHEMA: str = '''
+    CREATE TABLE IF NOT EXISTS responses (
+        cacheKey        TEXT PRIMARY KEY,
+        etag            TEXT,
+        lastModified    TEXT,
+        headers         TEXT    NOT NULL,
+        body            TEXT    NOT NULL,
+        size            INTEGER NOT NULL,
+        lastAccessed    REAL    NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS responsesByAccess ON responses (lastAccessed);
+'''
+
+
+def createHeadersFactory() -> Dict[str, str]:
+    return {}
+
+
+@dataclass
+class CachedResponse:
+    etag:         Optional[str] = None
+    lastModified: Optional[str] = None
+    headers:      Dict[str, str] = field(default_factory=createHeadersFactory)
+    body:         str = ''
+
+
+class ConditionalRequestCache:
+    """
+    Remembers the validators (ETag, Last-Modified) and bodies of successful GET responses so
+    that the next request for the same URL can be made conditional.  GitHub does not count
+    a 304 against the rate limit, so unchanged pages cost neither budget nor transfer.
+
+    Entries are keyed by URL and a digest of the credentials;  The credentials themselves are
+    never stored.  When the stored bodies exceed `maxBytes` the least recently used entries are
+    evicted;  Sizes are the UTF-8 encoded length of the bodies.  Safe to use from any thread
+    """
+    DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+    def __init__(self, databasePath: Path, maxBytes: int = DEFAULT_MAX_BYTES):
+        """
+
+        Args:
+            databasePath:   Where the SQLite database lives;  Created when missing
+            maxBytes:       The size cap for the stored bodies
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxBytes: int   = maxBytes
+        self._lock:     RLock = RLock()
+
+        self._hitCount:  int = 0
+        self._missCount: int = 0
+
+        self._connection: Connection = connect(databasePath, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+        self._totalBytes: int = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    @property
+    def hitCount(self) -> int:
+        """
+        Returns:  The number of responses served from the cache after GitHub said Not Modified
+        """
+        return self._hitCount
+
+    @property
+    def missCount(self) -> int:
+        """
+        Returns:  The number of conditional requests for which GitHub sent a new body
+        """
+        return self._missCount
+
+    def createKey(self, url: str, credentials: str) -> CacheKey:
+        """
+        Args:
+            url:            The absolute request URL including its query
+            credentials:    Whatever identifies the caller (e.g. the Authorization header)
+
+        Returns:  The key under which the response is stored
+        """
+        credentialsDigest: str = sha256(credentials.encode('utf-8')).hexdigest()[:16]
+
+        return CacheKey(f'{credentialsDigest} {url}')
+
+    def lookup(self, cacheKey: CacheKey) -> Optional[CachedResponse]:
+
+        with self._lock:
+            row = self._connection.execute('SELECT etag, lastModified, headers, body FROM responses WHERE cacheKey = ?', (cacheKey,)).fetchone()
+
+        if row is None:
+            return None
+
+        etag, lastModified, headers, body = row
+
+        return CachedResponse(etag=etag, lastModified=lastModified, headers=jsonLoads(headers), body=body)
+
+    def store(self, cacheKey: CacheKey, cachedResponse: CachedResponse):
+
+        """
+        Store a fresh response.  Replacing an entry means the request was conditional and GitHub
+        sent a new body, so it counts as a miss
+        """
+        size: int = len(cachedResponse.body.encode('utf-8'))
+        if size > self._maxBytes:
+            return
+
+        with self._lock, self._connection:
+            previousSize: Optional[int] = self._storedSize(cacheKey)
+            self._connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                     (cacheKey, cachedResponse.etag, cachedResponse.lastModified,
+                                      jsonDumps(cachedResponse.headers), cachedResponse.body, size, time())
+                                     )
+            if previousSize is not None:
+                self._totalBytes -= previousSize
+                self._missCount  += 1
+            self._totalBytes += size
+
+        self._enforceSizeCap()
+
+    def touch(self, cacheKey: CacheKey):
+        """
+        Record that GitHub confirmed the entry is still current
+        """
+        with self._lock, self._connection:
+            self._connection.execute('UPDATE responses SET lastAccessed = ? WHERE cacheKey = ?', (time(), cacheKey))
+            self._hitCount += 1
+
+    def remove(self, cacheKey: CacheKey):
+
+        with self._lock, self._connection:
+            previousSize: Optional[int] = self._storedSize(cacheKey)
+            if previousSize is not None:
+                self._connection.execute('DELETE FROM responses WHERE cacheKey = ?', (cacheKey,))
+                self._totalBytes -= previousSize
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+            self._totalBytes = 0
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _storedSize(self, cacheKey: CacheKey) -> Optional[int]:
+
+        row = self._connection.execute('SELECT size FROM responses WHERE cacheKey = ?', (cacheKey,)).fetchone()
+        if row is None:
+            return None
+
+        return row[0]
+
+    def _enforceSizeCap(self):
+        """
+        The running total spares a scan of the table on every store
+        """
+        with self._lock, self._connection:
+            if self._totalBytes <= self._maxBytes:
+                return
+
+            for cacheKey, size in self._connection.execute('SELECT cacheKey, size FROM responses ORDER BY lastAccessed').fetchall():
+                self._connection.execute('DELETE FROM responses WHERE cacheKey = ?', (cacheKey,))
+                self._totalBytes -= size
+                if self._totalBytes <= self._maxBytes:
+                    break
@@ -1,15 +1,41 @@
 
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import NewType
 from typing import Optional
+from typing import Tuple
+from typing import TypeVar
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from threading import Event
+from threading import Lock
+from threading import Thread
+from threading import local
+
+from time import perf_counter
+
+from queue import Empty
+from queue import Full
+from queue import Queue
+
 from dataclasses import dataclass
-from dataclasses import field
+
+from functools import partial
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from json import dumps as jsonDumps
 
 from github import Github
 from github import BadCredentialsException
@@ -34,31 +60,48 @@ from cffi import api
 from pygitissue2todoist.adapters.AdapterAuthenticationError import AdapterAuthenticationError
 from pygitissue2todoist.adapters.GitHubConnectionError import GitHubConnectionError
 from pygitissue2todoist.adapters.GitHubGeneralError import GitHubGeneralError
-
-MilestoneTitles = NewType('MilestoneTitles', List[str])
-IssueOwner      = NewType('IssueOwner',      str)
-
-
-def createLabelsFactory() -> List[str]:
-    return []
+from pygitissue2todoist.adapters.GitHubRetriesExhaustedError import GitHubRetriesExhaustedError
+
+from pygitissue2todoist.adapters.ConditionalRequestCache import ConditionalRequestCache
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import CachedIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import CachedIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import FetchStatistics
+from pygitissue2todoist.adapters.GitHubAdapterTypes import IssueOwner
+from pygitissue2todoist.adapters.GitHubAdapterTypes import IssuesBySlug
+from pygitissue2todoist.adapters.GitHubAdapterTypes import MilestoneTitles
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slugs
+from pygitissue2todoist.adapters.GitHubIssueCache import GitHubIssueCache
+from pygitissue2todoist.adapters.GraphQLIssueFetcher import GraphQLIssueFetcher
+from pygitissue2todoist.adapters.RateLimitScheduler import RateLimitScheduler
+from pygitissue2todoist.adapters.RepositoryCache import RepositoryCache
+from pygitissue2todoist.adapters.RepositoryNameCache import RepositoryNameCache
+from pygitissue2todoist.adapters.RetryPolicy import RetryPolicy
+from pygitissue2todoist.adapters.RevalidatingHTTPSConnection import RevalidatingHTTPSConnection
+
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+MilestonesByTitle = NewType('MilestonesByTitle', Dict[str, Milestone])
+
+SlugResult = TypeVar('SlugResult')
+ListItem   = TypeVar('ListItem')
+
+RepositoryNamesCallback = Callable[[Slugs], None]
 
 
 @dataclass
-class AbbreviatedGitIssue:
-
-    slug:         str = ''
-    issueTitle:   str = ''
-    issueHTMLURL: str = ''
-    body:         str = ''
-    labels:       List[str] = field(default_factory=createLabelsFactory)
-
-
-AbbreviatedGitIssues = NewType('AbbreviatedGitIssues', List[AbbreviatedGitIssue])
-
-Slug  = NewType('Slug',  str)
-Slugs = NewType('Slugs', List[Slug])
-
-IssuesCallback = Callable[[str], None]
+class _WorkerMessage:
+    """
+    A worker sends one message per result and a final one with either its statistics or its error
+    """
+    slug:       Slug
+    result:     Any                       = None
+    statistics: Optional[FetchStatistics] = None
+    error:      Optional[Exception]       = None
 
 
 class GithubAdapter:
@@ -66,33 +109,359 @@ class GithubAdapter:
     ALL_ISSUES_INDICATOR:     str = 'All'
     OPEN_MILESTONE_INDICATOR: str = 'Open'
     OPEN_ISSUE_INDICATOR:     str = 'open'
+    ASSIGNED_ISSUES_FILTER:   str = 'assigned'
+    ALL_STATES_INDICATOR:     str = 'all'
+    #
+    # Everything the user can push issues from;  Their own repositories and those of their organizations
+    #
+    REPOSITORY_AFFILIATION:   str = 'owner,collaborator,organization_member'
+    REPOSITORY_SORT:          str = 'full_name'
+
+    DEFAULT_MAX_CONCURRENCY: int = 4
+    #
+    # GitHub's secondary rate limits punish bursts of concurrent requests;  Never go above this
+    #
+    MAX_CONCURRENCY_CEILING: int = 8
+    #
+    # How far workers may run ahead of a slow consumer
+    #
+    PAGES_BUFFERED_PER_WORKER: int   = 2
+    WORKER_POLL_SECONDS:       float = 0.1
+    #
+    # How often to tell the user that the workers are waiting on the rate limit
+    #
+    RATE_LIMIT_REPORT_SECONDS: float = 5.0
+    #
+    # GitHub's maximum;  The default of 30 triples the number of pages we fetch
+    #
+    ISSUES_PER_PAGE: int = 100
+    #
+    # Tolerate clock differences between us and GitHub;  Seeing an issue twice is a harmless upsert
+    #
+    SYNCHRONIZATION_OVERLAP: timedelta = timedelta(minutes=5)
+    #
+    # Deleted and transferred issues never show up in an incremental listing;  Periodically start over
+    #
+    FULL_REFRESH_INTERVAL: timedelta = timedelta(days=7)
+
+    def __init__(self, userName: str, authenticationToken: str,
+                 maxConcurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 fetchBackend: GitHubFetchBackend = GitHubFetchBackend.REST,
+                 issueCache: Optional[GitHubIssueCache] = None,
+                 repositoryNameCache: Optional[RepositoryNameCache] = None,
+                 retryPolicy: Optional[RetryPolicy] = None,
+                 responseCache: Optional[ConditionalRequestCache] = None):
+        """
 
-    def __init__(self, userName: str, authenticationToken: str):
+        Args:
+            userName:               The GitHub user name
+            authenticationToken:    The GitHub personal access token
+            maxConcurrency:         The maximum number of repositories retrieved in parallel; A value of
+                                    1 retrieves them sequentially on the calling thread
+            fetchBackend:           Whether issues are retrieved via REST or via batched GraphQL queries
+            issueCache:             When present, repository issues are kept in this cache and only
+                                    the changes since the previous retrieval are requested.  The
+                                    cache holds every open issue of a repository, so it synchronizes
+                                    via REST without an assignee or milestone filter, and a repository
+                                    is only yielded once it is synchronized.  It pays off for repeated
+                                    retrievals from the same repositories;  Off by default
+            repositoryNameCache:    When present, getRepositoryNames answers from this cache and
+                                    refreshes stale listings in the background
+            retryPolicy:            How transient failures are retried;  Each page of a listing
+                                    is retried on its own
+            responseCache:          When present, GET requests are revalidated against the
+                                    responses stored in this cache
+        """
 
         self.logger: Logger = getLogger(__name__)
 
         self._userName:            str    = userName
         self._authenticationToken: str    = authenticationToken
-        self._github:              Github = Github(auth=Token(self._authenticationToken))
+        self._maxConcurrency:      int    = max(1, min(maxConcurrency, GithubAdapter.MAX_CONCURRENCY_CEILING))
+
+        self._responseCache: Optional[ConditionalRequestCache] = responseCache
+        self._scheduler:     RateLimitScheduler                = RateLimitScheduler()
+        self._retryPolicy:   RetryPolicy                       = RetryPolicy() if retryPolicy is None else retryPolicy
+
+        self._github: Github = self._createGithub()
+
+        self._workerClients: local = local()
+
+        self._fetchBackend:        GitHubFetchBackend  = fetchBackend
+        self._graphQLFetcher:      GraphQLIssueFetcher = GraphQLIssueFetcher(requester=self._github.requester, retryPolicy=self._retryPolicy)
+        self._lastFetchStatistics: FetchStatistics     = FetchStatistics(backend=fetchBackend)
+        self._issueCache:          Optional[GitHubIssueCache] = issueCache
+
+        self._repositoryNameCache: Optional[RepositoryNameCache] = repositoryNameCache
+        self._refreshLock:         Lock                          = Lock()
+        self._refreshing:          bool                          = False
+
+        self._milestones:   Dict[Slug, MilestonesByTitle] = {}
+        self._repositories: RepositoryCache               = RepositoryCache()
+
+    @property
+    def lastFetchStatistics(self) -> FetchStatistics:
+        """
+        Returns:  What the most recent issue retrieval cost
+        """
+        return self._lastFetchStatistics
+
+    def getRepositoryNames(self, onRefresh: Optional[RepositoryNamesCallback] = None) -> Slugs:
+        """
+        Lists the repositories the user owns, collaborates on, or can see through an organization
+        membership.  With a repository name cache the cached listing is returned immediately;  When
+        it is stale a background thread lists the repositories again and hands the new listing to
+        `onRefresh`
+
+        Args:
+            onRefresh:  Invoked on the background thread with a refreshed listing;  UI callers
+                        must marshal to the UI thread themselves
+
+        Returns:  The repository slugs sorted by name
+        """
+        if self._repositoryNameCache is not None:
+            cachedSlugs: Optional[Slugs] = self._repositoryNameCache.load(userName=self._userName)
+            if cachedSlugs is not None:
+                if self._repositoryNameCache.isStale(userName=self._userName) is True:
+                    self._refreshRepositoryNamesInBackground(onRefresh=onRefresh)
+                return cachedSlugs
+
+        repoNames: Slugs = self._listRepositoryNames(github=self._github)
+        if self._repositoryNameCache is not None:
+            self._repositoryNameCache.save(userName=self._userName, slugs=repoNames)
+
+        return repoNames
+
+    def getMileStoneTitles(self, repoName: Slug) -> MilestoneTitles:
+        """
+        Has the side effect that it remembers the repository's milestones so that
+        getAbbreviatedIssues can ask GitHub for a single milestone's issues
+
+        Args:
+            repoName: The repository name
+        """
+
+        repo:       Repository        = self._getRepository(repoName)
+        mileStones: MilestonesByTitle = self._loadMilestones(repo=repo, repoName=repoName)
+
+        mileStoneTitles: MilestoneTitles = MilestoneTitles([GithubAdapter.ALL_ISSUES_INDICATOR])
+
+        mileStoneTitles.extend(mileStones.keys())
+
+        return mileStoneTitles
+
+    def getAbbreviatedIssues(self, repoName: Slug, milestoneTitle: str) -> AbbreviatedGitIssues:
+        """
+        Given a repo name and a milestone title return a simplified list of Git issues.
+        The milestone filter is pushed to GitHub, so only that milestone's issues are transferred
+
+        Args:
+            repoName:       The GitHub repository name
+            milestoneTitle: The milestone title that we filter on
+
+        Returns:
+            A list of abbreviated Git issues
+        """
+        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+        for page in self.iterateAbbreviatedIssues(repoName=repoName, milestoneTitle=milestoneTitle):
+            simpleGitIssues.extend(page)
+
+        return simpleGitIssues
+
+    def iterateAbbreviatedIssues(self, repoName: Slug, milestoneTitle: str) -> Iterator[AbbreviatedGitIssues]:
+        """
+        The streaming version of getAbbreviatedIssues.  Yields the issues a page at a time as
+        GitHub delivers them, so that callers can show the first rows after a single round trip
+
+        Args:
+            repoName:       The GitHub repository name
+            milestoneTitle: The milestone title that we filter on
+
+        Returns:  An iterator of pages of abbreviated Git issues
+        """
+        startTime:  float           = perf_counter()
+        statistics: FetchStatistics = FetchStatistics(backend=self._fetchBackend)
+        repo:       Repository      = self._getRepository(repoName)
+
+        if milestoneTitle == GithubAdapter.ALL_ISSUES_INDICATOR:
+            mileStone: Optional[Milestone] = None
+        else:
+            mileStone = self._lookupMilestone(repo=repo, repoName=repoName, milestoneTitle=milestoneTitle)
+            if mileStone is None:
+                self.logger.warning(f'{repoName} no longer has an open milestone named: {milestoneTitle}')
+                return
+
+        milestoneNumber: Optional[int] = None if mileStone is None else mileStone.number
+
+        if self._issueCache is not None:
+            for _ in self._synchronizeRepositories(slugs=Slugs([repoName]), statistics=statistics, callback=ProgressMonitor(listener=self._logProgress)):
+                pass
+            pages: Iterator[AbbreviatedGitIssues] = iter([self._issueCache.openIssues(slug=repoName, milestoneNumber=milestoneNumber)])
+        elif self._fetchBackend == GitHubFetchBackend.GraphQL:
+            pages = (page for _, page in self._graphQLFetcher.iterateOpenIssues(slugs=Slugs([repoName]),
+                                                                              callback=ProgressMonitor(listener=self._logProgress),
+                                                                              statistics=statistics,
+                                                                              milestoneNumber=milestoneNumber))
+        else:
+            if mileStone is None:
+                openGitIssues: PaginatedList = repo.get_issues(state=GithubAdapter.OPEN_ISSUE_INDICATOR)
+            else:
+                openGitIssues = repo.get_issues(state=GithubAdapter.OPEN_ISSUE_INDICATOR, milestone=mileStone)
+
+            pages = self._abbreviatePages(slug=repoName, openIssues=openGitIssues, statistics=statistics, description=f'{repoName} issues')
+
+        issueCount: int = 0
+        for page in pages:
+            issueCount += len(page)
+            yield page
+
+        self._recordStatistics(statistics=statistics, startTime=startTime, issueCount=issueCount)
+
+    def getIssuesAssignedToOwner(self, slugs: Slugs, issueOwner: IssueOwner, callback: ProgressMonitor) -> AbbreviatedGitIssues:
+        """
+        Creates an abbreviated list open issues assigned to the issue owner.  Repositories are
+        retrieved concurrently by at most `maxConcurrency` workers.  The callback is always invoked on
+        the calling thread and the result is in the same order as the input slugs
+
+        Args:
+            slugs:          GitHub Slugs;  e.g. 'hasii2011/pyut'
+            issueOwner:     The ones we are looking for
+            callback:       Advanced as each repository completes;  When it is cancelled the issues
+                            retrieved so far are returned
+
+        Returns:  A list of issues assigned to the user;  The repositories that could not be
+        retrieved are in `lastFetchStatistics.failedSlugs`
+
+        Raises:
+            GitHubConnectionError:  When not a single repository could be retrieved
+        """
+        issuesBySlug: IssuesBySlug = IssuesBySlug({slug: AbbreviatedGitIssues([]) for slug in slugs})
+        for page in self.iterateIssuesAssignedToOwner(slugs=slugs, issueOwner=issueOwner, callback=callback):
+            for simpleGitIssue in page:
+                issuesBySlug[Slug(simpleGitIssue.slug)].append(simpleGitIssue)
+
+        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+        for slug in slugs:
+            simpleGitIssues.extend(issuesBySlug[slug])
+
+        return simpleGitIssues
+
+    def iterateIssuesAssignedToOwner(self, slugs: Slugs, issueOwner: IssueOwner, callback: ProgressMonitor) -> Iterator[AbbreviatedGitIssues]:
+        """
+        The streaming version of getIssuesAssignedToOwner.  Yields pages of issues as soon as any
+        worker receives them, so pages of different repositories interleave.  At most a few pages
+        per worker are buffered, which bounds memory however many repositories are selected.
+        Closing the iterator early, or cancelling the callback, stops the workers after their
+        current request.
+
+        The repositories that could not be retrieved are in `lastFetchStatistics.failedSlugs`;
+        It is filled in as the retrieval goes, so it is also complete after stopping early
+
+        Args:
+            slugs:          GitHub Slugs;  e.g. 'hasii2011/pyut'
+            issueOwner:     The ones we are looking for
+            callback:       A phase with a step per repository;  Invoked on the calling thread
+
+        Returns:  An iterator of pages of issues assigned to the user
+
+        Raises:
+            GitHubConnectionError:  When not a single repository could be retrieved
+        """
+        startTime:  float           = perf_counter()
+        statistics: FetchStatistics = FetchStatistics(backend=self._fetchBackend)
+        issueCount: int             = 0
+
+        self._lastFetchStatistics = statistics
+
+        callback.startPhase(phase='Retrieving issues', total=len(slugs))
+        with self._scheduler.reportingTo(callback):
+            if self._issueCache is not None:
+                for slug in self._synchronizeRepositories(slugs=slugs, statistics=statistics, callback=callback):
+                    page: AbbreviatedGitIssues = self._issueCache.openIssues(slug=slug, assignee=issueOwner)
+                    issueCount += len(page)
+                    yield page
+            elif self._fetchBackend == GitHubFetchBackend.GraphQL:
+                for _, page in self._graphQLFetcher.iterateOpenIssues(slugs=slugs, callback=callback, statistics=statistics, assignee=issueOwner):
+                    issueCount += len(page)
+                    yield page
+            else:
+                slugCounts: Dict[Slug, int] = {}
+
+                def retrieve(github: Github, slug: Slug, workerStatistics: FetchStatistics) -> Iterator[AbbreviatedGitIssues]:
+                    return self._iterateOwnerIssues(github=github, slug=slug, issueOwner=issueOwner, statistics=workerStatistics)
 
-    def getRepositoryNames(self) -> Slugs:
+                def complete(slug: Slug):
+                    callback.advance(message=f'Retrieved {slugCounts.get(slug, 0)} issues from {slug} ({self._scheduler.describe()})')
 
-        userName: str = self._userName
-        query:    str = f'user:{userName}'
+                for slug, page in self._forEachSlug(slugs=slugs, work=retrieve, statistics=statistics, onComplete=complete, callback=callback):
+                    slugCounts[slug] = slugCounts.get(slug, 0) + len(page)
+                    issueCount += len(page)
+                    yield page
 
-        repos: PaginatedList = self._github.search_repositories(query=query)
+        self._recordStatistics(statistics=statistics, startTime=startTime, issueCount=issueCount)
+
+    def getIssuesAssignedToAuthenticatedUser(self, callback: ProgressMonitor) -> AbbreviatedGitIssues:
+        """
+        Uses GitHub's cross-repository issue listing to retrieve every open issue assigned to
+        the authenticated user.  This covers all repositories and organizations in a handful of
+        pages instead of one scan per repository.
+
+        Args:
+            callback:   Advanced per issue;  The total is not known up front.  When it is cancelled the
+                        issues retrieved so far are returned
+
+        Returns:  A list of issues assigned to the user grouped by slug
+        """
+        assignedIssues: PaginatedList[Issue] = self._github.get_user().get_issues(filter=GithubAdapter.ASSIGNED_ISSUES_FILTER,
+                                                                                 state=GithubAdapter.OPEN_ISSUE_INDICATOR)
+        issuesBySlug: IssuesBySlug = IssuesBySlug({})
+
+        callback.startPhase(phase='Retrieving assigned issues')
+        with self._scheduler.reportingTo(callback):
+            for page in self._iteratePages(listing=assignedIssues, description='Issues assigned to the user'):
+                if callback.cancelled is True:
+                    break
+                for issue in page:
+                    fullGitIssue: Issue = cast(Issue, issue)
+                    # The listing embeds the repository, so this does not cost a round trip
+                    slug: Slug = Slug(fullGitIssue.repository.full_name)
+                    if slug not in issuesBySlug:
+                        issuesBySlug[slug] = AbbreviatedGitIssues([])
+                        callback(f'Retrieving issues from {slug}')
+
+                    issuesBySlug[slug].append(self._createAbbreviatedGitIssue(slug=slug, fullGitIssue=fullGitIssue))
+                callback.advance(count=len(page))
+
+        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+        for slug, slugIssues in issuesBySlug.items():
+            simpleGitIssues.extend(slugIssues)
+
+        callback(f'Retrieved {len(simpleGitIssues)} issues from {len(issuesBySlug)} repositories')
+
+        return simpleGitIssues
+
+    def _listRepositoryNames(self, github: Github) -> Slugs:
+        """
+        Pages through the authenticated user's repository listing.  Unlike the search API this has
+        the normal rate limit, no result cap and includes organization repositories
+        """
+        repos: PaginatedList = github.get_user().get_repos(affiliation=GithubAdapter.REPOSITORY_AFFILIATION,
+                                                           sort=GithubAdapter.REPOSITORY_SORT)
 
         # noinspection PyPackageRequirements
         import urllib3.exceptions
 
         try:
             repoNames: Slugs = Slugs([])
-            for repository in repos:
-                repoNames.append(repository.full_name)
+            for page in self._iteratePages(listing=repos, description='Repository listing'):
+                for repository in page:
+                    repoNames.append(repository.full_name)
 
         except BadCredentialsException as e:
             self.logger.error(f'{e=}')
             raise AdapterAuthenticationError(e)
+        except GitHubRetriesExhaustedError:
+            raise
         # Can't figure out what kind of outer error this;  Use simplest
         except Exception as ge:
             self.logger.error(f'{ge}')
@@ -110,82 +479,332 @@ class GithubAdapter:
 
         return repoNames
 
-    def getMileStoneTitles(self, repoName: Slug) -> MilestoneTitles:
+    def _refreshRepositoryNamesInBackground(self, onRefresh: Optional[RepositoryNamesCallback]):
         """
-        Args:
-            repoName: The repository name
+        At most one refresh runs at a time;  It uses its own client because the
+        PyGithub requester is not thread safe
+        """
+        with self._refreshLock:
+            if self._refreshing is True:
+                return
+            self._refreshing = True
+
+        def refresh():
+            try:
+                repoNames: Slugs = self._listRepositoryNames(github=self._createGithub())
+                cast(RepositoryNameCache, self._repositoryNameCache).save(userName=self._userName, slugs=repoNames)
+                if onRefresh is not None:
+                    onRefresh(repoNames)
+            except Exception as e:
+                self.logger.warning(f'Could not refresh the repository names: {e}')
+            finally:
+                with self._refreshLock:
+                    self._refreshing = False
+
+        Thread(target=refresh, name='RepositoryNameRefresh', daemon=True).start()
+
+    def _forEachSlug(self, slugs: Slugs,
+                     work: Callable[[Github, Slug, FetchStatistics], Iterator[SlugResult]],
+                     statistics: FetchStatistics,
+                     onComplete: Callable[[Slug], None],
+                     callback: ProgressMonitor) -> Iterator[Tuple[Slug, SlugResult]]:
         """
+        Run the per repository work on at most `maxConcurrency` workers and yield each result
+        on the calling thread as soon as it arrives.  Workers hand their results over through a
+        bounded queue, so a slow consumer slows the workers down instead of piling up pages.
+        Worker statistics are merged into `statistics`.
 
-        repo:            Repository    = self._github.get_repo(repoName)
-        mileStones:      PaginatedList = repo.get_milestones(state=GithubAdapter.OPEN_MILESTONE_INDICATOR)
+        A repository whose retries run out is reported, recorded in `statistics.failedSlugs`
+        and skipped;  The results of the other repositories are kept.  When every repository
+        fails that is an outage, not an empty result, so it raises.  Any other failure ends
+        the retrieval
 
-        mileStoneTitles: MilestoneTitles = MilestoneTitles([GithubAdapter.ALL_ISSUES_INDICATOR])
+        Args:
+            slugs:      The repositories
+            work:       Produces one repository's results with the supplied client
+            statistics: What the retrieval cost
+            onComplete: Invoked on the calling thread after a repository's last result
+            callback:   Told, on the calling thread, when the workers wait on the rate limit;  When it
+                        is cancelled no further results are yielded
 
-        for mileStone in mileStones:
-            mileStoneTitles.append(mileStone.title)
+        Returns:  An iterator of (slug, result) tuples
 
-        return mileStoneTitles
+        Raises:
+            GitHubConnectionError:  When not a single repository could be retrieved
+        """
+        failures: List[GitHubRetriesExhaustedError] = []
+        if self._maxConcurrency == 1 or len(slugs) < 2:
+            for slug in slugs:
+                if callback.cancelled is True:
+                    return
+                try:
+                    for result in work(self._github, slug, statistics):
+                        yield slug, result
+                except GitHubRetriesExhaustedError as e:
+                    failures.append(e)
+                    self._skipFailedSlug(slug=slug, error=e, statistics=statistics, callback=callback)
+                    continue
+                onComplete(slug)
+            self._raiseIfAllFailed(slugs=slugs, failures=failures)
+            return
+
+        results:   Queue = Queue(maxsize=self._maxConcurrency * GithubAdapter.PAGES_BUFFERED_PER_WORKER)
+        cancelled: Event = Event()
+        with ThreadPoolExecutor(max_workers=self._maxConcurrency, thread_name_prefix='GitHubWorker') as executor:
+            futures: List[Future] = [executor.submit(self._runOnWorker, work, slug, results, cancelled) for slug in slugs]
+            try:
+                remaining: int = len(slugs)
+                while remaining > 0 and callback.cancelled is False:
+                    try:
+                        message: _WorkerMessage = results.get(timeout=GithubAdapter.RATE_LIMIT_REPORT_SECONDS)
+                    except Empty:
+                        if self._scheduler.expectedWait > 0:
+                            callback(f'GitHub rate limit:  {self._scheduler.describe()}')
+                        continue
+                    if isinstance(message.error, GitHubRetriesExhaustedError):
+                        failures.append(message.error)
+                        self._skipFailedSlug(slug=message.slug, error=message.error, statistics=statistics, callback=callback)
+                        remaining -= 1
+                    elif message.error is not None:
+                        raise message.error
+                    elif message.statistics is not None:
+                        statistics.requestCount     += message.statistics.requestCount
+                        statistics.bytesTransferred += message.statistics.bytesTransferred
+                        onComplete(message.slug)
+                        remaining -= 1
+                    else:
+                        yield message.slug, message.result
+            finally:
+                # Also runs when the consumer stops iterating early
+                cancelled.set()
+                for future in futures:
+                    future.cancel()
+
+        if callback.cancelled is False:
+            self._raiseIfAllFailed(slugs=slugs, failures=failures)
+
+    def _skipFailedSlug(self, slug: Slug, error: GitHubRetriesExhaustedError, statistics: FetchStatistics, callback: ProgressMonitor):
+
+        self.logger.error(f'Skipping {slug}: {error}')
+        statistics.failedSlugs.append(slug)
+        callback.advance(message=f'Could not retrieve {slug};  Skipped it:  {error}')
+
+    def _raiseIfAllFailed(self, slugs: Slugs, failures: List[GitHubRetriesExhaustedError]):
+        """
+        Otherwise a network outage would look like a retrieval that found no issues
+        """
+        if len(slugs) > 0 and len(failures) == len(slugs):
+            raise GitHubConnectionError(f'Could not retrieve any of the {len(slugs)} repositories:  {failures[-1]}') from failures[-1]
 
-    def getAbbreviatedIssues(self, repoName: Slug, milestoneTitle: str) -> AbbreviatedGitIssues:
+    def _runOnWorker(self, work: Callable[[Github, Slug, FetchStatistics], Iterator[SlugResult]], slug: Slug, results: Queue, cancelled: Event):
+        """
+        PyGithub's requester swaps its connection on every request, so it is not safe to
+        share across threads;  Each worker thread lazily creates its own client.  Statistics
+        are per worker and travel with the repository's completion message
         """
-        Given a repo name and a milestone title return a simplified list of Git issues
+        github: Optional[Github] = getattr(self._workerClients, 'github', None)
+        if github is None:
+            github = self._createGithub()
+            self._workerClients.github = github
 
-        Args:
-            repoName:       The GitHub repository name
-            milestoneTitle: The milestone title that we filter on
+        statistics: FetchStatistics = FetchStatistics(backend=self._fetchBackend)
+        try:
+            for result in work(github, slug, statistics):
+                if self._offer(results=results, message=_WorkerMessage(slug=slug, result=result), cancelled=cancelled) is False:
+                    return
+            self._offer(results=results, message=_WorkerMessage(slug=slug, statistics=statistics), cancelled=cancelled)
+        except Exception as e:
+            self._offer(results=results, message=_WorkerMessage(slug=slug, error=e), cancelled=cancelled)
+
+    def _offer(self, results: Queue, message: '_WorkerMessage', cancelled: Event) -> bool:
+        """
+        Block while the queue is full, but give up once the consumer went away
 
-        Returns:
-            A list of abbreviated Git issues
+        Returns:  False if the retrieval was cancelled
         """
+        while cancelled.is_set() is False:
+            try:
+                results.put(message, timeout=GithubAdapter.WORKER_POLL_SECONDS)
+                return True
+            except Full:
+                pass
 
-        repo:        Repository      = self._github.get_repo(repoName)
-        openGitIssues: PaginatedList = repo.get_issues(state=GithubAdapter.OPEN_ISSUE_INDICATOR)
+        return False
 
-        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+    def _synchronizeRepositories(self, slugs: Slugs, statistics: FetchStatistics, callback: ProgressMonitor) -> Iterator[Slug]:
+        """
+        Bring the issue cache up to date.  Repositories the cache has never seen, or has not
+        fully listed in a while, get a full listing of their open issues;  The others only ask
+        GitHub for the issues updated since their previous synchronization.  Only the calling
+        thread writes to the cache
 
-        if milestoneTitle == GithubAdapter.ALL_ISSUES_INDICATOR:
-            for openIssue in openGitIssues:
-                simpleGitIssues.append(self._createAbbreviatedGitIssue(slug=repoName, fullGitIssue=openIssue))
+        Returns:  An iterator of the slugs in the order their synchronization completes
+        """
+        issueCache: GitHubIssueCache = cast(GitHubIssueCache, self._issueCache)
+        statistics.backend = GitHubFetchBackend.REST
+
+        now:   datetime                       = datetime.now(timezone.utc)
+        since: Dict[Slug, Optional[datetime]] = {}
+        for slug in slugs:
+            synchronizedAt: Optional[datetime] = issueCache.synchronizedAt(slug)
+            if synchronizedAt is None or now - synchronizedAt > GithubAdapter.FULL_REFRESH_INTERVAL:
+                since[slug] = None
+            else:
+                since[slug] = synchronizedAt
+
+        requestedAt: datetime = now - GithubAdapter.SYNCHRONIZATION_OVERLAP
+
+        def fetch(github: Github, slug: Slug, workerStatistics: FetchStatistics) -> Iterator[CachedIssues]:
+            yield self._fetchRepositoryChanges(github=github, slug=slug, since=since[slug], statistics=workerStatistics)
+
+        def ignore(slug: Slug):
+            pass
+
+        for slug, cachedIssues in self._forEachSlug(slugs=slugs, work=fetch, statistics=statistics, onComplete=ignore, callback=callback):
+            if since[slug] is None:
+                issueCache.replaceIssues(slug=slug, cachedIssues=cachedIssues, synchronizedAt=requestedAt)
+            else:
+                issueCache.applyChanges(slug=slug, changedIssues=cachedIssues, synchronizedAt=requestedAt)
+            callback.advance(message=f'Synchronized {len(cachedIssues)} issues from {slug} ({self._scheduler.describe()})')
+            yield slug
+
+    def _fetchRepositoryChanges(self, github: Github, slug: Slug, since: Optional[datetime], statistics: FetchStatistics) -> CachedIssues:
+        """
+        Without `since` list the open issues;  Otherwise list every issue, open or closed, updated
+        since then, so that the cache can drop the ones that were closed
+        """
+        repo: Repository = github.get_repo(slug, lazy=True)
+
+        if since is None:
+            changedIssues: PaginatedList[Issue] = repo.get_issues(state=GithubAdapter.OPEN_ISSUE_INDICATOR)
         else:
-            for openIssue in openGitIssues:
-                fullGitIssue: Issue = cast(Issue, openIssue)
-                mileStone: Optional[Milestone] = fullGitIssue.milestone
-                if mileStone is not None and mileStone.title == milestoneTitle:
-                    simpleGitIssues.append(self._createAbbreviatedGitIssue(slug=repoName, fullGitIssue=fullGitIssue))
+            changedIssues = repo.get_issues(state=GithubAdapter.ALL_STATES_INDICATOR, since=since)
 
-        return simpleGitIssues
+        cachedIssues: CachedIssues = CachedIssues([])
+        for page in self._iteratePages(listing=changedIssues, description=f'{slug} issues', statistics=statistics):
+            for issue in page:
+                cachedIssues.append(self._createCachedIssue(fullGitIssue=issue))
+                self._accountForIssue(issue=issue, statistics=statistics)
+
+        return cachedIssues
+
+    def _iterateOwnerIssues(self, github: Github, slug: Slug, issueOwner: IssueOwner, statistics: FetchStatistics) -> Iterator[AbbreviatedGitIssues]:
 
-    def getIssuesAssignedToOwner(self, slugs: Slugs, issueOwner: IssueOwner, callback: IssuesCallback) -> AbbreviatedGitIssues:
+        # A lazy repository does not cost a round trip;  We only need its issues URL
+        repo: Repository = github.get_repo(slug, lazy=True)
+        #
+        # Let GitHub do the filtering;  The assignee query parameter matches against the
+        # entire assignees list, so we only page through the owner's issues
+        #
+        openIssues: PaginatedList[Issue] = repo.get_issues(state=GithubAdapter.OPEN_ISSUE_INDICATOR, assignee=issueOwner)
+
+        return self._abbreviatePages(slug=slug, openIssues=openIssues, statistics=statistics, description=f'{slug} issues assigned to {issueOwner}')
+
+    def _abbreviatePages(self, slug: Slug, openIssues: PaginatedList, statistics: FetchStatistics, description: str) -> Iterator[AbbreviatedGitIssues]:
+        """
+        Converts a REST issue listing a page at a time and accounts for what it cost.  Each page
+        is yielded before the next request goes out.  The payload size is measured from the raw
+        JSON;  The public raw_data property would complete (re-fetch) each issue
         """
-        Creates an abbreviated list open issues assigned to the issue owner
+        for issues in self._iteratePages(listing=openIssues, description=description, statistics=statistics):
+            page: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+            for issue in issues:
+                page.append(self._createAbbreviatedGitIssue(slug=slug, fullGitIssue=issue))
+                self._accountForIssue(issue=issue, statistics=statistics)
+            yield page
+
+    def _iteratePages(self, listing: PaginatedList[ListItem], description: str, statistics: Optional[FetchStatistics] = None) -> Iterator[List[ListItem]]:
+        """
+        Walk a REST listing by page number instead of iterating it, so that a failed request
+        is retried on its own;  The pages already received are kept.  A short page is the last
+        one, which saves the empty request that PyGithub's iteration would make
 
         Args:
-            slugs:          GitHub Slugs;  e.g. 'hasii2011/pyut'
-            issueOwner:     The ones we are looking for
-            callback:       Status reporting callback
+            listing:        The PyGithub listing;  Nothing has been requested yet
+            description:    What the listing is, for the log and errors
+            statistics:     When present, counts the requests
 
-        Returns:  A list of issues assigned to the user.
+        Returns:  An iterator of non-empty pages
         """
-        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+        pageNumber: int = 0
+        while True:
+            page: List[ListItem] = self._retryPolicy.call(partial(listing.get_page, pageNumber), description=f'{description}, page {pageNumber + 1}')
+            if statistics is not None:
+                statistics.requestCount += 1
+            if len(page) > 0:
+                yield page
+            if len(page) < GithubAdapter.ISSUES_PER_PAGE:
+                return
+            pageNumber += 1
 
-        for slug in slugs:
-            repo:       Repository           = self._github.get_repo(slug)
-            openIssues: PaginatedList[Issue] = repo.get_issues(state='open')
-
-            issueCount: int = 0
-            for issue in openIssues:
-                potentialIssue: Issue = cast(Issue, issue)
-                # TODO:  Might want to look through the assignees list also
-                if potentialIssue.assignee is None:
-                    pass
-                elif potentialIssue.assignee.login == issueOwner:
-                    simpleGitIssues.append(self._createAbbreviatedGitIssue(slug=slug, fullGitIssue=issue))
-                    issueCount += 1
-
-            msg: str = f'Retrieved {issueCount} issues from {slug}'
-            callback(msg)
+    def _accountForIssue(self, issue: Any, statistics: FetchStatistics):
+        # noinspection PyProtectedMember
+        statistics.bytesTransferred += len(jsonDumps(getattr(issue, '_rawData', {}), default=str))
 
-        return simpleGitIssues
+    def _recordStatistics(self, statistics: FetchStatistics, startTime: float, issueCount: int):
+
+        statistics.elapsedSeconds = perf_counter() - startTime
+        statistics.issueCount     = issueCount
+
+        self._lastFetchStatistics = statistics
+        self.logger.info(f'{statistics}')
+
+    def _logProgress(self, report: ProgressReport):
+        self.logger.debug(report.message)
+
+    def _createGithub(self) -> Github:
+        """
+        urllib3 does not retry anything;  Rate limits are left to the RateLimitScheduler, which holds
+        back every thread instead of just the one that hit it, and transient failures to the retry
+        policy, which retries single pages within a deadline.  Only our own clients are scheduled
+        """
+        github: Github = Github(auth=Token(self._authenticationToken), per_page=GithubAdapter.ISSUES_PER_PAGE, retry=None)
+
+        return RevalidatingHTTPSConnection.attach(github, cache=self._responseCache)
+
+    def _getRepository(self, slug: Slug) -> Repository:
+        """
+        Navigating the UI asks for the same repository over and over;  Only go to
+        GitHub when the memoized handle is missing or stale
+        """
+        repo: Optional[Repository] = self._repositories.get(authenticationToken=self._authenticationToken, slug=slug)
+        if repo is None:
+            repo = self._retryPolicy.call(partial(self._github.get_repo, slug), description=f'Repository {slug}')
+            self._repositories.put(authenticationToken=self._authenticationToken, slug=slug, repository=repo)
+
+        return repo
+
+    def _loadMilestones(self, repo: Repository, repoName: Slug) -> MilestonesByTitle:
+
+        mileStones: PaginatedList     = repo.get_milestones(state=GithubAdapter.OPEN_MILESTONE_INDICATOR)
+        byTitle:    MilestonesByTitle = MilestonesByTitle({})
+
+        for page in self._iteratePages(listing=mileStones, description=f'{repoName} milestones'):
+            for mileStone in page:
+                byTitle[mileStone.title] = mileStone
+
+        self._milestones[repoName] = byTitle
+
+        return byTitle
+
+    def _lookupMilestone(self, repo: Repository, repoName: Slug, milestoneTitle: str) -> Optional[Milestone]:
+        """
+        Resolve the title to a milestone (and therefore its number) from what getMileStoneTitles
+        already loaded;  Only go back to GitHub when we never saw this repository's milestones
+
+        Args:
+            repo:           The repository
+            repoName:       Its name
+            milestoneTitle: The title to resolve
+
+        Returns:  The milestone or None if the repository does not have it
+        """
+        if repoName in self._milestones:
+            mileStones: MilestonesByTitle = self._milestones[repoName]
+        else:
+            mileStones = self._loadMilestones(repo=repo, repoName=repoName)
+
+        return mileStones.get(milestoneTitle, None)
 
     def _createAbbreviatedGitIssue(self, slug: Slug, fullGitIssue: Issue) -> AbbreviatedGitIssue:
 
@@ -200,3 +819,22 @@ class GithubAdapter:
             simpleIssue.labels.append(gitLabel.name)
 
         return simpleIssue
+
+    def _createCachedIssue(self, fullGitIssue: Issue) -> CachedIssue:
+
+        cachedIssue: CachedIssue = CachedIssue()
+
+        cachedIssue.number       = fullGitIssue.number
+        cachedIssue.isOpen       = fullGitIssue.state == GithubAdapter.OPEN_ISSUE_INDICATOR
+        cachedIssue.issueTitle   = fullGitIssue.title
+        cachedIssue.issueHTMLURL = fullGitIssue.html_url
+        cachedIssue.body         = fullGitIssue.body
+        for label in fullGitIssue.labels:
+            gitLabel: Label = cast(Label, label)
+            cachedIssue.labels.append(gitLabel.name)
+        for assignee in fullGitIssue.assignees:
+            cachedIssue.assignees.append(assignee.login)
+        if fullGitIssue.milestone is not None:
+            cachedIssue.milestoneNumber = fullGitIssue.milestone.number
+
+        return cachedIssue
@@ -0,0 +1,81 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
+
+MilestoneTitles = NewType('MilestoneTitles', List[str])
+IssueOwner      = NewType('IssueOwner',      str)
+
+
+def createLabelsFactory() -> List[str]:
+    return []
+
+
+@dataclass
+class AbbreviatedGitIssue:
+
+    slug:         str = ''
+    issueTitle:   str = ''
+    issueHTMLURL: str = ''
+    body:         str = ''
+    labels:       List[str] = field(default_factory=createLabelsFactory)
+
+
+AbbreviatedGitIssues = NewType('AbbreviatedGitIssues', List[AbbreviatedGitIssue])
+
+Slug  = NewType('Slug',  str)
+Slugs = NewType('Slugs', List[Slug])
+
+IssuesBySlug = NewType('IssuesBySlug', Dict[Slug, AbbreviatedGitIssues])
+
+
+def createAssigneesFactory() -> List[str]:
+    return []
+
+
+@dataclass
+class CachedIssue:
+    """
+    What the issue cache keeps for each issue;  Enough to rebuild an AbbreviatedGitIssue
+    and to answer the milestone and assignee questions without going to GitHub
+    """
+    number:          int = 0
+    isOpen:          bool = True
+    issueTitle:      str = ''
+    issueHTMLURL:    str = ''
+    body:            str = ''
+    labels:          List[str] = field(default_factory=createLabelsFactory)
+    assignees:       List[str] = field(default_factory=createAssigneesFactory)
+    milestoneNumber: Optional[int] = None
+
+
+CachedIssues = NewType('CachedIssues', List[CachedIssue])
+
+
+def createFailedSlugsFactory() -> List[str]:
+    return []
+
+
+@dataclass
+class FetchStatistics:
+    """
+    What a single adapter fetch cost;  Lets us compare the REST and GraphQL backends
+    """
+    backend:          GitHubFetchBackend = GitHubFetchBackend.REST
+    requestCount:     int   = 0
+    bytesTransferred: int   = 0
+    elapsedSeconds:   float = 0.0
+    issueCount:       int   = 0
+    failedSlugs:      List[str] = field(default_factory=createFailedSlugsFactory)
+
+    def __str__(self) -> str:
+        return (
+            f'{self.backend}: {self.issueCount} issues in {self.requestCount} requests, '
+            f'{self.bytesTransferred} bytes, {self.elapsedSeconds:.2f} seconds, {len(self.failedSlugs)} repositories failed'
+        )
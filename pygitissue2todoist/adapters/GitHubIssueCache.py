@@ -0,0 +1,216 @@
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from datetime import datetime
+from datetime import timezone
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from sqlite3 import Connection
+from sqlite3 import connect
+
+from threading import RLock
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import CachedIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+
+SCHEMA: str = '''
+    CREATE TABLE IF NOT EXISTS repositories (
+        slug            TEXT PRIMARY KEY,
+        synchronizedAt  TEXT NOT NULL,
+        lastAccessed    REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS issues (
+        slug            TEXT    NOT NULL,
+        number          INTEGER NOT NULL,
+        title           TEXT    NOT NULL,
+        htmlURL         TEXT    NOT NULL,
+        body            TEXT    NOT NULL,
+        labels          TEXT    NOT NULL,
+        assignees       TEXT    NOT NULL,
+        milestoneNumber INTEGER,
+        PRIMARY KEY (slug, number)
+    );
+    CREATE INDEX IF NOT EXISTS issuesByMilestone ON issues (slug, milestoneNumber);
+'''
+
+
+class GitHubIssueCache:
+    """
+    A SQLite store of the open issues of the repositories we have looked at, keyed by slug and
+    issue number.  The adapter fills a repository once and afterward only applies what GitHub
+    reports as updated since the repository's last synchronization;  Closed issues are
+    deleted, everything else is upserted.
+
+    When the cache holds more than `maxIssues` issues the least recently read repositories are
+    evicted as a whole.  The store is safe to use from any thread, but callers are expected
+    to serialize writes for a single repository
+    """
+    DEFAULT_MAX_ISSUES: int = 50000
+
+    def __init__(self, databasePath: Path, maxIssues: int = DEFAULT_MAX_ISSUES):
+        """
+
+        Args:
+            databasePath:   Where the SQLite database lives;  Created when missing
+            maxIssues:      The size cap in issues
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxIssues: int   = maxIssues
+        self._lock:      RLock = RLock()
+
+        self._connection: Connection = connect(databasePath, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    @property
+    def issueCount(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM issues').fetchone()[0]
+
+    def synchronizedAt(self, slug: Slug) -> Optional[datetime]:
+        """
+        Args:
+            slug:   A repository slug
+
+        Returns:  When the repository was last synchronized or None if it is not cached
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT synchronizedAt FROM repositories WHERE slug = ?', (slug,)).fetchone()
+
+        if row is None:
+            return None
+
+        return datetime.fromisoformat(row[0])
+
+    def replaceIssues(self, slug: Slug, cachedIssues: CachedIssues, synchronizedAt: datetime):
+        """
+        Replace everything we know about a repository with a full listing of its open issues
+
+        Args:
+            slug:           A repository slug
+            cachedIssues:   Its open issues
+            synchronizedAt: When the listing was requested
+        """
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM issues WHERE slug = ?', (slug,))
+            self._upsertIssues(slug=slug, cachedIssues=cachedIssues)
+            self._markSynchronized(slug=slug, synchronizedAt=synchronizedAt)
+
+        self._enforceSizeCap(keepSlug=slug)
+
+    def applyChanges(self, slug: Slug, changedIssues: CachedIssues, synchronizedAt: datetime):
+        """
+        Apply an incremental listing;  Issues that are no longer open are deleted
+
+        Args:
+            slug:           A repository slug
+            changedIssues:  Issues updated since the previous synchronization, open or not
+            synchronizedAt: When the listing was requested
+        """
+        openIssues:   CachedIssues = CachedIssues([issue for issue in changedIssues if issue.isOpen is True])
+        closedIssues: List[Tuple[Slug, int]] = [(slug, issue.number) for issue in changedIssues if issue.isOpen is False]
+
+        with self._lock, self._connection:
+            self._upsertIssues(slug=slug, cachedIssues=openIssues)
+            self._connection.executemany('DELETE FROM issues WHERE slug = ? AND number = ?', closedIssues)
+            self._markSynchronized(slug=slug, synchronizedAt=synchronizedAt)
+
+        self._enforceSizeCap(keepSlug=slug)
+
+    def openIssues(self, slug: Slug, milestoneNumber: Optional[int] = None, assignee: Optional[str] = None) -> AbbreviatedGitIssues:
+        """
+        Args:
+            slug:               A repository slug
+            milestoneNumber:    Only issues in this milestone
+            assignee:           Only issues that have this login among their assignees
+
+        Returns:  The cached open issues in issue number order
+        """
+        query:      str   = 'SELECT slug, title, htmlURL, body, labels, assignees FROM issues WHERE slug = ?'
+        parameters: tuple = (slug,)
+        if milestoneNumber is not None:
+            query      = f'{query} AND milestoneNumber = ?'
+            parameters = (slug, milestoneNumber)
+
+        with self._lock:
+            rows = self._connection.execute(f'{query} ORDER BY number', parameters).fetchall()
+            self._connection.execute('UPDATE repositories SET lastAccessed = ? WHERE slug = ?', (self._now().timestamp(), slug))
+            self._connection.commit()
+
+        simpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
+        for rowSlug, title, htmlURL, body, labels, assignees in rows:
+            if assignee is not None and assignee not in jsonLoads(assignees):
+                continue
+            simpleGitIssues.append(AbbreviatedGitIssue(slug=rowSlug, issueTitle=title, issueHTMLURL=htmlURL, body=body, labels=jsonLoads(labels)))
+
+        return simpleGitIssues
+
+    def invalidate(self, slug: Slug):
+        """
+        Forget a repository;  The next retrieval does a full listing
+
+        Args:
+            slug:   A repository slug
+        """
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM issues WHERE slug = ?', (slug,))
+            self._connection.execute('DELETE FROM repositories WHERE slug = ?', (slug,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM issues')
+            self._connection.execute('DELETE FROM repositories')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _upsertIssues(self, slug: Slug, cachedIssues: CachedIssues):
+
+        rows = [
+            (slug, issue.number, issue.issueTitle, issue.issueHTMLURL, issue.body or '',
+             jsonDumps(issue.labels), jsonDumps(issue.assignees), issue.milestoneNumber)
+            for issue in cachedIssues
+        ]
+        self._connection.executemany('INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def _markSynchronized(self, slug: Slug, synchronizedAt: datetime):
+
+        self._connection.execute('INSERT OR REPLACE INTO repositories VALUES (?, ?, ?)',
+                                 (slug, synchronizedAt.isoformat(), self._now().timestamp()))
+
+    def _enforceSizeCap(self, keepSlug: Slug):
+        """
+        Evict whole repositories, least recently read first, until we are under the cap.  Never
+        evict the repository that was just written, even if it alone is over the cap
+        """
+        with self._lock, self._connection:
+            issueCount: int = self._connection.execute('SELECT COUNT(*) FROM issues').fetchone()[0]
+            if issueCount <= self._maxIssues:
+                return
+
+            candidates = self._connection.execute(
+                'SELECT slug FROM repositories WHERE slug != ? ORDER BY lastAccessed', (keepSlug,)
+            ).fetchall()
+            for (slug,) in candidates:
+                evicted: int = self._connection.execute('DELETE FROM issues WHERE slug = ?', (slug,)).rowcount
+                self._connection.execute('DELETE FROM repositories WHERE slug = ?', (slug,))
+                self.logger.info(f'Evicted {evicted} cached issues of {slug}')
+
+                issueCount -= evicted
+                if issueCount <= self._maxIssues:
+                    break
+
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
@@ -0,0 +1,10 @@
+
+from pygitissue2todoist.adapters.GitHubConnectionError import GitHubConnectionError
+
+
+class GitHubRetriesExhaustedError(GitHubConnectionError):
+    """
+    A transient failure outlasted the retry policy's attempts or deadline;  The original
+    failure is the cause
+    """
+    pass
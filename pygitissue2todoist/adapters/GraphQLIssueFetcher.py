@@ -0,0 +1,185 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from functools import partial
+
+from json import dumps as jsonDumps
+
+from github.Requester import Requester
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import FetchStatistics
+from pygitissue2todoist.adapters.GitHubAdapterTypes import IssuesBySlug
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slugs
+from pygitissue2todoist.adapters.RetryPolicy import RetryPolicy
+
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
+#
+# Select exactly what _createAbbreviatedGitIssue needs and nothing else
+#
+ISSUE_FIELDS: str = 'title url body labels(first: 50) { nodes { name } }'
+
+
+@dataclass
+class _PendingRepository:
+    alias:  str
+    slug:   Slug
+    cursor: Optional[str] = None
+
+
+class GraphQLIssueFetcher:
+    """
+    Retrieves open issues for several repositories with a single aliased GraphQL query.
+    Repositories that have more pages stay in the next query with their own cursor, so a
+    batch of repositories costs as many queries as its largest repository has pages.
+
+    Unlike the REST issue listing GraphQL does not return pull requests
+    """
+    REPOSITORIES_PER_QUERY: int = 10
+    ISSUES_PER_PAGE:        int = 100
+
+    def __init__(self, requester: Requester, retryPolicy: Optional[RetryPolicy] = None):
+        """
+
+        Args:
+            requester:      PyGithub's requester;  It knows the endpoint and the credentials
+            retryPolicy:    How a failed query is retried;  Only that query is sent again
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._requester:   Requester   = requester
+        self._retryPolicy: RetryPolicy = RetryPolicy() if retryPolicy is None else retryPolicy
+
+    def fetchOpenIssues(self, slugs: Slugs, callback: ProgressMonitor, statistics: FetchStatistics,
+                        assignee: Optional[str] = None, milestoneNumber: Optional[int] = None) -> IssuesBySlug:
+        """
+        Args:
+            slugs:              The repositories to retrieve
+            callback:           Advanced on the calling thread as each repository completes;  Cancelling it
+                                stops before the next query
+            statistics:         Updated with the number of queries and bytes received
+            assignee:           Only issues assigned to this login
+            milestoneNumber:    Only issues in this milestone
+
+        Returns:  The open issues keyed by slug
+        """
+        issuesBySlug: IssuesBySlug = IssuesBySlug({slug: AbbreviatedGitIssues([]) for slug in slugs})
+
+        for slug, page in self.iterateOpenIssues(slugs=slugs, callback=callback, statistics=statistics, assignee=assignee, milestoneNumber=milestoneNumber):
+            issuesBySlug[slug].extend(page)
+
+        return issuesBySlug
+
+    def iterateOpenIssues(self, slugs: Slugs, callback: ProgressMonitor, statistics: FetchStatistics,
+                          assignee: Optional[str] = None, milestoneNumber: Optional[int] = None) -> Iterator[Tuple[Slug, AbbreviatedGitIssues]]:
+        """
+        The streaming version of fetchOpenIssues;  Yields each repository's page as soon as the
+        query that carried it returns
+
+        Returns:  An iterator of (slug, page) tuples
+        """
+        statistics.backend = GitHubFetchBackend.GraphQL
+
+        issueCounts: Dict[Slug, int]          = {slug: 0 for slug in slugs}
+        pending:     List[_PendingRepository] = [_PendingRepository(alias=f'r{idx}', slug=slug) for idx, slug in enumerate(slugs)]
+
+        while len(pending) > 0 and callback.cancelled is False:
+            batch: List[_PendingRepository] = pending[:GraphQLIssueFetcher.REPOSITORIES_PER_QUERY]
+            pending = pending[GraphQLIssueFetcher.REPOSITORIES_PER_QUERY:]
+
+            query, variables = self._buildQuery(batch=batch, assignee=assignee, milestoneNumber=milestoneNumber)
+
+            _, data = self._retryPolicy.call(partial(self._requester.graphql_query, query=query, variables=variables),
+                                             description=f'Issue query for {", ".join(repository.slug for repository in batch)}')
+
+            statistics.requestCount     += 1
+            statistics.bytesTransferred += len(jsonDumps(data))
+
+            stillPending: List[_PendingRepository] = []
+            for repository in batch:
+                issues: Dict[str, Any] = data['data'][repository.alias]['issues']
+
+                page: AbbreviatedGitIssues = AbbreviatedGitIssues([self._toAbbreviatedGitIssue(slug=repository.slug, node=node) for node in issues['nodes']])
+                if len(page) > 0:
+                    issueCounts[repository.slug] += len(page)
+                    yield repository.slug, page
+
+                pageInfo: Dict[str, Any] = issues['pageInfo']
+                if pageInfo['hasNextPage'] is True:
+                    repository.cursor = pageInfo['endCursor']
+                    stillPending.append(repository)
+                else:
+                    callback.advance(message=f'Retrieved {issueCounts[repository.slug]} issues from {repository.slug}')
+            #
+            # Keep repositories with more pages at the front so that they finish in the next query
+            #
+            pending = stillPending + pending
+
+    def _buildQuery(self, batch: List[_PendingRepository], assignee: Optional[str], milestoneNumber: Optional[int]):
+        """
+        Uses variables for every user supplied value so that nothing needs escaping
+
+        Returns:  A tuple of the query text and its variables
+        """
+        filterBy: str = ''
+        variables: Dict[str, Any] = {}
+        declarations: List[str] = []
+
+        filters: List[str] = []
+        if assignee is not None:
+            declarations.append('$assignee: String')
+            filters.append('assignee: $assignee')
+            variables['assignee'] = assignee
+        if milestoneNumber is not None:
+            declarations.append('$milestoneNumber: String')
+            filters.append('milestoneNumber: $milestoneNumber')
+            variables['milestoneNumber'] = str(milestoneNumber)
+        if len(filters) > 0:
+            filterBy = f', filterBy: {{{", ".join(filters)}}}'
+
+        selections: List[str] = []
+        for repository in batch:
+            alias: str = repository.alias
+            owner, name = repository.slug.split('/')
+
+            declarations.append(f'${alias}Owner: String!, ${alias}Name: String!, ${alias}Cursor: String')
+            variables[f'{alias}Owner']  = owner
+            variables[f'{alias}Name']   = name
+            variables[f'{alias}Cursor'] = repository.cursor
+
+            selections.append(
+                f'{alias}: repository(owner: ${alias}Owner, name: ${alias}Name) {{ '
+                f'issues(first: {GraphQLIssueFetcher.ISSUES_PER_PAGE}, after: ${alias}Cursor, states: OPEN{filterBy}) {{ '
+                f'pageInfo {{ hasNextPage endCursor }} nodes {{ {ISSUE_FIELDS} }} }} }}'
+            )
+
+        query: str = f'query({", ".join(declarations)}) {{ {" ".join(selections)} }}'
+
+        return query, variables
+
+    def _toAbbreviatedGitIssue(self, slug: Slug, node: Dict[str, Any]) -> AbbreviatedGitIssue:
+
+        simpleIssue: AbbreviatedGitIssue = AbbreviatedGitIssue()
+
+        simpleIssue.slug         = str(slug)
+        simpleIssue.issueTitle   = node['title']
+        simpleIssue.issueHTMLURL = node['url']
+        simpleIssue.body         = node['body']
+        for label in node['labels']['nodes']:
+            simpleIssue.labels.append(label['name'])
+
+        return simpleIssue
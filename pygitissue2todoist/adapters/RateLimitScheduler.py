@@ -0,0 +1,230 @@
+
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from dataclasses import dataclass
+
+from threading import Lock
+from threading import local
+
+from time import sleep
+from time import time
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+WaitCallback = Callable[[str], None]
+
+CORE_RESOURCE:    str = 'core'
+SEARCH_RESOURCE:  str = 'search'
+GRAPHQL_RESOURCE: str = 'graphql'
+
+HTTP_FORBIDDEN:         int = 403
+HTTP_TOO_MANY_REQUESTS: int = 429
+
+
+@dataclass
+class RateLimitBudget:
+    """
+    What GitHub last told us about one rate limit resource
+    """
+    resource:   str   = CORE_RESOURCE
+    remaining:  int   = 0
+    limit:      int   = 0
+    resetAt:    float = 0.0     # epoch seconds
+    nextSlotAt: float = 0.0     # epoch seconds;  When the next request may go out
+
+
+class RateLimitScheduler(metaclass=SingletonV3):
+    """
+    Sits under every GitHub request.  It reads the rate limit headers of each response and
+    shares what it learns between all clients and threads of the process:
+
+    * When a resource's budget drops below `LOW_BUDGET_FRACTION` of its limit, requests are
+      spread evenly over the time left until the reset instead of burning the rest at once
+    * When the budget is gone, requests wait for the reset
+    * A secondary rate limit (403 or 429 with Retry-After or a rate limit message) blocks every
+      request until Retry-After has passed;  Without Retry-After we wait `SECONDARY_LIMIT_WAIT`
+      seconds and double it on each consecutive secondary limit
+
+    A thread can ask to hear about waits with `reportingTo`
+    """
+    LOW_BUDGET_FRACTION:  float = 0.1
+    SECONDARY_LIMIT_WAIT: float = 60.0
+    MAXIMUM_WAIT:         float = 3600.0
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._lock:           Lock                       = Lock()
+        self._budgets:        Dict[str, RateLimitBudget] = {}
+        self._blockedUntil:   float                      = 0.0
+        self._secondaryCount: int                        = 0
+        self._reporters:      local                      = local()
+
+    @property
+    def expectedWait(self) -> float:
+        """
+        Returns:  How long, in seconds, a core request issued now would wait
+        """
+        with self._lock:
+            return max(0.0, self._computeStart(resource=CORE_RESOURCE, now=time()) - time())
+
+    def budget(self, resource: str = CORE_RESOURCE) -> Optional[RateLimitBudget]:
+
+        with self._lock:
+            return self._budgets.get(resource, None)
+
+    def describe(self, resource: str = CORE_RESOURCE) -> str:
+        """
+        Returns:  A short human readable summary for progress messages
+        """
+        budget:       Optional[RateLimitBudget] = self.budget(resource=resource)
+        expectedWait: float                     = self.expectedWait
+
+        if budget is None:
+            description: str = 'rate limit not known yet'
+        else:
+            description = f'{budget.remaining} of {budget.limit} requests left'
+        if expectedWait >= 1.0:
+            description = f'{description}, waiting {expectedWait:.0f} seconds'
+
+        return description
+
+    def reset(self):
+        """
+        Forget every budget and block
+        """
+        with self._lock:
+            self._budgets.clear()
+            self._blockedUntil   = 0.0
+            self._secondaryCount = 0
+
+    @contextmanager
+    def reportingTo(self, callback: WaitCallback) -> Iterator[None]:
+        """
+        While active, waits on the current thread are announced to `callback` before sleeping
+        """
+        previous: Optional[WaitCallback] = getattr(self._reporters, 'callback', None)
+        self._reporters.callback = callback
+        try:
+            yield
+        finally:
+            self._reporters.callback = previous
+
+    def resourceFor(self, path: str) -> str:
+        """
+        Guess the resource from the request path;  The response confirms it
+        """
+        if path.startswith('/graphql') or path.startswith('/api/graphql'):
+            return GRAPHQL_RESOURCE
+        if path.startswith('/search/') or path.startswith('/api/v3/search/'):
+            return SEARCH_RESOURCE
+
+        return CORE_RESOURCE
+
+    def acquire(self, resource: str = CORE_RESOURCE):
+        """
+        Block until a request against `resource` may go out and reserve its slot
+        """
+        now: float = time()
+        with self._lock:
+            startAt: float = self._computeStart(resource=resource, now=now)
+            budget:  Optional[RateLimitBudget] = self._budgets.get(resource, None)
+            if budget is not None:
+                budget.nextSlotAt = startAt + self._spacing(budget=budget, now=startAt)
+                # Account for requests in flight;  The response tells us the real number
+                budget.remaining = max(0, budget.remaining - 1)
+
+        waitSeconds: float = min(startAt - now, RateLimitScheduler.MAXIMUM_WAIT)
+        if waitSeconds > 0:
+            self.logger.info(f'Waiting {waitSeconds:.1f} seconds for the {resource} rate limit')
+            reporter: Optional[WaitCallback] = getattr(self._reporters, 'callback', None)
+            if reporter is not None:
+                reporter(f'GitHub rate limit:  {self.describe(resource=resource)}')
+            sleep(waitSeconds)
+
+    def update(self, status: int, headers: Mapping[str, str], body: str = '') -> Optional[float]:
+        """
+        Learn from a response
+
+        Args:
+            status:     The HTTP status
+            headers:    The response headers;  Lookups must be case-insensitive
+            body:       The response body, only needed for 403 and 429
+
+        Returns:  None when the response is final, otherwise the number of seconds every
+        request is held back before this one may be retried
+        """
+        now: float = time()
+        with self._lock:
+            self._updateBudget(headers=headers)
+
+            if status not in (HTTP_FORBIDDEN, HTTP_TOO_MANY_REQUESTS):
+                self._secondaryCount = 0
+                return None
+
+            retryAfter: Optional[str] = headers.get('Retry-After')
+            remaining:  Optional[str] = headers.get('X-RateLimit-Remaining')
+            if retryAfter is not None and retryAfter.isdigit():
+                waitSeconds: float = float(retryAfter)
+            elif remaining == '0' and headers.get('X-RateLimit-Reset', '').isdigit():
+                waitSeconds = float(headers['X-RateLimit-Reset']) - now
+            elif status == HTTP_TOO_MANY_REQUESTS or 'rate limit' in body.lower():
+                waitSeconds = RateLimitScheduler.SECONDARY_LIMIT_WAIT * (2 ** self._secondaryCount)
+                self._secondaryCount += 1
+            else:
+                # A plain permission problem;  Nothing to wait for
+                return None
+
+            waitSeconds = max(1.0, min(waitSeconds, RateLimitScheduler.MAXIMUM_WAIT))
+            self._blockedUntil = max(self._blockedUntil, now + waitSeconds)
+
+        self.logger.warning(f'GitHub rate limited us;  Holding requests for {waitSeconds:.0f} seconds')
+
+        return waitSeconds
+
+    def _computeStart(self, resource: str, now: float) -> float:
+
+        startAt: float = max(now, self._blockedUntil)
+
+        budget: Optional[RateLimitBudget] = self._budgets.get(resource, None)
+        if budget is not None:
+            startAt = max(startAt, budget.nextSlotAt)
+            if budget.remaining <= 0 and budget.resetAt > startAt:
+                startAt = budget.resetAt
+
+        return startAt
+
+    def _spacing(self, budget: RateLimitBudget, now: float) -> float:
+        """
+        Spread what is left evenly until the reset, once we are running low
+        """
+        if budget.limit == 0 or budget.remaining > budget.limit * RateLimitScheduler.LOW_BUDGET_FRACTION:
+            return 0.0
+        if budget.resetAt <= now:
+            return 0.0
+
+        return (budget.resetAt - now) / max(budget.remaining, 1)
+
+    def _updateBudget(self, headers: Mapping[str, str]):
+
+        remaining: Optional[str] = headers.get('X-RateLimit-Remaining')
+        limit:     Optional[str] = headers.get('X-RateLimit-Limit')
+        if remaining is None or limit is None:
+            return
+
+        resource: str = headers.get('X-RateLimit-Resource', CORE_RESOURCE)
+        budget:   RateLimitBudget = self._budgets.setdefault(resource, RateLimitBudget(resource=resource))
+
+        budget.remaining = int(float(remaining))
+        budget.limit     = int(float(limit))
+        budget.resetAt   = float(headers.get('X-RateLimit-Reset', '0'))
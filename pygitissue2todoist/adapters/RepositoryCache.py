@@ -0,0 +1,84 @@
+
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from threading import Lock
+
+from time import monotonic
+
+from github.Repository import Repository
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+
+RepositoryKey = Tuple[str, Slug]
+
+
+class RepositoryCache(metaclass=SingletonV3):
+    """
+    A bounded, least recently used memo of Repository handles with a time to live.  It is a
+    singleton, so that the adapter instances the panels create share it.  Entries are keyed
+    by the authentication token as well as the slug;  A handle is bound to the client that
+    retrieved it and must not outlive a change of credentials
+    """
+    MAX_REPOSITORIES: int   = 64
+    TIME_TO_LIVE:     float = 300.0     # seconds
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._repositories: OrderedDict[RepositoryKey, Tuple[float, Repository]] = OrderedDict()
+        self._lock:         Lock = Lock()
+
+    def get(self, authenticationToken: str, slug: Slug) -> Optional[Repository]:
+        """
+        Args:
+            authenticationToken:    The token the handle was retrieved with
+            slug:                   The repository slug
+
+        Returns:  The memoized handle or None if we do not have a current one
+        """
+        key: RepositoryKey = (authenticationToken, slug)
+        with self._lock:
+            entry: Optional[Tuple[float, Repository]] = self._repositories.get(key, None)
+            if entry is None:
+                return None
+
+            storedAt, repository = entry
+            if monotonic() - storedAt > RepositoryCache.TIME_TO_LIVE:
+                del self._repositories[key]
+                return None
+
+            self._repositories.move_to_end(key)
+
+        return repository
+
+    def put(self, authenticationToken: str, slug: Slug, repository: Repository):
+
+        key: RepositoryKey = (authenticationToken, slug)
+        with self._lock:
+            self._repositories[key] = (monotonic(), repository)
+            self._repositories.move_to_end(key)
+
+            while len(self._repositories) > RepositoryCache.MAX_REPOSITORIES:
+                evictedKey, _ = self._repositories.popitem(last=False)
+                self.logger.debug(f'Evicted repository {evictedKey[1]}')
+
+    def invalidate(self, slug: Slug):
+        """
+        Forget the repository regardless of which credentials retrieved it
+        """
+        with self._lock:
+            for key in [key for key in self._repositories.keys() if key[1] == slug]:
+                del self._repositories[key]
+
+    def clear(self):
+        with self._lock:
+            self._repositories.clear()
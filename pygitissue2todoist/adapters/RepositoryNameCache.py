@@ -0,0 +1,92 @@
+
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from json import JSONDecodeError
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from threading import Lock
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slugs
+
+
+class RepositoryNameCache:
+    """
+    Keeps the last repository listing of each GitHub user in a small JSON file, so that the
+    application can show the repositories at once and refresh them in the background.
+    A damaged file is treated as empty
+    """
+    DEFAULT_TIME_TO_LIVE: timedelta = timedelta(hours=12)
+
+    def __init__(self, cacheFilePath: Path, timeToLive: timedelta = DEFAULT_TIME_TO_LIVE):
+        """
+
+        Args:
+            cacheFilePath:  The JSON file
+            timeToLive:     How long a listing is considered current
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheFilePath: Path      = cacheFilePath
+        self._timeToLive:    timedelta = timeToLive
+        self._lock:          Lock      = Lock()
+
+    def load(self, userName: str) -> Optional[Slugs]:
+        """
+        Args:
+            userName:   The GitHub user
+
+        Returns:  The cached slugs, current or not;  None if we never listed them
+        """
+        entry: Optional[Dict[str, Any]] = self._readEntries().get(userName, None)
+        if entry is None:
+            return None
+
+        return Slugs([Slug(slug) for slug in entry['slugs']])
+
+    def isStale(self, userName: str) -> bool:
+
+        entry: Optional[Dict[str, Any]] = self._readEntries().get(userName, None)
+        if entry is None:
+            return True
+
+        retrievedAt: datetime = datetime.fromisoformat(entry['retrievedAt'])
+
+        return datetime.now(timezone.utc) - retrievedAt > self._timeToLive
+
+    def save(self, userName: str, slugs: Slugs):
+
+        with self._lock:
+            entries: Dict[str, Any] = self._readEntries()
+            entries[userName] = {
+                'retrievedAt': datetime.now(timezone.utc).isoformat(),
+                'slugs':       list(slugs),
+            }
+            #
+            # Write a sibling and swap it in, so that a crash never leaves half a file behind
+            #
+            temporaryPath: Path = self._cacheFilePath.with_suffix('.tmp')
+            temporaryPath.write_text(jsonDumps(entries, indent=2))
+            temporaryPath.replace(self._cacheFilePath)
+
+    def _readEntries(self) -> Dict[str, Any]:
+
+        try:
+            return jsonLoads(self._cacheFilePath.read_text())
+        except FileNotFoundError:
+            return {}
+        except (JSONDecodeError, UnicodeDecodeError) as e:
+            self.logger.warning(f'Ignoring damaged repository cache {self._cacheFilePath}: {e}')
+            return {}
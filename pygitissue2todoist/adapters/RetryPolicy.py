@@ -0,0 +1,125 @@
+
+from typing import Callable
+from typing import TypeVar
+
+from logging import Logger
+from logging import getLogger
+
+from random import uniform
+
+from time import monotonic
+from time import sleep
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+from github import GithubException
+from github import RateLimitExceededException
+
+from pygitissue2todoist.adapters.GitHubRetriesExhaustedError import GitHubRetriesExhaustedError
+
+Result = TypeVar('Result')
+
+
+class RetryPolicy:
+    """
+    Retries a single GitHub call, typically one page of a listing, when it fails for a reason
+    that is likely to go away:  A server error, a dropped connection or a timeout.  Waits grow
+    exponentially from `initialBackoff` up to `maximumBackoff` and are jittered, so that workers
+    that failed together do not retry together.  A call never starts another attempt past its
+    deadline.
+
+    Rate limits are not retried here;  The RateLimitScheduler already waited for them
+    """
+    DEFAULT_MAX_ATTEMPTS:     int   = 4
+    DEFAULT_INITIAL_BACKOFF:  float = 1.0
+    DEFAULT_MAXIMUM_BACKOFF:  float = 30.0
+    DEFAULT_DEADLINE_SECONDS: float = 120.0
+
+    BACKOFF_MULTIPLIER: float = 2.0
+
+    def __init__(self, maxAttempts: int = DEFAULT_MAX_ATTEMPTS,
+                 initialBackoff: float = DEFAULT_INITIAL_BACKOFF,
+                 maximumBackoff: float = DEFAULT_MAXIMUM_BACKOFF,
+                 deadlineSeconds: float = DEFAULT_DEADLINE_SECONDS,
+                 jitter: bool = True):
+        """
+
+        Args:
+            maxAttempts:        How often a call is tried, the first time included
+            initialBackoff:     The wait, in seconds, before the first retry
+            maximumBackoff:     The longest wait between two attempts
+            deadlineSeconds:    How long a call, its retries included, may take
+            jitter:             Wait a random time between zero and the backoff
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxAttempts:     int   = max(1, maxAttempts)
+        self._initialBackoff:  float = initialBackoff
+        self._maximumBackoff:  float = maximumBackoff
+        self._deadlineSeconds: float = deadlineSeconds
+        self._jitter:          bool  = jitter
+
+    @property
+    def maxAttempts(self) -> int:
+        return self._maxAttempts
+
+    @property
+    def deadlineSeconds(self) -> float:
+        return self._deadlineSeconds
+
+    def call(self, operation: Callable[[], Result], description: str) -> Result:
+        """
+        Args:
+            operation:      The call;  It must be safe to repeat
+            description:    What the call does, for the log and the error
+
+        Returns:  The operation's result
+
+        Raises:
+            GitHubRetriesExhaustedError:  When a transient failure outlasts the attempts or the deadline
+        """
+        deadline: float = monotonic() + self._deadlineSeconds
+        attempt:  int   = 1
+        while True:
+            try:
+                return operation()
+            except Exception as e:
+                if self.isTransient(e) is False:
+                    raise
+
+                backoff: float = self.backoff(attempt=attempt)
+                if attempt >= self._maxAttempts or monotonic() + backoff > deadline:
+                    self.logger.error(f'Giving up on {description} after {attempt} attempts: {e}')
+                    raise GitHubRetriesExhaustedError(f'{description}: {e}') from e
+
+                self.logger.warning(f'{description} failed ({e});  Attempt {attempt + 1} in {backoff:.1f} seconds')
+                sleep(backoff)
+                attempt += 1
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Args:
+            attempt:    The attempt that just failed;  The first one is 1
+
+        Returns:  How long to wait before the next attempt
+        """
+        ceiling: float = min(self._maximumBackoff, self._initialBackoff * (RetryPolicy.BACKOFF_MULTIPLIER ** (attempt - 1)))
+        if self._jitter is True:
+            return uniform(0.0, ceiling)
+
+        return ceiling
+
+    def isTransient(self, e: Exception) -> bool:
+        """
+        Server errors, dropped connections and timeouts;  Not authentication, permission,
+        not found, validation or rate limit failures
+        """
+        if isinstance(e, RateLimitExceededException):
+            return False
+        if isinstance(e, GithubException):
+            return e.status >= 500
+        if isinstance(e, (RequestsConnectionError, Timeout)):
+            return True
+
+        return False
@@ -0,0 +1,101 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from github.Requester import RequestsResponse
+
+from pygitissue2todoist.adapters.ConditionalRequestCache import CacheKey
+from pygitissue2todoist.adapters.ConditionalRequestCache import CachedResponse
+from pygitissue2todoist.adapters.ConditionalRequestCache import ConditionalRequestCache
+from pygitissue2todoist.adapters.ScheduledHTTPSConnection import ScheduledHTTPSConnection
+
+HTTP_OK:           int = 200
+HTTP_NOT_MODIFIED: int = 304
+#
+# The cached body is already decoded text;  These would describe the original transfer
+#
+TRANSFER_HEADERS: List[str] = ['content-encoding', 'content-length', 'transfer-encoding']
+
+
+class RevalidatingHTTPSConnection(ScheduledHTTPSConnection):
+    """
+    A PyGithub connection that turns every GET into a conditional request when we have seen
+    the URL before.  On a 304 it replays the stored body as a 200, so PyGithub and the adapter
+    do not know the difference.  The fresh response headers win, so PyGithub's rate limit
+    bookkeeping stays accurate.  Conditional requests are still rate limit scheduled
+    """
+    clsLogger: Logger = getLogger(__name__)
+
+    def __init__(self, host: str, port: Optional[int] = None, cache: Optional[ConditionalRequestCache] = None, **kwargs: Any):
+        """
+
+        Args:
+            host:       The GitHub host
+            port:       Its port
+            cache:      Where the validators and bodies are kept;  Without one the requests are
+                        only scheduled
+            **kwargs:   PyGithub's connection options
+        """
+        super().__init__(host, port, **kwargs)
+
+        self._cache: Optional[ConditionalRequestCache] = cache
+
+    def getresponse(self) -> RequestsResponse:
+
+        cache: Optional[ConditionalRequestCache] = self._cache
+        if cache is None or self.verb.upper() != 'GET' or self.stream is True:
+            return super().getresponse()
+
+        url:      str      = f'{self.protocol}://{self.host}:{self.port}{self.url}'
+        cacheKey: CacheKey = cache.createKey(url=url, credentials=f'{self.headers.get("Authorization", "")} {self.headers.get("Accept", "")}')
+
+        cachedResponse: Optional[CachedResponse] = cache.lookup(cacheKey)
+        if cachedResponse is not None:
+            # Do not touch the caller's dictionary;  PyGithub reuses it for redirects
+            self.headers = dict(self.headers)
+            if cachedResponse.etag is not None:
+                self.headers['If-None-Match'] = cachedResponse.etag
+            elif cachedResponse.lastModified is not None:
+                self.headers['If-Modified-Since'] = cachedResponse.lastModified
+
+        response: RequestsResponse = super().getresponse()
+
+        if response.status == HTTP_NOT_MODIFIED and cachedResponse is not None:
+            self.clsLogger.debug(f'Not modified: {self.url}')
+            cache.touch(cacheKey)
+            return self._replay(url=url, cachedResponse=cachedResponse, freshHeaders=response.headers)
+
+        if response.status == HTTP_OK:
+            etag:         Optional[str] = response.headers.get('ETag')
+            lastModified: Optional[str] = response.headers.get('Last-Modified')
+            if etag is not None or lastModified is not None:
+                cache.store(cacheKey, CachedResponse(etag=etag, lastModified=lastModified,
+                                                     headers=self._storableHeaders(response.headers),
+                                                     body=response.read())
+                            )
+        return response
+
+    def _replay(self, url: str, cachedResponse: CachedResponse, freshHeaders: CaseInsensitiveDict) -> RequestsResponse:
+
+        headers: CaseInsensitiveDict = CaseInsensitiveDict(cachedResponse.headers)
+        headers.update(self._storableHeaders(freshHeaders))
+
+        replayed: Response = Response()
+        replayed.status_code = HTTP_OK
+        replayed.headers     = headers
+        replayed.url         = url
+        replayed.encoding    = 'utf-8'
+        replayed._content    = cachedResponse.body.encode('utf-8')
+
+        return RequestsResponse(replayed)
+
+    def _storableHeaders(self, headers: CaseInsensitiveDict) -> Dict[str, str]:
+        return {name: value for name, value in headers.items() if name.lower() not in TRANSFER_HEADERS}
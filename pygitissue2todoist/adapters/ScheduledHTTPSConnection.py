@@ -0,0 +1,124 @@
+
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from logging import Logger
+from logging import getLogger
+
+from threading import local
+
+from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.adapters import DEFAULT_RETRIES
+from requests.adapters import HTTPAdapter
+
+from urllib3 import Retry
+
+from github import Github
+from github.Requester import HTTPSRequestsConnectionClass
+from github.Requester import Requester
+from github.Requester import RequestsResponse
+
+from pygitissue2todoist.adapters.RateLimitScheduler import RateLimitScheduler
+
+SessionKey = Tuple[str, str, int]
+
+
+class ScheduledHTTPSConnection(HTTPSRequestsConnectionClass):
+    """
+    A PyGithub connection that asks the RateLimitScheduler for a slot before every request,
+    reports every response to it, and re-sends requests that hit a secondary rate limit once
+    the scheduler lets them through again.
+
+    It is attached to single `Github` clients, so other clients in the process keep their
+    own connections.  PyGithub creates a connection object per request;  To keep TCP and TLS
+    connections alive the instances on one thread share a requests Session per host.  A
+    Session is not promised to be thread safe, so threads never share one
+    """
+    MAX_RATE_LIMIT_RETRIES: int = 3
+
+    _threadSessions: local = local()
+
+    clsLogger: Logger = getLogger(__name__)
+
+    @classmethod
+    def attach(cls, github: Github, **connectionArguments: Any) -> Github:
+        """
+        Route the client's requests through this connection class;  The client's requester
+        calls whatever it holds as its connection class with the host, port and options
+
+        Args:
+            github:                 A client;  Typically just created
+            connectionArguments:    Passed to every connection, on top of PyGithub's
+
+        Returns:  The client
+        """
+        requester: Requester = github.requester
+
+        def createConnection(host: str, port: Optional[int] = None, **kwargs: Any) -> ScheduledHTTPSConnection:
+            return cls(host, port, **kwargs, **connectionArguments)
+
+        # noinspection PyProtectedMember
+        requester._Requester__connectionClass = createConnection     # type: ignore
+
+        return github
+
+    def __init__(self, host: str, port: Optional[int] = None, strict: bool = False, timeout: Optional[int] = None,
+                 retry: Optional[Union[int, Retry]] = None, pool_size: Optional[int] = None, **kwargs: Any):
+        """
+        Mirrors the base class, but takes the thread's Session instead of building one
+        """
+        self.port:      int               = port if port else 443
+        self.host:      str               = host
+        self.protocol:  str               = 'https'
+        self.timeout:   Optional[int]     = timeout
+        self.verify:    Any               = kwargs.get('verify', True)
+        self.retry:     Union[int, Retry] = DEFAULT_RETRIES if retry is None else retry
+        self.pool_size: int               = DEFAULT_POOLSIZE if pool_size is None else pool_size
+        self.session:   Session           = self._threadSession()
+
+    def getresponse(self) -> RequestsResponse:
+
+        scheduler: RateLimitScheduler = RateLimitScheduler()
+        resource:  str                = scheduler.resourceFor(self.url)
+
+        attempt: int = 0
+        while True:
+            scheduler.acquire(resource=resource)
+
+            response: RequestsResponse = super().getresponse()
+
+            body:        str             = '' if self.stream is True else response.read()
+            waitSeconds: Optional[float] = scheduler.update(status=response.status, headers=response.headers, body=body)
+            if waitSeconds is None or attempt == ScheduledHTTPSConnection.MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            attempt += 1
+            self.clsLogger.info(f'Rate limited on {self.url};  Retry {attempt} after {waitSeconds:.0f} seconds')
+
+    def close(self):
+        """
+        The session belongs to the thread;  Keep its connections alive for the next request.
+        They close when the thread ends
+        """
+        pass
+
+    def _threadSession(self) -> Session:
+
+        sessions: Optional[Dict[SessionKey, Session]] = getattr(ScheduledHTTPSConnection._threadSessions, 'sessions', None)
+        if sessions is None:
+            sessions = {}
+            ScheduledHTTPSConnection._threadSessions.sessions = sessions
+
+        sessionKey: SessionKey = (self.protocol, self.host, self.port)
+        if sessionKey not in sessions:
+            session: Session = Session()
+            # Keeps requests from falling back to the .netrc file
+            session.auth = Requester.noopAuth
+            session.mount('https://', HTTPAdapter(max_retries=self.retry, pool_connections=self.pool_size, pool_maxsize=self.pool_size))
+            sessions[sessionKey] = session
+
+        return sessions[sessionKey]
@@ -0,0 +1,232 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from queue import Queue
+
+from threading import Event
+from threading import Lock
+from threading import Thread
+
+from pygitissue2todoist.general.CoalescingProgressSink import CoalescingProgressSink
+from pygitissue2todoist.general.ProgressMonitor import ProgressListener
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
+#
+# Runs a callable on the UI thread, later;  wx.CallAfter in the application
+#
+Dispatcher     = Callable[..., None]
+ResultCallback = Callable[[Any], None]
+ErrorCallback  = Callable[[Exception], None]
+
+
+class JobContext:
+    """
+    What a job's work function sees.  It runs on the worker thread;  Everything it hands to
+    `deliver` is run on the UI thread, in the order it was handed over.  What it reports through
+    `monitor` is coalesced by the job's progress sink first
+    """
+    def __init__(self, job: 'BackgroundJob', executor: 'BackgroundJobExecutor'):
+
+        self._job:      BackgroundJob         = job
+        self._executor: BackgroundJobExecutor = executor
+
+        onProgress: Optional[ProgressListener] = job.onProgress
+        if onProgress is not None:
+            job.progressSink.onReport = lambda report: executor.dispatch(job, onProgress, report)
+            job.monitor.listener      = job.progressSink
+
+    @property
+    def monitor(self) -> ProgressMonitor:
+        """
+        Hand this to the adapter or the strategy;  Its reports go to the job's progress callback
+        """
+        return self._job.monitor
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Long-running work should check this between network round trips and stop early
+        """
+        return self._job.monitor.cancelled
+
+    def deliver(self, callback: Callable, *args):
+        """
+        Hand a partial result, like a page of issues, to the UI thread
+
+        Args:
+            callback:   Runs on the UI thread unless the job was cancelled by then
+            *args:      The callback's arguments
+        """
+        self._executor.dispatch(self._job, callback, *args)
+
+
+JobWork = Callable[[JobContext], Any]
+
+
+class BackgroundJob:
+    """
+    A unit of network work.  The work runs on the executor's worker thread;  Its result
+    or exception is handed to `onResult` or `onError` on the UI thread
+    """
+    def __init__(self, name: str, work: JobWork,
+                 onResult:   Optional[ResultCallback] = None,
+                 onError:    Optional[ErrorCallback] = None,
+                 onProgress: Optional[ProgressListener] = None):
+        """
+
+        Args:
+            name:       For the log
+            work:       Runs on the worker thread;  Returns the job's result
+            onResult:   Receives the result
+            onError:    Receives any exception the work raised
+            onProgress: Receives the work's progress reports, at most a few per second;  Without
+                        it the work's reports cost nothing
+        """
+        self.name:       str                        = name
+        self.work:       JobWork                    = work
+        self.onResult:   Optional[ResultCallback]   = onResult
+        self.onError:    Optional[ErrorCallback]    = onError
+        self.onProgress: Optional[ProgressListener] = onProgress
+
+        self.monitor:      ProgressMonitor        = ProgressMonitor()
+        self.progressSink: CoalescingProgressSink = CoalescingProgressSink()
+
+        self._cancelled: Event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def progressLog(self) -> List[str]:
+        """
+        Returns:  The latest progress messages of the work, including the ones the UI never showed
+        """
+        return self.progressSink.log
+
+    def cancel(self):
+        """
+        A job that has not started is skipped;  A running one is asked to stop.  Either way
+        nothing more of it reaches the UI thread.  To stop the work but still hear how it ended,
+        cancel its `monitor` instead
+        """
+        self._cancelled.set()
+        self.monitor.cancel()
+
+
+class BackgroundJobExecutor:
+    """
+    Keeps network round trips off the UI thread.  Jobs run one after the other on a single
+    daemon worker thread, so the UI stays responsive and the user can queue the next request
+    while the current one is still running.  Results, errors and progress come back through
+    the dispatcher;  Nothing from a cancelled job does
+    """
+    def __init__(self, dispatcher: Dispatcher, name: str = 'BackgroundJobs'):
+        """
+
+        Args:
+            dispatcher: Runs a callable with its arguments on the UI thread;  Must be thread safe
+            name:       The worker thread name
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._dispatcher: Dispatcher = dispatcher
+        self._name:       str        = name
+
+        self._jobs:    Queue            = Queue()
+        self._lock:    Lock             = Lock()
+        self._worker:  Optional[Thread] = None
+        self._pending: int              = 0
+
+    @property
+    def pendingJobs(self) -> int:
+        """
+        Returns:  The jobs queued or running
+        """
+        with self._lock:
+            return self._pending
+
+    def submit(self, job: BackgroundJob) -> BackgroundJob:
+        """
+        Queue a job;  The worker thread starts with the first one
+
+        Args:
+            job:    The job to run
+
+        Returns:  The job, so that the caller can cancel it later
+        """
+        with self._lock:
+            self._pending += 1
+            if self._worker is None:
+                self._worker = Thread(target=self._run, name=self._name, daemon=True)
+                self._worker.start()
+
+        self._jobs.put(job)
+
+        return job
+
+    def shutdown(self):
+        """
+        Cancel the queued jobs and stop the worker once the running job returns
+        """
+        with self._lock:
+            worker: Optional[Thread] = self._worker
+            self._worker = None
+
+        if worker is None:
+            return
+        while self._jobs.empty() is False:
+            cast(BackgroundJob, self._jobs.get_nowait()).cancel()
+            with self._lock:
+                self._pending -= 1
+        self._jobs.put(None)
+        worker.join()
+
+    def dispatch(self, job: BackgroundJob, callback: Callable, *args):
+        """
+        Run a callback for a job on the UI thread, unless the job is cancelled by then
+        """
+        self._dispatcher(self._deliver, job, callback, args)
+
+    def _deliver(self, job: BackgroundJob, callback: Callable, args: tuple):
+
+        if job.cancelled is False:
+            callback(*args)
+
+    def _run(self):
+
+        while True:
+            job: Optional[BackgroundJob] = self._jobs.get()
+            if job is None:
+                break
+            try:
+                self._runJob(job=job)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+    def _runJob(self, job: BackgroundJob):
+
+        if job.cancelled is True:
+            self.logger.debug(f'Skipping cancelled job: {job.name}')
+            return
+
+        self.logger.debug(f'Running job: {job.name}')
+        try:
+            result: Any = job.work(JobContext(job=job, executor=self))
+        except Exception as e:
+            job.progressSink.flush()
+            self.logger.warning(f'Job {job.name} failed: {e}')
+            if job.onError is not None:
+                self.dispatch(job, job.onError, e)
+        else:
+            job.progressSink.flush()
+            if job.onResult is not None:
+                self.dispatch(job, job.onResult, result)
@@ -0,0 +1,158 @@
+
+from typing import Callable
+from typing import Deque
+from typing import List
+from typing import Optional
+
+from collections import deque
+
+from threading import Lock
+from threading import Timer
+
+from time import monotonic
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressListener
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+#
+# Ten dialog updates a second look continuous
+#
+DEFAULT_REFRESH_INTERVAL: float = 0.1
+#
+# Far more than a run reports;  Keeps a runaway job from filling memory
+#
+DEFAULT_LOG_LIMIT: int = 10000
+
+
+class CoalescingProgressSink:
+    """
+    Sits between a `ProgressMonitor` and the UI.  The strategies report several messages per
+    task;  Handing every one of them to a progress dialog keeps the event loop busy with
+    repaints.  The sink passes on at most one report per refresh interval, plus the first
+    report of every phase.  It holds back the latest of the others;  A timer passes that one
+    on when the interval ends, so a message before a long wait, like a rate limit pause, is
+    not hidden for the whole wait.
+
+    Every message goes to the log, so the latest ones are kept for later viewing.  Without a
+    UI the sink only logs.  Safe to call from any thread;  `onReport` runs on the reporting
+    thread or on the timer's thread, outside the sink's lock, so it should hand the report to
+    the UI thread
+    """
+    def __init__(self, onReport: Optional[ProgressListener] = None, refreshInterval: float = DEFAULT_REFRESH_INTERVAL,
+                 clock: Callable[[], float] = monotonic, logLimit: int = DEFAULT_LOG_LIMIT):
+        """
+
+        Args:
+            onReport:           Receives the reports that are passed on
+            refreshInterval:    The least number of seconds between two reports that are passed on
+            clock:              Seconds from an arbitrary start;  The timer always waits real seconds
+            logLimit:           The number of messages the log keeps;  The oldest ones go first
+        """
+        self.onReport: Optional[ProgressListener] = onReport
+
+        self._refreshInterval: float               = refreshInterval
+        self._clock:           Callable[[], float] = clock
+        self._lock:            Lock                = Lock()
+
+        self._log:        Deque[str]               = deque(maxlen=logLimit)
+        self._heldBack:   Optional[ProgressReport] = None
+        self._lastPhase:  Optional[str]            = None
+        self._lastPassed: float                    = 0.0
+        self._timer:      Optional[Timer]          = None
+
+        self._pickedSequence: int = 0       # Of the last report picked to be passed on
+        self._passedSequence: int = 0       # Of the last report handed to `onReport`
+
+    @property
+    def log(self) -> List[str]:
+        """
+        Returns:  The latest messages reported so far, in order
+        """
+        with self._lock:
+            return list(self._log)
+
+    def __call__(self, report: ProgressReport):
+        """
+        A `ProgressListener`
+        """
+        with self._lock:
+            if report.message != '':
+                self._log.append(report.message)
+            if self.onReport is None:
+                return
+
+            now: float = self._clock()
+            if report.phase == self._lastPhase and now - self._lastPassed < self._refreshInterval:
+                self._heldBack = report
+                if self._timer is None:
+                    self._startTimer(delay=self._refreshInterval - (now - self._lastPassed))
+                return
+
+            self._heldBack   = None
+            self._lastPhase  = report.phase
+            self._lastPassed = now
+            self._cancelTimer()
+
+            sequence: int = self._pick()
+
+        self._pass(report=report, sequence=sequence)
+
+    def flush(self):
+        """
+        Pass on the report that is being held back, if any;  Call it when the work is done so
+        that the UI shows how it ended.  Also stops the timer
+        """
+        with self._lock:
+            self._cancelTimer()
+
+            report: Optional[ProgressReport] = self._heldBack
+            self._heldBack = None
+            if report is None or self.onReport is None:
+                return
+
+            self._lastPassed = self._clock()
+            sequence: int = self._pick()
+
+        self._pass(report=report, sequence=sequence)
+
+    def _pick(self) -> int:
+        """
+        Call with the lock held
+
+        Returns:  The sequence number of the report being picked
+        """
+        self._pickedSequence += 1
+        return self._pickedSequence
+
+    def _pass(self, report: ProgressReport, sequence: int):
+        """
+        Outside the lock, so that `onReport` may wait for the UI or report back into the sink.
+        The sequence number keeps the order instead:  A report picked before one that was
+        already passed on is dropped
+
+        Args:
+            report:     The picked report
+            sequence:   Its sequence number
+        """
+        with self._lock:
+            if sequence < self._passedSequence:
+                return
+            self._passedSequence = sequence
+            onReport: Optional[ProgressListener] = self.onReport
+
+        if onReport is not None:
+            onReport(report)
+
+    def _startTimer(self, delay: float):
+
+        self._timer = Timer(max(0.0, delay), self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancelTimer(self):
+        """
+        Cancelling from the timer's own thread is harmless
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
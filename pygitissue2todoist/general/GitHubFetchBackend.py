@@ -0,0 +1,15 @@
+
+from enum import Enum
+
+
+class GitHubFetchBackend(Enum):
+    """
+    How GithubAdapter retrieves issues.  The REST backend goes through PyGithub and
+    downloads full issue payloads;  The GraphQL backend batches several repositories
+    into a single query and only selects the fields we actually use
+    """
+    REST    = 'REST'
+    GraphQL = 'GraphQL'
+
+    def __str__(self):
+        return str(self.name)
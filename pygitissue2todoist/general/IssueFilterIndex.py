@@ -0,0 +1,115 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from bisect import bisect_left
+from bisect import insort
+
+from re import Pattern
+from re import compile as regExCompile
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+
+TOKEN_PATTERN: Pattern = regExCompile(r'\w+')
+#
+# A one or two letter prefix ranges over a large part of the vocabulary;  Searching for it on
+# every keystroke costs more than it narrows down
+#
+MINIMUM_PREFIX_LENGTH: int = 3
+
+IssueIndices = NewType('IssueIndices', List[int])
+Postings     = NewType('Postings',     Dict[str, List[int]])
+
+
+class IssueFilterIndex:
+    """
+    An inverted index over the issues a selector shows.  Each issue is indexed by the words
+    of its title, repository slug and label names;  An issue's position is the order in which
+    it was added, so the index grows page by page as issues stream in.
+
+    A query matches the issues that have, for every query word, a word starting with it;  Case
+    does not matter, in any script.  Query words shorter than `MINIMUM_PREFIX_LENGTH` are
+    ignored until the user types more.  The vocabulary is kept sorted so that the words with a
+    given prefix are one range of it.  Each search starts from the postings again;  It does not
+    reuse the matches of the previous query
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._postings:   Postings  = Postings({})
+        self._vocabulary: List[str] = []
+        self._issueCount: int       = 0
+
+    def __len__(self) -> int:
+        return self._issueCount
+
+    def add(self, issues: AbbreviatedGitIssues):
+        """
+        Index the next page of issues
+
+        Args:
+            issues: Issues in the order the selector shows them
+        """
+        for issue in issues:
+            for token in self._issueTokens(issue=issue):
+                postings: List[int] = self._postings.get(token, [])
+                if len(postings) == 0:
+                    self._postings[token] = postings
+                    insort(self._vocabulary, token)
+                postings.append(self._issueCount)
+
+            self._issueCount += 1
+
+    def clear(self):
+
+        self._postings   = Postings({})
+        self._vocabulary = []
+        self._issueCount = 0
+
+    def search(self, query: str) -> IssueIndices:
+        """
+        Args:
+            query:  What the user typed;  Case does not matter
+
+        Returns:  The positions of the matching issues in ascending order;  All of them when
+        the query has no words long enough to search for
+        """
+        queryTokens: List[str] = [token for token in TOKEN_PATTERN.findall(query.casefold()) if len(token) >= MINIMUM_PREFIX_LENGTH]
+        if len(queryTokens) == 0:
+            return IssueIndices(list(range(self._issueCount)))
+        #
+        # Start with the rarest word, so that the intersections stay small
+        #
+        candidates: List[Set[int]] = sorted((self._prefixMatches(prefix=queryToken) for queryToken in set(queryTokens)), key=len)
+
+        matches: Set[int] = candidates[0]
+        for candidate in candidates[1:]:
+            if len(matches) == 0:
+                break
+            matches = matches & candidate
+
+        return IssueIndices(sorted(matches))
+
+    def _prefixMatches(self, prefix: str) -> Set[int]:
+
+        matches: Set[int] = set()
+
+        idx: int = bisect_left(self._vocabulary, prefix)
+        while idx < len(self._vocabulary) and self._vocabulary[idx].startswith(prefix):
+            matches.update(self._postings[self._vocabulary[idx]])
+            idx += 1
+
+        return matches
+
+    def _issueTokens(self, issue: AbbreviatedGitIssue) -> Set[str]:
+
+        text: str = ' '.join([issue.issueTitle, issue.slug] + issue.labels)
+
+        return set(TOKEN_PATTERN.findall(text.casefold()))
@@ -13,7 +13,9 @@ from codeallybasic.DynamicConfiguration import ValueDescription
 from codeallybasic.DynamicConfiguration import ValueDescriptions
 from codeallybasic.SecureConversions import SecureConversions
 
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
 from pygitissue2todoist.general.GitHubURLOption import GitHubURLOption
+from pygitissue2todoist.general.TodoistCreationMode import TodoistCreationMode
 
 from pygitissue2todoist.general.Resources import Resources
 from pygitissue2todoist.strategy.TodoistTaskCreationStrategy import TodoistTaskCreationStrategy
@@ -27,6 +29,13 @@ DEFAULT_PROGRESS_DIALOG_POSITION: Position = Position(10, 10).__str__()
 
 DEFAULT_TASK_CREATION_STRATEGY: str = TodoistTaskCreationStrategy.PROJECT_BY_REPOSITORY.value
 DEFAULT_TODOIST_PROJECT_NAME:   str = 'Development'
+DEFAULT_TODOIST_MAX_CONCURRENCY: str = '4'
+
+DEFAULT_GITHUB_MAX_CONCURRENCY:    str = '4'
+DEFAULT_GITHUB_ISSUE_CACHE_SIZE:   str = '50000'
+DEFAULT_GITHUB_REPOSITORY_HOURS:   str = '12'
+DEFAULT_GITHUB_RETRY_ATTEMPTS:     str = '4'
+DEFAULT_GITHUB_RETRY_DEADLINE:     str = '120'
 
 
 SECTION_MAIN: ValueDescriptions = ValueDescriptions(
@@ -42,6 +51,14 @@ SECTION_GITHUB: ValueDescriptions = ValueDescriptions(
         KeyName('gitHubAPIToken'):  ValueDescription(defaultValue='Put Your GitHub API Token Here'),
         KeyName('gitHubUserName'):  ValueDescription(defaultValue='Put Your GitHub User Name Here'),
         KeyName('gitHubURLOption'): ValueDescription(defaultValue=GitHubURLOption.HyperLinkedTaskName.value, deserializer=GitHubURLOption, enumUseValue=True),
+        KeyName('gitHubMaxConcurrency'): ValueDescription(defaultValue=DEFAULT_GITHUB_MAX_CONCURRENCY, deserializer=int),
+        KeyName('gitHubFetchBackend'):   ValueDescription(defaultValue=GitHubFetchBackend.REST.value, deserializer=GitHubFetchBackend, enumUseValue=True),
+        KeyName('gitHubIssueCache'):     ValueDescription(defaultValue='False', deserializer=SecureConversions.secureBoolean),
+        KeyName('gitHubIssueCacheSize'): ValueDescription(defaultValue=DEFAULT_GITHUB_ISSUE_CACHE_SIZE, deserializer=int),
+        KeyName('gitHubConditionalRequests'): ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
+        KeyName('gitHubRepositoryCacheHours'): ValueDescription(defaultValue=DEFAULT_GITHUB_REPOSITORY_HOURS, deserializer=int),
+        KeyName('gitHubRetryAttempts'):        ValueDescription(defaultValue=DEFAULT_GITHUB_RETRY_ATTEMPTS, deserializer=int),
+        KeyName('gitHubRetryDeadlineSeconds'): ValueDescription(defaultValue=DEFAULT_GITHUB_RETRY_DEADLINE, deserializer=int),
     }
 )
 
@@ -52,6 +69,10 @@ TODOIST_SECTION: ValueDescriptions = ValueDescriptions(
         KeyName('singleTodoistProject'): ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
         KeyName('todoistProjectName'):   ValueDescription(defaultValue=DEFAULT_TODOIST_PROJECT_NAME),
         KeyName('taskCreationStrategy'): ValueDescription(defaultValue=DEFAULT_TASK_CREATION_STRATEGY, deserializer=TodoistTaskCreationStrategy, enumUseValue=True),
+        KeyName('todoistCreationMode'):   ValueDescription(defaultValue=TodoistCreationMode.Batched.value, deserializer=TodoistCreationMode, enumUseValue=True),
+        KeyName('todoistMaxConcurrency'): ValueDescription(defaultValue=DEFAULT_TODOIST_MAX_CONCURRENCY, deserializer=int),
+        KeyName('todoistLocalReplica'):   ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
+        KeyName('todoistIssueMap'):       ValueDescription(defaultValue='True', deserializer=SecureConversions.secureBoolean),
     }
 )
 
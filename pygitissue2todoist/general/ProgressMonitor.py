@@ -0,0 +1,193 @@
+
+from typing import Callable
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from threading import Event
+from threading import Lock
+
+from time import monotonic
+
+from pygitissue2todoist.general.exceptions.OperationCancelledError import OperationCancelledError
+
+#
+# Total for a phase whose size is not known up front
+#
+UNKNOWN_TOTAL: int = 0
+
+
+@dataclass
+class ProgressReport:
+    """
+    A snapshot of a long-running operation
+    """
+    phase:          str   = ''
+    message:        str   = ''
+    completed:      int   = 0
+    total:          int   = UNKNOWN_TOTAL
+    itemsPerSecond: float = 0.0
+    elapsedSeconds: float = 0.0
+    cancelled:      bool  = False
+
+    @property
+    def isDeterminate(self) -> bool:
+        return self.total > 0
+
+    @property
+    def percent(self) -> int:
+        """
+        Returns:  0 to 100;  Always 0 when the total is unknown
+        """
+        if self.isDeterminate is False:
+            return 0
+
+        return min(100, (100 * self.completed) // self.total)
+
+    @property
+    def etaSeconds(self) -> Optional[float]:
+        """
+        Returns:  The time the rest of the phase should take at the current rate;  None when
+        that cannot be told yet
+        """
+        if self.isDeterminate is False or self.itemsPerSecond <= 0.0:
+            return None
+
+        return max(0, self.total - self.completed) / self.itemsPerSecond
+
+    def describe(self) -> str:
+        """
+        Returns:  The report as one line for a progress dialog
+        """
+        if self.isDeterminate is False:
+            return self.message
+
+        description: str = f'{self.phase} {self.completed}/{self.total}'
+        if self.itemsPerSecond > 0.0:
+            description = f'{description}  {self.itemsPerSecond:.1f}/s'
+        etaSeconds: Optional[float] = self.etaSeconds
+        if etaSeconds is not None and self.completed < self.total:
+            description = f'{description}  about {int(etaSeconds) + 1}s left'
+        if self.message != '':
+            description = f'{description}\n{self.message}'
+
+        return description
+
+
+ProgressListener = Callable[[ProgressReport], None]
+
+
+class ProgressMonitor:
+    """
+    How the GitHub adapter and the Todoist strategies report their progress and learn that the
+    user cancelled.  The work divides itself into phases;  A phase has a total, when it is known,
+    and the work advances it as items complete.  Every change reaches the listener as a
+    `ProgressReport` that also carries the phase's rate.
+
+    Calling the monitor with a message only reports a status message.  Cancelling is
+    cooperative:  The work checks `cancelled` between requests, lets the ones in flight finish
+    and skips the rest.  Safe to use from any thread;  The listener runs on the reporting thread
+    """
+    def __init__(self, listener: Optional[ProgressListener] = None, clock: Callable[[], float] = monotonic):
+        """
+
+        Args:
+            listener:   Receives every report;  Without one the monitor only tracks the counts
+            clock:      Seconds from an arbitrary start
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self.listener: Optional[ProgressListener] = listener
+
+        self._clock:     Callable[[], float] = clock
+        self._lock:      Lock                = Lock()
+        self._cancelled: Event               = Event()
+
+        self._phase:      str   = ''
+        self._total:      int   = UNKNOWN_TOTAL
+        self._completed:  int   = 0
+        self._phaseStart: float = clock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Ask the work to stop once the requests in flight return
+        """
+        if self.cancelled is False:
+            self.logger.info(f'Cancelled during {self._phase}')
+        self._cancelled.set()
+
+    def raiseIfCancelled(self):
+        """
+        Raises:
+            OperationCancelledError:  When the user cancelled
+        """
+        if self.cancelled is True:
+            raise OperationCancelledError(f'Cancelled during {self._phase}')
+
+    def startPhase(self, phase: str, total: int = UNKNOWN_TOTAL, message: str = ''):
+        """
+        Args:
+            phase:      What the work does now
+            total:      How many items the phase has;  Omit when unknown
+            message:    An optional status message
+        """
+        with self._lock:
+            self._phase      = phase
+            self._total      = total
+            self._completed  = 0
+            self._phaseStart = self._clock()
+
+        self._report(message=phase if message == '' else message)
+
+    def advance(self, count: int = 1, message: str = ''):
+        """
+        Args:
+            count:      How many more items of the phase are complete
+            message:    An optional status message
+        """
+        with self._lock:
+            self._completed += count
+
+        self._report(message=message)
+
+    def addToTotal(self, count: int):
+        """
+        For a phase that discovers more items as it goes
+        """
+        with self._lock:
+            self._total += count
+
+    @property
+    def report(self) -> ProgressReport:
+        """
+        Returns:  Where the current phase is
+        """
+        with self._lock:
+            elapsedSeconds: float = max(0.0, self._clock() - self._phaseStart)
+            itemsPerSecond: float = self._completed / elapsedSeconds if elapsedSeconds > 0.0 else 0.0
+
+            return ProgressReport(phase=self._phase, completed=self._completed, total=self._total,
+                                  itemsPerSecond=itemsPerSecond, elapsedSeconds=elapsedSeconds, cancelled=self.cancelled)
+
+    def __call__(self, message: str):
+        """
+        Report a status message without advancing the phase
+        """
+        self._report(message=message)
+
+    def _report(self, message: str):
+
+        if self.listener is None:
+            return
+
+        report: ProgressReport = self.report
+        report.message = message
+
+        self.listener(report)
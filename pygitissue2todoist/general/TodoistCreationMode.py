@@ -0,0 +1,14 @@
+
+from enum import Enum
+
+
+class TodoistCreationMode(Enum):
+    """
+    How the strategies send new tasks to Todoist.  Batched packs up to 100 creations into
+    each Sync API request;  Concurrent sends one REST request per creation, several at a time
+    """
+    Batched    = 'Batched'
+    Concurrent = 'Concurrent'
+
+    def __str__(self):
+        return str(self.name)
@@ -0,0 +1,6 @@
+
+class OperationCancelledError(Exception):
+    """
+    The user cancelled a long-running operation;  Whatever completed before is kept
+    """
+    pass
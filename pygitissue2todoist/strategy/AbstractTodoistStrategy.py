@@ -1,15 +1,24 @@
 
 
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import cast
-from typing import Callable
 
 from abc import ABCMeta
 
+from dataclasses import replace
+
 from logging import Logger
 from logging import getLogger
 from logging import INFO
 
+from pathlib import Path
+
+from requests import RequestException
+
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
 from todoist_api_python.api import TodoistAPI
 from todoist_api_python.api_async import TodoistAPIAsync
 
@@ -18,13 +27,32 @@ from todoist_api_python.models import Task
 from todoist_api_python.models import Comment
 
 from pygitissue2todoist.strategy.ITodoistCreationStrategy import ITodoistCreationStrategy
+from pygitissue2todoist.strategy.IssueTaskMap import IssueKey
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskMap
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskRows
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskScope
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import ParentId
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import AbstractTodoistTaskWriter
+from pygitissue2todoist.strategy.TodoistBatchWriter import TodoistBatchWriter
+from pygitissue2todoist.strategy.TodoistConcurrentWriter import TodoistConcurrentWriter
+from pygitissue2todoist.strategy.TodoistProjectTree import TodoistProjectTree
+from pygitissue2todoist.strategy.TodoistReplica import TodoistReplica
+from pygitissue2todoist.strategy.TodoistReplica import todoistAccountKey
+from pygitissue2todoist.strategy.TodoistTaskIndex import TodoistTaskIndex
 
 from pygitissue2todoist.general.GitHubURLOption import GitHubURLOption
+from pygitissue2todoist.general.TodoistCreationMode import TodoistCreationMode
 
 from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.Resources import Resources
 
 from pygitissue2todoist.general.exceptions.NoteCreationError import NoteCreationError
+from pygitissue2todoist.general.exceptions.OperationCancelledError import OperationCancelledError
+from pygitissue2todoist.general.exceptions.TaskCreationError import TaskCreationError
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResult
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
 
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
 from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectDictionary
@@ -33,6 +61,9 @@ from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
 from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskName
 from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskNameMap
 from pygitissue2todoist.strategy.TodoistStrategyTypes import Tasks
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempIdMapping
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 
 
 class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
@@ -47,13 +78,107 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
 
         self._preferences: Preferences = Preferences()
 
-        apiToken:           str             = self._preferences.todoistAPIToken
-        self._todoist:      TodoistAPI      = TodoistAPI(apiToken)
-        self._todoistAsync: TodoistAPIAsync = TodoistAPIAsync(apiToken)
+        apiToken:           str                       = self._preferences.todoistAPIToken
+        self._todoist:      TodoistAPI                = TodoistAPI(apiToken)
+        self._todoistAsync: TodoistAPIAsync           = TodoistAPIAsync(apiToken)
+        self._taskWriter:   AbstractTodoistTaskWriter = self._createTaskWriter(apiToken=apiToken)
+        self._replica:      Optional[TodoistReplica]  = self._createReplica(apiToken=apiToken)
+        self._issueTaskMap: Optional[IssueTaskMap]    = self._createIssueTaskMap(apiToken=apiToken)
+
+        self._queuedIssueTasks: Dict[IssueKey, TempId] = {}
 
         self._devTasks:          Tasks             = Tasks([])
+        self._taskIndex:         TodoistTaskIndex  = TodoistTaskIndex()
         self._projectDictionary: ProjectDictionary = ProjectDictionary({})
 
+    def _setDevTasks(self, tasks: Tasks):
+        """
+        Remember the tasks new issues are checked against and index them once for this run
+
+        Args:
+            tasks:  The tasks that may already represent the cloned issues
+        """
+        self._devTasks  = tasks
+        self._taskIndex = TodoistTaskIndex(tasks=tasks)
+        # The replica has the comments at no extra cost;  Without it they would cost a request per task
+        if self._replica is not None:
+            self._taskIndex.addComments(self._replica.comments(tasks=tasks))
+
+    def _refreshSnapshot(self):
+        """
+        Plans are worked out from the replica, so it catches up with Todoist first;  When
+        Todoist cannot be reached the plan comes from the copy as it is
+        """
+        try:
+            self._refreshReplica()
+        except RequestException as e:
+            self.clsLogger.warning(f'Planning from the local copy of Todoist as it is: {e}')
+
+    def _hasSnapshot(self) -> bool:
+        return self._replica is not None and self._replica.isEmpty is False
+
+    def _snapshotProjects(self) -> ProjectDictionary:
+        """
+        Returns:  The projects in the local copy, by name;  Empty when there is none
+        """
+        if self._replica is None:
+            return ProjectDictionary({})
+
+        return ProjectDictionary({ProjectName(project.name): project for project in self._replica.projects()})
+
+    def _snapshotTree(self, projectId: Optional[str]) -> TodoistProjectTree:
+        """
+        Args:
+            projectId:  A project in the local copy;  None for a project that does not exist yet
+
+        Returns:  The project's tasks as of the last refresh
+        """
+        if self._replica is None or projectId is None:
+            return TodoistProjectTree(projectId='', tasks=[])
+
+        return TodoistProjectTree(projectId=projectId, tasks=self._replica.tasks(projectId=projectId))
+
+    def _planIssues(self, plan: TodoistPlan, tasksToClone: List[GitIssueInfo], existingTasks: Tasks):
+        """
+        Split the issues into the ones to create and the ones to skip, the same way
+        `_createTaskItem` would
+
+        Args:
+            plan:           The plan to fill in
+            tasksToClone:   The issues
+            existingTasks:  The tasks the issues are checked against
+        """
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=existingTasks)
+        if self._replica is not None:
+            taskIndex.addComments(self._replica.comments(tasks=existingTasks))
+
+        scope: IssueTaskScope = self._issueTaskScope()
+        for gitIssueInfo in tasksToClone:
+            mapped: bool = self._mappedTaskId(gitIssueInfo, scope=scope) is not None
+            if mapped is True or taskIndex.contains(name=gitIssueInfo.gitIssueName, url=gitIssueInfo.gitIssueURL) is True:
+                plan.issuesToSkip.append(gitIssueInfo)
+            else:
+                plan.issuesToCreate.append(gitIssueInfo)
+                taskIndex.add(taskId=TempId(f'planned-{len(plan.issuesToCreate)}'), content=gitIssueInfo.gitIssueName, description=gitIssueInfo.gitIssueURL)
+
+    def _estimateRequests(self, plan: TodoistPlan, directCreations: int, queuedTasks: int):
+        """
+        Args:
+            plan:               The plan to fill in
+            directCreations:    Tasks the strategy creates one request at a time
+            queuedTasks:        Tasks the strategy queues besides the issue tasks
+        """
+        if plan.hasWork is False:
+            plan.requestCount = 0
+            return
+
+        notesPerIssue: int = 1 if self._preferences.gitHubURLOption == GitHubURLOption.AddAsComment else 0
+        commandCount:  int = queuedTasks + len(plan.issuesToCreate) * (1 + notesPerIssue)
+        # A replica refresh, or the project list and the project's tasks
+        readCount:     int = 1 if self._replica is not None else 2
+
+        plan.requestCount = readCount + int(plan.createProject) + directCreations + self._taskWriter.estimateRequests(commandCount)
+
     def _createTaskNameMap(self, tasks: List[Task]) -> TaskNameMap:
         """
 
@@ -73,62 +198,220 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
 
         return taskMap
 
-    def _createTaskItem(self, gitIssueInfo: GitIssueInfo, projectId: str, parentTaskItem: Task, progressCb: Callable):
+    def _createTaskItem(self, gitIssueInfo: GitIssueInfo, projectId: str, parentId: ParentId, progressCb: ProgressMonitor):
         """
-        Create a new task if it does not already exist in Todoist
-        Assumes self._devTasks has all the project's tasks
+        Queue a new task if it does not already exist in Todoist;  `_flushTasks` creates
+        the queued tasks.  Assumes `_setDevTasks` indexed all the project's tasks
 
         Args:
-            gitIssueInfo:       The task (with information) to potentially create
+            gitIssueInfo:   The task (with information) to potentially create
             projectId:      Project id of potential task
-            parentTaskItem: parent item if task needs to be created
+            parentId:       Id of the parent task;  May be the temporary id of a queued task
             progressCb:     Progress callback
         """
-        assert self._devTasks is not None, 'Internal error should at least be empty'
-
-        todoist: TodoistAPI = self._todoist
-
-        foundTaskItem: Task = cast(Task, None)
-        devTasks:      Tasks = self._devTasks
-        for devTask in devTasks:
-            taskItem: Task = cast(Task, devTask)
-            # Might have name embedded as URL
-            # if taskInfo.gitIssueName in taskItem['content']:
-            if gitIssueInfo.gitIssueName in taskItem.content:
-                foundTaskItem = taskItem
-                break
+        taskWriter: AbstractTodoistTaskWriter = self._taskWriter
+        taskIndex:  TodoistTaskIndex          = self._taskIndex
+
+        issueKey: Optional[IssueKey] = IssueTaskMap.issueKey(gitIssueInfo)
+        foundId:  Optional[ParentId] = taskIndex.find(name=gitIssueInfo.gitIssueName, url=gitIssueInfo.gitIssueURL)
+        if foundId is not None:
+            self.clsLogger.debug(f'Task exists: {gitIssueInfo.gitIssueName}')
+            # Remember tasks cloned before there was a map;  A task queued in this run is recorded after the flush
+            if self._issueTaskMap is not None and issueKey is not None and issueKey not in self._queuedIssueTasks:
+                self._issueTaskMap.record(IssueTaskRows({issueKey: TaskId(foundId)}), scope=self._issueTaskScope())
+            return
+
+        option: GitHubURLOption = self._preferences.gitHubURLOption
+        match option:
+            case GitHubURLOption.DoNotAdd:
+                taskId: ParentId = taskWriter.addTask(projectId=projectId,
+                                                      parentId=parentId,
+                                                      content=gitIssueInfo.gitIssueName)
+
+            case GitHubURLOption.AddAsDescription:
+                taskId = taskWriter.addTask(projectId=projectId,
+                                            parentId=parentId,
+                                            content=gitIssueInfo.gitIssueName,
+                                            description=gitIssueInfo.gitIssueURL)
+
+            case GitHubURLOption.AddAsComment:
+                # The comment refers to the task by its temporary id
+                taskId = taskWriter.addTask(projectId=projectId,
+                                            parentId=parentId,
+                                            content=gitIssueInfo.gitIssueName)
+                taskWriter.addNote(taskId=taskId, content=gitIssueInfo.gitIssueURL)
+
+            case GitHubURLOption.HyperLinkedTaskName:
+                linkedTaskName: str = f'[{gitIssueInfo.gitIssueName}]({gitIssueInfo.gitIssueURL})'
+                taskId = taskWriter.addTask(projectId=projectId,
+                                            parentId=parentId,
+                                            content=linkedTaskName)
+            case _:
+                self.clsLogger.error(f'Unknown URL option: {option}')
+                return
         #
-        # To create subtasks first create in project then move them to the milestone task
+        # An issue cloned twice in one run is queued once
         #
-        if foundTaskItem is None:
-            option: GitHubURLOption = self._preferences.gitHubURLOption
-            match option:
-                case GitHubURLOption.DoNotAdd:
-                    todoist.add_task(projectId=projectId,
-                                     parent_id=parentTaskItem.id,
-                                     content=gitIssueInfo.gitIssueName)
-
-                case GitHubURLOption.AddAsDescription:
-                    todoist.add_task(projectId=projectId,
-                                     parent_id=parentTaskItem.id,
-                                     content=gitIssueInfo.gitIssueName,
-                                     description=gitIssueInfo.gitIssueURL)
-
-                case GitHubURLOption.AddAsComment:
-                    task: Task = todoist.add_task(projectId=projectId,
-                                                  parent_id=parentTaskItem.id,
-                                                  content=gitIssueInfo.gitIssueName)
-                    comment: Comment = todoist.add_comment(task_id=task.id, content=gitIssueInfo.gitIssueURL)
-                    AbstractTodoistStrategy.clsLogger.info(f'Comment added: {comment}')
-
-                case GitHubURLOption.HyperLinkedTaskName:
-                    linkedTaskName: str = f'[{gitIssueInfo.gitIssueName}]({gitIssueInfo.gitIssueURL})'
-                    todoist.add_task(project_id=projectId,
-                                     parent_id=parentTaskItem.id,
-                                     content=linkedTaskName)
-                case _:
-                    self.clsLogger.error(f'Unknown URL option: {option}')
-            progressCb(f'Created task: {gitIssueInfo.gitIssueName}')
+        taskIndex.add(taskId=taskId, content=gitIssueInfo.gitIssueName, description=gitIssueInfo.gitIssueURL)
+        if issueKey is not None:
+            self._queuedIssueTasks[issueKey] = TempId(taskId)
+        progressCb(f'Queued task: {gitIssueInfo.gitIssueName}')
+
+    def _flushTasks(self, progressCb: ProgressMonitor):
+        """
+        Create every queued task and comment;  Either batched or concurrently, as the
+        user prefers.  This is the phase with a known total
+
+        Args:
+            progressCb:     Progress monitor
+
+        Raises:
+            TaskCreationError:          When any creation failed;  The others are kept
+            OperationCancelledError:    When the user cancelled;  The created items are kept
+        """
+        taskWriter:   AbstractTodoistTaskWriter = self._taskWriter
+        commandCount: int                       = taskWriter.pendingCount
+        if commandCount == 0:
+            progressCb.raiseIfCancelled()
+            return
+
+        progressCb.startPhase(phase='Creating Todoist items', total=commandCount)
+
+        requestCount: int = taskWriter.requestCount
+        try:
+            results: CreationResults = taskWriter.flush(monitor=progressCb)
+        finally:
+            self._recordQueuedIssueTasks()
+            # The next plan must not offer these again, even before the next refresh
+            if self._replica is not None:
+                self._replica.addItems(taskWriter.createdItems)
+
+        failures: List[CreationResult] = [result for result in results if result.succeeded is False and result.skipped is False]
+        for failure in failures:
+            progressCb(f'Failed to create: {failure.content} - {failure.error}')
+
+        skipped: int = len([result for result in results if result.skipped is True])
+        created: int = commandCount - len(failures) - skipped
+        progressCb(f'Created {created} Todoist items in {taskWriter.requestCount - requestCount} requests')
+
+        if len(failures) > 0:
+            taskCreationError: TaskCreationError = TaskCreationError()
+            taskCreationError.message   = f'{len(failures)} of {commandCount} Todoist items were not created: {", ".join(failure.content for failure in failures)}'
+            # Lets the error handler recognize a failure it can repair
+            taskCreationError.errorCode = failures[0].errorCode
+
+            raise taskCreationError
+
+        if skipped > 0:
+            raise OperationCancelledError(f'Cancelled after creating {created} of {commandCount} Todoist items')
+
+    def _remainingCloneInformation(self, info: CloneInformation, progressCb: ProgressMonitor) -> Optional[CloneInformation]:
+        """
+        Every strategy starts here, so this is where the replica catches up with Todoist.  Then
+        drop the issues whose mapped task is still in the replica;  Without a replica the map
+        cannot tell deleted tasks, so the project's tasks decide
+
+        Args:
+            info:           The cloned information
+            progressCb:     Progress callback
+
+        Returns:  The clone information with only the issues that may still need a task;  None
+        when every issue already has one
+        """
+        self._refreshReplica()
+        if self._issueTaskMap is None or self._replica is None:
+            return info
+
+        scope:        IssueTaskScope     = self._issueTaskScope()
+        tasksToClone: List[GitIssueInfo] = [gitIssueInfo for gitIssueInfo in info.tasksToClone if self._mappedTaskId(gitIssueInfo, scope=scope) is None]
+
+        alreadyCloned: int = len(info.tasksToClone) - len(tasksToClone)
+        if alreadyCloned == 0:
+            return info
+
+        progressCb(f'{alreadyCloned} of {len(info.tasksToClone)} issues are already in Todoist')
+        if len(tasksToClone) == 0:
+            return None
+
+        return replace(info, tasksToClone=tasksToClone)
+
+    def _mappedTaskId(self, gitIssueInfo: GitIssueInfo, scope: IssueTaskScope) -> Optional[TaskId]:
+        """
+        Only trust the map for tasks the replica still has.  A full sync does not report
+        deletions, so a task can be gone without the map having heard of it;  Such an entry
+        is forgotten and the issue is cloned again
+
+        Args:
+            gitIssueInfo:   An issue to clone
+            scope:          Where the issue is cloned to
+
+        Returns:  The id of the issue's active task;  None if there is none or no replica to check against
+        """
+        if self._issueTaskMap is None or self._replica is None:
+            return None
+
+        taskId: Optional[TaskId] = self._issueTaskMap.taskIdFor(gitIssueInfo, scope=scope)
+        if taskId is None or self._replica.hasTask(taskId) is True:
+            return taskId
+
+        self.clsLogger.info(f'The task of {gitIssueInfo.gitIssueURL} is no longer in Todoist')
+        self._issueTaskMap.forgetTasks([taskId])
+
+        return None
+
+    def _refreshReplica(self):
+        """
+        Bring the replica up to date and forget the mapped tasks Todoist reported as deleted
+        """
+        if self._replica is None:
+            return
+
+        self._replica.refresh()
+        if self._issueTaskMap is not None:
+            self._issueTaskMap.forgetTasks(self._replica.deletedTaskIds)
+
+    def _recordQueuedIssueTasks(self):
+        """
+        Map the issues whose tasks the last flush created
+        """
+        tempIdMapping: TempIdMapping = self._taskWriter.tempIdMapping
+        if self._issueTaskMap is not None:
+            created: IssueTaskRows = IssueTaskRows({issueKey: tempIdMapping[tempId] for issueKey, tempId in self._queuedIssueTasks.items() if tempId in tempIdMapping})
+            self._issueTaskMap.record(created, scope=self._issueTaskScope())
+
+        self._queuedIssueTasks = {}
+
+    def _createTaskWriter(self, apiToken: str) -> AbstractTodoistTaskWriter:
+
+        if self._preferences.todoistCreationMode == TodoistCreationMode.Concurrent:
+            return TodoistConcurrentWriter(todoistAsync=self._todoistAsync, maxConcurrency=self._preferences.todoistMaxConcurrency)
+
+        return TodoistBatchWriter(apiToken=apiToken)
+
+    def _createReplica(self, apiToken: str) -> Optional[TodoistReplica]:
+
+        if self._preferences.todoistLocalReplica is False:
+            return None
+
+        return TodoistReplica(apiToken=apiToken)
+
+    def _createIssueTaskMap(self, apiToken: str) -> Optional[IssueTaskMap]:
+
+        if self._preferences.todoistIssueMap is False:
+            return None
+
+        # Not with the replica;  Clearing the Todoist cache must not forget what was cloned
+        applicationPath: Path = ConfigurationLocator().applicationPath(Resources.CANONICAL_APPLICATION_NAME.lower())
+
+        return IssueTaskMap(databasePath=applicationPath / f'issueTasks-{todoistAccountKey(apiToken)}.sqlite')
+
+    def _issueTaskScope(self) -> IssueTaskScope:
+        """
+        Strategies that create the tasks in the preferred single project;  Override otherwise
+
+        Returns:  Where this strategy clones issues to
+        """
+        return IssueTaskMap.scope(strategyName=self.__class__.__name__, projectName=self._preferences.todoistProjectName)
 
     def _addNoteToTask(self, itemId: str, noteContent: str) -> Comment:
         """
@@ -156,7 +439,7 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
 
         return newComment
 
-    def _getProjectIdOfSingleProjectName(self, progressCb: Callable):
+    def _getProjectIdOfSingleProjectName(self, progressCb: ProgressMonitor):
         """
         Some Todoist strategies place all the subtasks in a single project.  This common method
         returns the ID of that preferred project.
@@ -168,6 +451,7 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
         progressCb(f'Using single project: {self._preferences.todoistProjectName}')
 
         self._projectDictionary = self._getCurrentProjects()
+        progressCb.raiseIfCancelled()
 
         projectName: ProjectName = ProjectName(self._preferences.todoistProjectName)
         projectId:   str         = self._getProjectId(projectName=projectName, projectDictionary=self._projectDictionary)
@@ -196,36 +480,54 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
 
         return projectId
 
-    def _getIdForRepoName(self, projectId: str, repoName: str) -> str:
+    def _loadProjectTree(self, projectId: str) -> TodoistProjectTree:
+        """
+        Read the project's tasks once;  From the replica when there is one
+
+        Args:
+            projectId:  The project
+
+        Returns:  The project's task hierarchy
+        """
+        if self._replica is None:
+            tasks: Tasks = Tasks(self._todoist.get_tasks(project_id=projectId))
+        else:
+            tasks = self._replica.tasks(projectId=projectId)
+
+        return TodoistProjectTree(projectId=projectId, tasks=tasks)
+
+    def _getIdForRepoName(self, projectTree: TodoistProjectTree, repoName: str) -> TaskId:
         """
         Will either find a repo in the "development" task or create it in the "development" task
         Args:
-            projectId:
-            repoName:
+            projectTree:    The "development" project's tasks;  A new repo task is added to it
+            repoName:       The repository name
 
         Returns: The Repo ID
 
         """
-        tasks = self._todoist.get_tasks(project_id=projectId)
-
-        itemNames: TaskNameMap = self._createTaskNameMap(tasks=tasks)
+        repoTask: Optional[Task] = projectTree.findChild(name=repoName)
 
         # Either use the id of the one found or create it
-        if repoName in itemNames:
-            repoId: str = itemNames[TaskName(repoName)]
-        else:
+        if repoTask is None:
             todoist:  TodoistAPI = self._todoist
-            repoTask: Task = todoist.add_task(project_id=projectId, content=repoName, description='Repo task created by PyGitIssue2Todoist')
+            repoTask = todoist.add_task(project_id=projectTree.projectId, content=repoName, description='Repo task created by PyGitIssue2Todoist')
 
-            repoId = repoTask.id
+            projectTree.add(repoTask)
 
-        return repoId
+        return TaskId(repoTask.id)
 
     def _getCurrentProjects(self) -> ProjectDictionary:
+        """
+        From the replica when there is one;  `_remainingCloneInformation` refreshed it
 
-        todoist: TodoistAPI = self._todoist
+        Returns:  The user's projects by name
+        """
+        if self._replica is None:
+            projects: List[Project] = self._todoist.get_projects()
+        else:
+            projects = self._replica.projects()
 
-        projects:          List[Project]     = todoist.get_projects()
         projectDictionary: ProjectDictionary = ProjectDictionary({})
 
         for aProject in projects:
@@ -247,15 +549,14 @@ class AbstractTodoistStrategy(ITodoistCreationStrategy, metaclass=ABCMeta):
         self.clsLogger.info(f'New project: {project.id}')
         return project
 
-    def _synchronize(self, progressCb):
+    def _synchronize(self, progressCb: ProgressMonitor):
         # TODO: This method is unneeded
         progressCb('Done')
 
-    def _infoLogCloneInformation(self, info: CloneInformation, progressCb: Callable):
+    # noinspection PyUnusedLocal
+    def _infoLogCloneInformation(self, info: CloneInformation, progressCb: ProgressMonitor):
 
         if AbstractTodoistStrategy.clsLogger.isEnabledFor(INFO) is True:
-            AbstractTodoistStrategy.clsLogger.info(f'{progressCb.__name__}')
-
             AbstractTodoistStrategy.clsLogger.info(f'{info.repositoryTask=} {info.milestoneNameTask=}')
             for t in info.tasksToClone:
                 gitIssueInfo: GitIssueInfo = cast(GitIssueInfo, t)
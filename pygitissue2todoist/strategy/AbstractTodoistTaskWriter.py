@@ -0,0 +1,184 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from abc import ABCMeta
+from abc import abstractmethod
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from uuid import uuid4
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResult
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempIdMapping
+
+ITEM_ADD_COMMAND: str = 'item_add'
+NOTE_ADD_COMMAND: str = 'note_add'
+
+ParentId = Union[TaskId, TempId]
+
+
+def createCommandIdFactory() -> str:
+    return str(uuid4())
+
+
+@dataclass
+class TaskCommand:
+    """
+    A queued creation, expressed as a Todoist Sync API command.  Todoist applies a command at
+    most once per uuid, so a resent batch does not create duplicates
+    """
+    commandType: str
+    args:        Dict[str, Any]
+    uuid:        str              = field(default_factory=createCommandIdFactory)
+    tempId:      Optional[TempId] = None
+
+    @property
+    def isNote(self) -> bool:
+        return self.commandType == NOTE_ADD_COMMAND
+
+    def toJson(self) -> Dict[str, Any]:
+        command: Dict[str, Any] = {'type': self.commandType, 'uuid': self.uuid, 'args': self.args}
+        if self.tempId is not None:
+            command['temp_id'] = self.tempId
+        return command
+
+
+class AbstractTodoistTaskWriter(metaclass=ABCMeta):
+    """
+    Collects the tasks and comments a strategy wants to create;  Subclasses decide how
+    `flush` sends them to Todoist.  A queued task is known by a temporary id until it is
+    created;  Comments and sub-tasks may refer to it
+    """
+    def __init__(self):
+
+        self.abstractLogger: Logger = getLogger(__name__)
+
+        self._commands:        List[TaskCommand] = []
+        self._flushedCommands: List[TaskCommand] = []
+        self._tempIdMapping:   TempIdMapping     = TempIdMapping({})
+        self._requestCount:    int               = 0
+
+    @property
+    def pendingCount(self) -> int:
+        """
+        Returns:  The number of creations waiting for the next flush
+        """
+        return len(self._commands)
+
+    @property
+    def requestCount(self) -> int:
+        """
+        Returns:  How many requests this writer has sent
+        """
+        return self._requestCount
+
+    @property
+    def tempIdMapping(self) -> TempIdMapping:
+        """
+        Returns:  The real ids of every task created so far, keyed by their temporary ids
+        """
+        return self._tempIdMapping
+
+    @property
+    def createdItems(self) -> List[Dict[str, Any]]:
+        """
+        Returns:  The tasks the last flush created, as Sync API item records with their real ids
+        """
+        items: List[Dict[str, Any]] = []
+        for command in self._flushedCommands:
+            if command.isNote is False and command.tempId in self._tempIdMapping:
+                item: Dict[str, Any] = {**command.args, 'id': self._tempIdMapping[command.tempId]}
+                if 'parent_id' in item:
+                    item['parent_id'] = self.resolve(item['parent_id'])
+                items.append(item)
+
+        return items
+
+    def addTask(self, content: str, projectId: str, parentId: Optional[ParentId] = None, description: Optional[str] = None) -> TempId:
+        """
+        Queue a task
+
+        Args:
+            content:        The task name
+            projectId:      The project the task belongs to
+            parentId:       A real or temporary task id
+            description:    An optional description
+
+        Returns:  The temporary id that stands for the task until it is created
+        """
+        args: Dict[str, Any] = {'content': content, 'project_id': projectId}
+        if parentId is not None:
+            args['parent_id'] = parentId
+        if description is not None:
+            args['description'] = description
+
+        tempId: TempId = TempId(str(uuid4()))
+        self._commands.append(TaskCommand(commandType=ITEM_ADD_COMMAND, args=args, tempId=tempId))
+
+        return tempId
+
+    def addNote(self, taskId: ParentId, content: str):
+        """
+        Queue a comment
+
+        Args:
+            taskId:     A real or temporary task id
+            content:    The comment text
+        """
+        self._commands.append(TaskCommand(commandType=NOTE_ADD_COMMAND, args={'item_id': taskId, 'content': content}))
+
+    def resolve(self, taskId: ParentId) -> TaskId:
+        """
+        Args:
+            taskId: A real or temporary task id
+
+        Returns:  The real id;  Only valid after the task was flushed
+        """
+        return self._tempIdMapping.get(TempId(taskId), TaskId(taskId))
+
+    @abstractmethod
+    def estimateRequests(self, commandCount: int) -> int:
+        """
+        Args:
+            commandCount:   A number of tasks and comments
+
+        Returns:  How many requests flushing them would take
+        """
+        pass
+
+    @abstractmethod
+    def flush(self, monitor: Optional[ProgressMonitor] = None) -> CreationResults:
+        """
+        Create every queued task and comment
+
+        Args:
+            monitor:    Advanced as creations complete;  Once it is cancelled the requests in flight
+                        finish and the remaining creations are skipped
+
+        Returns:  One result per queued creation, in queue order
+        """
+        pass
+
+    def _skippedResult(self, command: TaskCommand) -> CreationResult:
+        return CreationResult(content=command.args['content'], isNote=command.isNote, skipped=True)
+
+    def _takeCommands(self) -> List[TaskCommand]:
+
+        commands: List[TaskCommand] = self._commands
+        self._commands        = []
+        self._flushedCommands = commands
+
+        return commands
@@ -1,10 +1,11 @@
 
-from typing import Callable
-
 from abc import ABC
 from abc import abstractmethod
 
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 
 
 class ITodoistCreationStrategy(ABC):
@@ -12,17 +13,33 @@ class ITodoistCreationStrategy(ABC):
         pass
 
     @abstractmethod
-    def createTasks(self, info: CloneInformation, progressCb: Callable):
+    def createTasks(self, info: CloneInformation, progressCb: ProgressMonitor):
         """
         Abstract method;  Subclass must implement
         Args:
             info:           The Clone information from the GitHub calls
-            progressCb:     The callback to report information
+            progressCb:     Reports the progress;  Checked for a cancel between requests
+
+        Raises:
+            OperationCancelledError:  When the user cancelled;  The tasks created before are kept
+        """
+        pass
+
+    @abstractmethod
+    def planTasks(self, info: CloneInformation) -> TodoistPlan:
+        """
+        Work out what createTasks would do from the local copy of Todoist;  Refreshing the copy
+        is the only request
+
+        Args:
+            info:           The Clone information from the GitHub calls
+
+        Returns:  The projects and tasks to create, the issues to skip and the request cost
         """
         pass
 
     @abstractmethod
-    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: Callable) -> str:
+    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: ProgressMonitor) -> str:
         """
         Either gets a project ID from the repo name or one for the user specified project
 
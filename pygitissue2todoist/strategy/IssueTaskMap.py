@@ -0,0 +1,146 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from datetime import datetime
+from datetime import timezone
+
+from pathlib import Path
+
+from sqlite3 import Connection
+from sqlite3 import connect
+
+from threading import RLock
+
+from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistTaskIndex import TodoistTaskIndex
+
+SCHEMA: str = '''
+    CREATE TABLE IF NOT EXISTS issueTasks (
+        scope       TEXT NOT NULL,
+        issueKey    TEXT NOT NULL,
+        taskId      TEXT NOT NULL,
+        recordedAt  TEXT NOT NULL,
+        PRIMARY KEY (scope, issueKey)
+    );
+    CREATE INDEX IF NOT EXISTS issueTasksByTask ON issueTasks (taskId);
+'''
+
+IssueKey       = NewType('IssueKey',       str)
+IssueTaskRows  = NewType('IssueTaskRows',  Dict[IssueKey, TaskId])
+IssueTaskScope = NewType('IssueTaskScope', str)
+
+
+class IssueTaskMap:
+    """
+    A SQLite store that remembers which Todoist task each cloned GitHub issue became, keyed by
+    'owner/repository#number'.  The strategies consult it before they read anything from
+    Todoist, so re-cloning issues that are already there costs no requests, and a renamed issue
+    still finds its task.
+
+    Every entry belongs to a scope, the creation strategy and the project it created the task
+    in;  After the user switches either, the issues are cloned into the new layout.
+
+    Tasks deleted in Todoist are forgotten when the replica reports them;  Until then their
+    issues are treated as cloned
+    """
+    def __init__(self, databasePath: Path):
+        """
+
+        Args:
+            databasePath:   Where the SQLite database lives;  Created when missing
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._lock: RLock = RLock()
+
+        databasePath.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection: Connection = connect(databasePath, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    @classmethod
+    def scope(cls, strategyName: str, projectName: str) -> IssueTaskScope:
+        """
+        Args:
+            strategyName:   The creation strategy
+            projectName:    The project the strategy creates the tasks in;  Empty when that
+                            depends on the issue
+
+        Returns:  The scope of the strategy's entries
+        """
+        return IssueTaskScope(f'{strategyName}/{projectName}')
+
+    @classmethod
+    def issueKey(cls, gitIssueInfo: GitIssueInfo) -> Optional[IssueKey]:
+        """
+        Args:
+            gitIssueInfo:   An issue to clone
+
+        Returns:  The issue's key;  None when its URL is not a GitHub issue URL
+        """
+        issueKey: Optional[str] = TodoistTaskIndex.issueKey(gitIssueInfo.gitIssueURL)
+        if issueKey is None:
+            return None
+
+        return IssueKey(issueKey)
+
+    def taskIdFor(self, gitIssueInfo: GitIssueInfo, scope: IssueTaskScope) -> Optional[TaskId]:
+        """
+        Args:
+            gitIssueInfo:   An issue to clone
+            scope:          Where the issue is cloned to
+
+        Returns:  The id of the issue's Todoist task;  None if it was never cloned to that scope
+        """
+        issueKey: Optional[IssueKey] = self.issueKey(gitIssueInfo)
+        if issueKey is None:
+            return None
+
+        with self._lock:
+            row = self._connection.execute('SELECT taskId FROM issueTasks WHERE scope = ? AND issueKey = ?', (scope, issueKey)).fetchone()
+
+        if row is None:
+            return None
+
+        return TaskId(row[0])
+
+    def record(self, issueTasks: IssueTaskRows, scope: IssueTaskScope):
+        """
+        Args:
+            issueTasks:     Task ids by issue key
+            scope:          Where the tasks were created
+        """
+        recordedAt: str = datetime.now(timezone.utc).isoformat()
+
+        with self._lock, self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO issueTasks (scope, issueKey, taskId, recordedAt) VALUES (?, ?, ?, ?)',
+                                         [(scope, issueKey, taskId, recordedAt) for issueKey, taskId in issueTasks.items()])
+
+        self.logger.debug(f'Recorded {len(issueTasks)} issue tasks')
+
+    def forgetTasks(self, taskIds: Iterable[str]):
+        """
+        Args:
+            taskIds:    Todoist tasks that no longer exist
+        """
+        rows: List[Tuple[str]] = [(taskId,) for taskId in taskIds]
+
+        with self._lock, self._connection:
+            self._connection.executemany('DELETE FROM issueTasks WHERE taskId = ?', rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM issueTasks').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,117 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from requests import Session
+
+from todoist_api_python.endpoints import get_sync_url
+from todoist_api_python.http_requests import post
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import AbstractTodoistTaskWriter
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import TaskCommand
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResult
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+
+SYNC_OK: str = 'ok'
+
+
+class TodoistBatchWriter(AbstractTodoistTaskWriter):
+    """
+    Sends the queued creations as Todoist Sync API commands, `MAX_COMMANDS_PER_REQUEST` at a
+    time, instead of one REST round trip each.  When a batch is split over several requests,
+    references to tasks created by an earlier request are rewritten to their real ids
+    """
+    MAX_COMMANDS_PER_REQUEST: int = 100
+
+    def __init__(self, apiToken: str, session: Optional[Session] = None, maxCommandsPerRequest: int = MAX_COMMANDS_PER_REQUEST):
+        """
+
+        Args:
+            apiToken:               The Todoist API token
+            session:                Lets callers share connections;  By default the writer has its own
+            maxCommandsPerRequest:  Todoist accepts at most 100
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._apiToken:    str     = apiToken
+        self._session:     Session = Session() if session is None else session
+        self._maxCommands: int     = max(1, min(maxCommandsPerRequest, TodoistBatchWriter.MAX_COMMANDS_PER_REQUEST))
+
+    def estimateRequests(self, commandCount: int) -> int:
+        return -(-commandCount // self._maxCommands)
+
+    def flush(self, monitor: Optional[ProgressMonitor] = None) -> CreationResults:
+        """
+        The requests go out in order.  When Todoist rejects a command, the commands it accepted
+        stay created and the requests after that one are not sent;  Their commands are skipped.
+        A cancel takes effect between requests
+
+        Args:
+            monitor:    Advanced by each request's commands
+
+        Returns:  One result per queued creation, in queue order;  A rejected command's result
+        carries Todoist's error
+        """
+        if monitor is None:
+            monitor = ProgressMonitor()
+
+        commands: List[TaskCommand] = self._takeCommands()
+        results:  CreationResults   = CreationResults([])
+
+        for start in range(0, len(commands), self._maxCommands):
+            batch: List[TaskCommand] = commands[start:start + self._maxCommands]
+            if monitor.cancelled is True or any(result.succeeded is False for result in results):
+                results.extend([self._skippedResult(command) for command in batch])
+            else:
+                results.extend(self._send(commands=batch))
+                monitor.advance(count=len(batch))
+
+        return results
+
+    def _send(self, commands: List[TaskCommand]) -> CreationResults:
+
+        for command in commands:
+            for name, value in command.args.items():
+                if value in self._tempIdMapping:
+                    command.args[name] = self._tempIdMapping[value]
+
+        response: Dict[str, Any] = post(self._session, get_sync_url('sync'), self._apiToken,
+                                        data={'commands': [command.toJson() for command in commands]})
+        self._requestCount += 1
+
+        for tempId, realId in response.get('temp_id_mapping', {}).items():
+            self._tempIdMapping[TempId(tempId)] = TaskId(str(realId))
+
+        self.logger.info(f'Sent {len(commands)} commands;  {len(self._tempIdMapping)} tasks created so far')
+        #
+        # Todoist applies each command on its own, so the status of every command is accurate
+        #
+        results:    CreationResults = CreationResults([])
+        syncStatus: Dict[str, Any]  = response.get('sync_status', {})
+        for command in commands:
+            status: Any = syncStatus.get(command.uuid, SYNC_OK)
+            if status == SYNC_OK:
+                taskId: str = command.args['item_id'] if command.isNote else self.resolve(TempId(command.tempId))
+                results.append(CreationResult(content=command.args['content'], isNote=command.isNote, taskId=taskId))
+            else:
+                results.append(self._failedResult(command=command, status=status))
+
+        return results
+
+    def _failedResult(self, command: TaskCommand, status: Dict[str, Any]) -> CreationResult:
+
+        self.logger.error(f'{command.commandType} failed: {status}')
+
+        return CreationResult(content=command.args['content'], isNote=command.isNote,
+                              error=status.get('error', 'Unknown error'), errorCode=status.get('error_code', -1))
@@ -0,0 +1,151 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from asyncio import Future
+from asyncio import Semaphore
+from asyncio import gather
+from asyncio import get_running_loop
+from asyncio import run
+
+from todoist_api_python.api_async import TodoistAPIAsync
+
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import AbstractTodoistTaskWriter
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import TaskCommand
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResult
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+
+#
+# The arguments that may hold the temporary id of a queued task
+#
+REFERENCE_ARGUMENTS: List[str] = ['parent_id', 'item_id']
+
+CreatedTasks = Dict[TempId, 'Future[Optional[TaskId]]']
+
+
+class TodoistConcurrentWriter(AbstractTodoistTaskWriter):
+    """
+    Sends the queued creations as REST requests through TodoistAPIAsync, at most
+    `maxConcurrency` at a time.  Independent creations run concurrently;  A sub-task or comment
+    waits until the task it refers to exists.  When a task fails, everything that refers to it
+    fails too instead of being created in the wrong place.
+
+    Unlike the batch writer a failure does not stop the other creations;  `flush` reports
+    each one
+    """
+    DEFAULT_MAX_CONCURRENCY: int = 4
+    #
+    # Todoist allows 450 requests per 15 minutes;  More parallelism only hits that sooner
+    #
+    MAX_CONCURRENCY_CEILING: int = 8
+
+    def __init__(self, todoistAsync: TodoistAPIAsync, maxConcurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+
+        Args:
+            todoistAsync:   The asynchronous Todoist client
+            maxConcurrency: The most requests in flight at once
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._todoistAsync:   TodoistAPIAsync = todoistAsync
+        self._maxConcurrency: int             = max(1, min(maxConcurrency, TodoistConcurrentWriter.MAX_CONCURRENCY_CEILING))
+
+    def estimateRequests(self, commandCount: int) -> int:
+        return commandCount
+
+    def flush(self, monitor: Optional[ProgressMonitor] = None) -> CreationResults:
+        """
+        Blocks the calling thread until every creation finished, failed or was skipped.  A cancel
+        lets the requests in flight finish;  The creations still waiting for a slot are skipped
+
+        Args:
+            monitor:    Advanced as each creation completes
+
+        Returns:  One result per queued creation, in queue order
+        """
+        commands: List[TaskCommand] = self._takeCommands()
+        if len(commands) == 0:
+            return CreationResults([])
+
+        return run(self._createAll(commands=commands, monitor=ProgressMonitor() if monitor is None else monitor))
+
+    async def _createAll(self, commands: List[TaskCommand], monitor: ProgressMonitor) -> CreationResults:
+
+        semaphore:    Semaphore    = Semaphore(self._maxConcurrency)
+        createdTasks: CreatedTasks = {}
+        for command in commands:
+            if command.tempId is not None:
+                createdTasks[command.tempId] = get_running_loop().create_future()
+
+        results: List[CreationResult] = await gather(*[self._create(command, createdTasks, semaphore, monitor) for command in commands])
+
+        failures: int = len([result for result in results if result.succeeded is False])
+        self.logger.info(f'Sent {len(commands) - failures} creations;  {failures} failed')
+
+        return CreationResults(list(results))
+
+    async def _create(self, command: TaskCommand, createdTasks: CreatedTasks, semaphore: Semaphore, monitor: ProgressMonitor) -> CreationResult:
+
+        result: CreationResult = CreationResult(content=command.args['content'], isNote=command.isNote)
+        taskId: Optional[TaskId] = None
+        try:
+            args: Optional[Dict[str, Any]] = await self._resolveReferences(command=command, createdTasks=createdTasks)
+            if args is None and monitor.cancelled is True:
+                return self._skippedResult(command)
+            if args is None:
+                result.error = 'The task it belongs to was not created'
+                return result
+
+            async with semaphore:
+                if monitor.cancelled is True:
+                    return self._skippedResult(command)
+                self._requestCount += 1
+                if command.isNote is True:
+                    result.taskId = args['item_id']
+                    await self._todoistAsync.add_comment(task_id=args['item_id'], content=args['content'])
+                else:
+                    task: Task = await self._todoistAsync.add_task(**args)
+                    taskId        = TaskId(task.id)
+                    result.taskId = taskId
+                    self._tempIdMapping[TempId(command.tempId)] = taskId
+            monitor.advance()
+        except Exception as e:
+            self.logger.error(f'{command.commandType} failed for {result.content}: {e}')
+            result.error = str(e)
+        finally:
+            # Release the waiting sub-tasks and comments, whatever happened
+            if command.tempId is not None:
+                createdTasks[command.tempId].set_result(taskId)
+
+        return result
+
+    async def _resolveReferences(self, command: TaskCommand, createdTasks: CreatedTasks) -> Optional[Dict[str, Any]]:
+        """
+        Returns:  The arguments with real ids;  None when a task they refer to failed
+        """
+        args: Dict[str, Any] = dict(command.args)
+        for name in REFERENCE_ARGUMENTS:
+            reference: Any = args.get(name, None)
+            if reference in createdTasks:
+                realId: Optional[TaskId] = await createdTasks[reference]
+                if realId is None:
+                    return None
+                args[name] = realId
+            elif reference in self._tempIdMapping:
+                args[name] = self._tempIdMapping[reference]
+
+        return args
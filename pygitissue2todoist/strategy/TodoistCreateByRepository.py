@@ -1,6 +1,6 @@
 
 from typing import List
-from typing import Callable
+from typing import Optional
 from typing import NewType
 from typing import Union
 from typing import cast
@@ -17,13 +17,20 @@ from todoist_api_python.api import TodoistAPI
 from todoist_api_python.models import Project
 from todoist_api_python.models import Task
 
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
 from pygitissue2todoist.strategy.AbstractTodoistStrategy import AbstractTodoistStrategy
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskMap
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskScope
 
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectDictionary
 from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectName
 from pygitissue2todoist.strategy.TodoistStrategyTypes import Tasks
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 from pygitissue2todoist.strategy.TodoistStrategyTypes import tasksFactory
+from pygitissue2todoist.strategy.TodoistProjectTree import TodoistProjectTree
 
 
 @dataclass
@@ -53,27 +60,62 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
 
         self.logger:             Logger            = getLogger(__name__)
 
-    def createTasks(self, info: CloneInformation, progressCb: Callable):
+    def createTasks(self, info: CloneInformation, progressCb: ProgressMonitor):
         """
 
         Args:
             info:  The cloned information
             progressCb: A progress callback to return status
         """
-        self.logger.info(f'{progressCb.__name__} - {info=}')
+        self.logger.info(f'{info=}')
 
         progressCb('Starting')
 
+        remaining: Optional[CloneInformation] = self._remainingCloneInformation(info=info, progressCb=progressCb)
+        if remaining is None:
+            return
+        info = remaining
+
         projectId:         str  = self._determineTopLevelProjectId(info, progressCb)
         milestoneTaskItem: Task = self._getMilestoneTaskItem(projectId=projectId, milestoneName=info.milestoneNameTask, progressCb=progressCb)
 
         tasks: List[GitIssueInfo] = info.tasksToClone
         for taskInfo in tasks:
-            self._createTaskItem(gitIssueInfo=taskInfo, projectId=projectId, parentTaskItem=milestoneTaskItem, progressCb=progressCb)
+            self._createTaskItem(gitIssueInfo=taskInfo, projectId=projectId, parentId=milestoneTaskItem.id, progressCb=progressCb)
 
+        self._flushTasks(progressCb)
         self._synchronize(progressCb)
 
-    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: Callable) -> str:
+    def planTasks(self, info: CloneInformation) -> TodoistPlan:
+        """
+        A project per repository with the milestone task at its top level
+
+        Args:
+            info:  The cloned information
+
+        Returns:  What createTasks would do
+        """
+        self._refreshSnapshot()
+
+        justRepoName: str               = info.repositoryTask.split('/')[1]
+        projects:     ProjectDictionary = self._snapshotProjects()
+
+        plan: TodoistPlan = TodoistPlan(projectName=justRepoName, createProject=justRepoName not in projects, fromSnapshot=self._hasSnapshot())
+
+        projectId:   Optional[str]      = None if plan.createProject is True else projects[ProjectName(justRepoName)].id
+        projectTree: TodoistProjectTree = self._snapshotTree(projectId=projectId)
+
+        if projectTree.findChild(name=info.milestoneNameTask) is None:
+            plan.milestoneTasks.append(info.milestoneNameTask)
+
+        devTasks: Tasks = Tasks([task for task in projectTree.tasks if task.parent_id is not None])
+
+        self._planIssues(plan=plan, tasksToClone=info.tasksToClone, existingTasks=devTasks)
+        self._estimateRequests(plan=plan, directCreations=len(plan.milestoneTasks), queuedTasks=0)
+
+        return plan
+
+    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: ProgressMonitor) -> str:
         """
         Implement empty method from parent;
         Gets a project ID from the repo name
@@ -85,6 +127,7 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
         Returns:  An appropriate parent ID for newly created tasks
         """
         self._projectDictionary = self._getCurrentProjects()
+        progressCb.raiseIfCancelled()
 
         justRepoName: str = info.repositoryTask.split('/')[1]
         projectId:    str = self._getProjectId(projectName=ProjectName(justRepoName), projectDictionary=self._projectDictionary)
@@ -93,7 +136,13 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
 
         return projectId
 
-    def _getMilestoneTaskItem(self, projectId: str, milestoneName: str, progressCb: Callable) -> Task:
+    def _issueTaskScope(self) -> IssueTaskScope:
+        """
+        The project follows from the issue's repository, not from the preferences
+        """
+        return IssueTaskMap.scope(strategyName=self.__class__.__name__, projectName='')
+
+    def _getMilestoneTaskItem(self, projectId: str, milestoneName: str, progressCb: ProgressMonitor) -> Task:
         """
         Has the side effect that it sets self._devTasks
 
@@ -106,7 +155,7 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
         """
         todoist: TodoistAPI = self._todoist
         projectTasks   = self._getProjectTaskItems(projectId=projectId)
-        self._devTasks = projectTasks.devTasks
+        self._setDevTasks(projectTasks.devTasks)
 
         milestoneTask:  Task  = cast(Task, None)
         mileStoneTasks: Tasks = projectTasks.mileStoneTasks
@@ -118,6 +167,7 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
                 break
         # if none found create new one
         if milestoneTask is None:
+            progressCb.raiseIfCancelled()
             # milestoneTaskItem = todoist.items.add(milestoneNameTask, project_id=projectId)
             milestoneTask = todoist.add_task(project_id=projectId, content=milestoneName)
             msg: str = f'Added milestone: {milestoneTask}'
@@ -137,10 +187,7 @@ class TodoistCreateByRepository(AbstractTodoistStrategy):
         potential child tasks whose parents are one of the milestone tasks
         """
 
-        todoist:   TodoistAPI  = self._todoist
-
-        # TODO:  Get tasks associated with the project
-        tasks: List[Task] = todoist.get_tasks(project_id=projectId)
+        tasks: Tasks = self._loadProjectTree(projectId=projectId).tasks
         mileStoneTasks: Tasks = tasksFactory()
         devTasks:       Tasks = tasksFactory()
 
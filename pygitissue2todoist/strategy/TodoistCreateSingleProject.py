@@ -1,7 +1,6 @@
 
-from typing import cast
 from typing import List
-from typing import Callable
+from typing import Optional
 
 from logging import Logger
 from logging import getLogger
@@ -9,12 +8,18 @@ from logging import getLogger
 from todoist_api_python.api import TodoistAPI
 from todoist_api_python.models import Task
 
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
 from pygitissue2todoist.strategy.AbstractTodoistStrategy import Tasks
 
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
 from pygitissue2todoist.strategy.AbstractTodoistStrategy import AbstractTodoistStrategy
-from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskNameMap
+from pygitissue2todoist.strategy.TodoistProjectTree import TodoistProjectTree
+from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectDictionary
+from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectName
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 
 
 class TodoistCreateSingleProject(AbstractTodoistStrategy):
@@ -31,7 +36,7 @@ class TodoistCreateSingleProject(AbstractTodoistStrategy):
         super().__init__()
         self.logger: Logger = getLogger(__name__)
 
-    def createTasks(self, info: CloneInformation, progressCb: Callable):
+    def createTasks(self, info: CloneInformation, progressCb: ProgressMonitor):
         """
         Abstract method;  Subclass must implement
         Args:
@@ -42,13 +47,56 @@ class TodoistCreateSingleProject(AbstractTodoistStrategy):
 
         progressCb('Starting')
 
+        remaining: Optional[CloneInformation] = self._remainingCloneInformation(info=info, progressCb=progressCb)
+        if remaining is None:
+            return
+        info = remaining
+
         projectId: str = self._determineTopLevelProjectId(info, progressCb)
 
         self._createTasksInParentProject(info, progressCb, projectId)
 
         self._synchronize(progressCb=progressCb)
 
-    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: Callable) -> str:
+    def planTasks(self, info: CloneInformation) -> TodoistPlan:
+        """
+        The repository task at the top level of the single project, the milestone task under it
+
+        Args:
+            info:  The cloned information
+
+        Returns:  What createTasks would do
+        """
+        self._refreshSnapshot()
+
+        projectName: ProjectName       = ProjectName(self._preferences.todoistProjectName)
+        projects:    ProjectDictionary = self._snapshotProjects()
+
+        plan: TodoistPlan = TodoistPlan(projectName=projectName, createProject=projectName not in projects, fromSnapshot=self._hasSnapshot())
+
+        projectId:   Optional[str]      = None if plan.createProject is True else projects[projectName].id
+        projectTree: TodoistProjectTree = self._snapshotTree(projectId=projectId)
+
+        justRepoName:  str            = info.repositoryTask.split('/')[1]
+        repoTask:      Optional[Task] = projectTree.findChild(name=justRepoName)
+        milestoneTask: Optional[Task] = None
+        if repoTask is None:
+            plan.repositoryTasks.append(justRepoName)
+        else:
+            milestoneTask = projectTree.findChild(name=info.milestoneNameTask, parentId=TaskId(repoTask.id))
+
+        subTasks: Tasks = Tasks([])
+        if milestoneTask is None:
+            plan.milestoneTasks.append(info.milestoneNameTask)
+        else:
+            subTasks = projectTree.children(parentId=TaskId(milestoneTask.id))
+
+        self._planIssues(plan=plan, tasksToClone=info.tasksToClone, existingTasks=subTasks)
+        self._estimateRequests(plan=plan, directCreations=len(plan.repositoryTasks) + len(plan.milestoneTasks), queuedTasks=0)
+
+        return plan
+
+    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: ProgressMonitor) -> str:
         """
         Implement abstract method from parent;
         Gets a project ID for the user specified project
@@ -64,31 +112,37 @@ class TodoistCreateSingleProject(AbstractTodoistStrategy):
 
     def _createTasksInParentProject(self, info, progressCb, projectId):
         """
+        Loads the project's tasks once;  The repository, milestone and issue lookups all
+        read the same tree
 
         Args:
             info:
             progressCb:
             projectId:
         """
-        tasks:     List[GitIssueInfo] = info.tasksToClone
-
-        justRepoName:      str  = info.repositoryTask.split('/')[1]
-        repoTaskId:        str  = self._getIdForRepoName(projectId=projectId, repoName=justRepoName)
-        milestoneTaskItem: Task = self._createMileStoneTaskUnderRepoTask(projectId=projectId,
-                                                                         repoTaskId=repoTaskId,
-                                                                         milestoneName=info.milestoneNameTask,
-                                                                         progressCb=progressCb)
-
-        milestoneId: str = milestoneTaskItem.id
-        self._devTasks = self._findAllSubTasksOfMilestoneTask(projectId=projectId, milestoneId=milestoneId)
+        tasks:       List[GitIssueInfo] = info.tasksToClone
+        projectTree: TodoistProjectTree = self._loadProjectTree(projectId=projectId)
+        progressCb.raiseIfCancelled()
+
+        justRepoName:      str    = info.repositoryTask.split('/')[1]
+        repoTaskId:        TaskId = self._getIdForRepoName(projectTree=projectTree, repoName=justRepoName)
+        milestoneTaskItem: Task   = self._createMileStoneTaskUnderRepoTask(projectTree=projectTree,
+                                                                           repoTaskId=repoTaskId,
+                                                                           milestoneName=info.milestoneNameTask,
+                                                                           progressCb=progressCb)
+
+        milestoneId: TaskId = TaskId(milestoneTaskItem.id)
+        self._setDevTasks(self._findAllSubTasksOfMilestoneTask(projectTree=projectTree, milestoneId=milestoneId))
         for taskInfo in tasks:
-            self._createTaskItem(gitIssueInfo=taskInfo, projectId=projectId, parentTaskItem=milestoneTaskItem, progressCb=progressCb)
+            self._createTaskItem(gitIssueInfo=taskInfo, projectId=projectId, parentId=milestoneId, progressCb=progressCb)
+
+        self._flushTasks(progressCb)
 
-    def _createMileStoneTaskUnderRepoTask(self, projectId: str, repoTaskId: str, milestoneName: str, progressCb: Callable) -> Task:
+    def _createMileStoneTaskUnderRepoTask(self, projectTree: TodoistProjectTree, repoTaskId: TaskId, milestoneName: str, progressCb: ProgressMonitor) -> Task:
         """
 
         Args:
-            projectId:      The id of the parent project
+            projectTree:    The parent project's tasks;  A new milestone task is added to it
             repoTaskId:     The id of the repo task under parent project
             milestoneName:  The milestone name under the repo task;
             progressCb:     The callback to report status to
@@ -98,49 +152,40 @@ class TodoistCreateSingleProject(AbstractTodoistStrategy):
         progressCb(f'Retrieving milestone task: {milestoneName}')
         todoist: TodoistAPI = self._todoist
 
-        tasks = self._todoist.get_tasks(project_id=projectId)
-
-        itemNames: TaskNameMap = self._createTaskNameMap(tasks=tasks)
+        milestoneTask: Optional[Task] = projectTree.findChild(name=milestoneName, parentId=repoTaskId)
 
-        if milestoneName in itemNames:
-            singleItemList: List = [x for x in tasks if x.content == milestoneName]
+        if milestoneTask is not None:
             msg: str = f'Using existing milestone: {milestoneName}'
             progressCb(msg)
-            milestoneTask: Task = singleItemList[0]
             self.logger.info(msg)
         else:
+            progressCb.raiseIfCancelled()
+            projectId:        str = projectTree.projectId
             debugDescription: str = f"{projectId=} {repoTaskId=}"
             milestoneTask = todoist.add_task(project_id=projectId,
                                              parent_id=repoTaskId,
                                              content=milestoneName,
                                              description=debugDescription)
+            projectTree.add(milestoneTask)
             msg = f'Added milestone: {milestoneName}'
             progressCb(msg)
             self.logger.info(msg)
 
         return milestoneTask
 
-    def _findAllSubTasksOfMilestoneTask(self, projectId: str, milestoneId: str) -> Tasks:
+    def _findAllSubTasksOfMilestoneTask(self, projectTree: TodoistProjectTree, milestoneId: TaskId) -> Tasks:
         """
 
         Args:
-            projectId:  The id of the parent task where all GitHub tasks reside
+            projectTree:    The tasks of the project where all GitHub tasks reside
             milestoneId:    The milestone task id
 
         Returns:
             The list of subtasks that are leaf tasks end of the projectId->repoTaskId->milestoneId task branch
         """
-        subTasks: Tasks = Tasks([])
-
-        todoist:   TodoistAPI  = self._todoist
-
-        tasks = todoist.get_tasks(project_id=projectId)
+        subTasks: Tasks = projectTree.children(parentId=milestoneId)
 
-        for item in tasks:
-            task: Task = cast(Task, item)
-            parentId: str = task.parent_id  # type: ignore
-            self.logger.debug(f'{task.content=}  {task.id=} {parentId=}')
-            if parentId == milestoneId:
-                subTasks.append(item)
+        for task in subTasks:
+            self.logger.debug(f'{task.content=}  {task.id=} {task.parent_id=}')
 
         return subTasks
@@ -1,13 +1,13 @@
 
-from typing import Callable
-
 from logging import Logger
 from logging import getLogger
 
 from pygitissue2todoist.strategy.TodoistOwnerIssues import TodoistOwnerIssues
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 
 from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
 
 from pygitissue2todoist.strategy.ITodoistCreationStrategy import ITodoistCreationStrategy
 from pygitissue2todoist.strategy.TodoistCreateByRepository import TodoistCreateByRepository
@@ -30,5 +30,8 @@ class TodoistCreation:
         else:
             assert False, 'Unknown task creation strategy'
 
-    def createTasks(self, info: CloneInformation, progressCb: Callable):
+    def createTasks(self, info: CloneInformation, progressCb: ProgressMonitor):
         self._taskCreationStrategy.createTasks(info=info, progressCb=progressCb)
+
+    def planTasks(self, info: CloneInformation) -> TodoistPlan:
+        return self._taskCreationStrategy.planTasks(info=info)
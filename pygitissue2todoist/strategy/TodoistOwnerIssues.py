@@ -1,29 +1,30 @@
 
 from logging import Logger
 from logging import getLogger
-from typing import Callable
 from typing import Dict
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import cast
 
-from todoist_api_python.api import TodoistAPI
 from todoist_api_python.models import Task
 
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+
 from pygitissue2todoist.strategy.AbstractTodoistStrategy import AbstractTodoistStrategy
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import ParentId
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectDictionary
+from pygitissue2todoist.strategy.TodoistStrategyTypes import ProjectName
 from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskName
-from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskNameMap
-from pygitissue2todoist.strategy.TodoistStrategyTypes import Tasks
-
-RepositoryId = NewType('RepositoryId', str)
-
-TaskList   = List[Task]
-SubTaskMap = NewType('SubTaskMap',  Dict[TaskName, TaskId])
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+from pygitissue2todoist.strategy.TodoistProjectTree import TodoistProjectTree
 
 RepositoryName           = NewType('RepositoryName', str)
+IssuesBySlug             = NewType('IssuesBySlug', Dict[str, List[GitIssueInfo]])
 
 
 class TodoistOwnerIssues(AbstractTodoistStrategy):
@@ -36,73 +37,123 @@ class TodoistOwnerIssues(AbstractTodoistStrategy):
         super().__init__()
         self.logger: Logger = getLogger(__name__)
 
-        self._repositoryTaskMap: TaskNameMap = cast(TaskNameMap, None)
-
-    def createTasks(self, info: CloneInformation, progressCb: Callable):
+    def createTasks(self, info: CloneInformation, progressCb: ProgressMonitor):
 
         self._infoLogCloneInformation(info=info, progressCb=progressCb)
 
         progressCb('Starting')
 
+        remaining: Optional[CloneInformation] = self._remainingCloneInformation(info=info, progressCb=progressCb)
+        if remaining is None:
+            return
+        info = remaining
+
         projectId: str = self._determineTopLevelProjectId(info, progressCb)
 
         self._createProjectTasksInTopLevelProject(info=info, progressCb=progressCb, projectId=projectId)
 
-    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: Callable) -> str:
+    def planTasks(self, info: CloneInformation) -> TodoistPlan:
+        """
+        A repository task per slug at the top level of the single project
+
+        Args:
+            info:  The cloned information
+
+        Returns:  What createTasks would do
+        """
+        self._refreshSnapshot()
+
+        projectName: ProjectName       = ProjectName(self._preferences.todoistProjectName)
+        projects:    ProjectDictionary = self._snapshotProjects()
+
+        plan: TodoistPlan = TodoistPlan(projectName=projectName, createProject=projectName not in projects, fromSnapshot=self._hasSnapshot())
+
+        projectId:   Optional[str]      = None if plan.createProject is True else projects[projectName].id
+        projectTree: TodoistProjectTree = self._snapshotTree(projectId=projectId)
+
+        for slug in self._groupBySlug(info.tasksToClone).keys():
+            justRepoName: str = slug.split('/')[1]
+            if projectTree.findChild(name=justRepoName) is None and justRepoName not in plan.repositoryTasks:
+                plan.repositoryTasks.append(justRepoName)
+
+        self._planIssues(plan=plan, tasksToClone=info.tasksToClone, existingTasks=projectTree.tasks)
+        self._estimateRequests(plan=plan, directCreations=0, queuedTasks=len(plan.repositoryTasks))
+
+        return plan
+
+    def _determineTopLevelProjectId(self, info: CloneInformation, progressCb: ProgressMonitor) -> str:
 
         projectId: str = self._getProjectIdOfSingleProjectName(progressCb=progressCb)
         return projectId
 
-    def _createProjectTasksInTopLevelProject(self, info, progressCb: Callable, projectId: str):
+    def _createProjectTasksInTopLevelProject(self, info, progressCb: ProgressMonitor, projectId: str):
         """
+        The project's tasks are loaded once;  Each repository task is resolved once and
+        queued together with its issues
 
         Args:
             info:
             progressCb:
             projectId:
         """
-
-        self._devTasks = Tasks(self._todoist.get_tasks(project_id=projectId))
+        projectTree: TodoistProjectTree = self._loadProjectTree(projectId=projectId)
         # This includes all the repository tasks and repository subtasks (ugh)
         #
-        self._repositoryTaskMap = self._createTaskNameMap(tasks=self._devTasks)
-        #
-        # Iterate through all the clone issues
-        #
-        cloneIssues: List[GitIssueInfo] = info.tasksToClone
+        self._setDevTasks(projectTree.tasks)
+
+        queuedRepositoryTasks: Dict[TaskName, TempId] = {}
+        for slug, gitIssueInfos in self._groupBySlug(info.tasksToClone).items():
+
+            justRepoName: TaskName = TaskName(slug.split('/')[1])
+            parentId:     ParentId = self._getRepositoryTaskId(projectTree=projectTree,
+                                                               repoName=justRepoName,
+                                                               queuedRepositoryTasks=queuedRepositoryTasks,
+                                                               progressCb=progressCb)
+            for gitIssueInfo in gitIssueInfos:
+                self._createTaskItem(gitIssueInfo=gitIssueInfo, projectId=projectId, parentId=parentId, progressCb=progressCb)
+
+        self._flushTasks(progressCb)
+
+    def _groupBySlug(self, cloneIssues: List[GitIssueInfo]) -> IssuesBySlug:
+        """
+        Args:
+            cloneIssues:    The issues to clone, in any repository order
+
+        Returns:  The issues of each repository;  In the order the repositories first appear
+        """
+        issuesBySlug: IssuesBySlug = IssuesBySlug({})
         for cloneIssue in cloneIssues:
             gitIssueInfo: GitIssueInfo = cast(GitIssueInfo, cloneIssue)
-            justRepoName: str          = gitIssueInfo.slug.split('/')[1]
-            todoist:      TodoistAPI   = self._todoist
-            #
-            # Do not recreate the repository task if it already exists
-            #
-            if justRepoName in self._repositoryTaskMap.keys():
-                repoId: str = self._repositoryTaskMap[TaskName(justRepoName)]
-                progressCb(f'Found existing repository task: {justRepoName}')
-                repoTask: Task = todoist.get_task(task_id=repoId)
-            else:
-                repoTask = todoist.add_task(project_id=projectId, content=justRepoName, description='Repository task created by PyGitIssue2Todoist')
-                progressCb(f'Created new repository task: {justRepoName}')
-                #
-                # Since we created a new repository task put it in the name map
-                #
-                self._repositoryTaskMap[TaskName(repoTask.content)] = TaskId(repoTask.id)
-
-            self._createTaskItem(
-                gitIssueInfo=gitIssueInfo,
-                projectId=projectId,
-                parentTaskItem=repoTask,
-                progressCb=progressCb
-            )
-
-    def _getRepositorySubTasks(self, repoId: RepositoryId, projectTopLevelTasks: TaskList) -> SubTaskMap:
-
-        subTaskMap: SubTaskMap = SubTaskMap({})
-        for t in projectTopLevelTasks:
-            task: Task = cast(Task, t)
-            if task.parent_id == repoId:
-                self.logger.info(f'Task {task.content} exists')
-                subTaskMap[TaskName(task.content)] = TaskId(task.id)
-
-        return subTaskMap
+            issuesBySlug.setdefault(gitIssueInfo.slug, []).append(gitIssueInfo)
+
+        return issuesBySlug
+
+    def _getRepositoryTaskId(self, projectTree: TodoistProjectTree, repoName: TaskName, queuedRepositoryTasks: Dict[TaskName, TempId],
+                             progressCb: ProgressMonitor) -> ParentId:
+        """
+        Do not recreate the repository task if it already exists or is already queued
+
+        Args:
+            projectTree:            The project's tasks
+            repoName:               The repository name without its owner
+            queuedRepositoryTasks:  The repository tasks queued during this run
+            progressCb:             Progress callback
+
+        Returns:  The id of the repository task;  A temporary id if it is queued
+        """
+        if repoName in queuedRepositoryTasks:
+            return queuedRepositoryTasks[repoName]
+
+        repoTask: Optional[Task] = projectTree.findChild(name=repoName)
+        if repoTask is not None:
+            progressCb(f'Found existing repository task: {repoName}')
+            return TaskId(repoTask.id)
+        #
+        # Queue the repository task;  Its issues refer to it by its temporary id
+        #
+        tempId: TempId = self._taskWriter.addTask(projectId=projectTree.projectId, content=repoName, description='Repository task created by PyGitIssue2Todoist')
+        progressCb(f'Queued new repository task: {repoName}')
+
+        queuedRepositoryTasks[repoName] = tempId
+
+        return tempId
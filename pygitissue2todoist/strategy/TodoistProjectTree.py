@@ -0,0 +1,98 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskName
+from pygitissue2todoist.strategy.TodoistStrategyTypes import Tasks
+
+#
+# Top level tasks have no parent
+#
+ROOT_ID: Optional[TaskId] = None
+
+
+class TodoistProjectTree:
+    """
+    An in memory copy of a project's task hierarchy.  Load it once from a single `get_tasks`
+    call;  Afterwards the strategies ask it for repository, milestone and issue tasks and
+    `add` the tasks they create, so it never goes stale during a run
+    """
+    def __init__(self, projectId: str, tasks: Iterable[Task]):
+        """
+
+        Args:
+            projectId:  The project the tasks belong to
+            tasks:      All the project's tasks
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._projectId: str = projectId
+
+        self._tasks:    Dict[TaskId, Task]                              = {}
+        self._children: Dict[Optional[TaskId], List[TaskId]]            = {}
+        self._byName:   Dict[Optional[TaskId], Dict[TaskName, TaskId]]  = {}
+
+        for task in tasks:
+            self.add(task)
+
+        self.logger.debug(f'Project {projectId} has {len(self._tasks)} tasks')
+
+    @property
+    def projectId(self) -> str:
+        return self._projectId
+
+    def add(self, task: Task):
+        """
+        Place a new task in the tree
+
+        Args:
+            task:   A task of this project
+        """
+        taskId:   TaskId           = TaskId(task.id)
+        parentId: Optional[TaskId] = None if task.parent_id is None else TaskId(task.parent_id)
+
+        self._tasks[taskId] = task
+        self._children.setdefault(parentId, []).append(taskId)
+        # The first task with a name wins, as Todoist lists them in order
+        self._byName.setdefault(parentId, {}).setdefault(TaskName(task.content), taskId)
+
+    @property
+    def tasks(self) -> Tasks:
+        return Tasks(list(self._tasks.values()))
+
+    def task(self, taskId: TaskId) -> Task:
+        return self._tasks[taskId]
+
+    def children(self, parentId: Optional[TaskId] = ROOT_ID) -> Tasks:
+        """
+        Args:
+            parentId:   A task id;  Omit for the top level tasks
+
+        Returns:  The direct sub-tasks
+        """
+        return Tasks([self._tasks[taskId] for taskId in self._children.get(parentId, [])])
+
+    def findChild(self, name: str, parentId: Optional[TaskId] = ROOT_ID) -> Optional[Task]:
+        """
+        Args:
+            name:       The task name
+            parentId:   The parent task id;  Omit to search the top level tasks
+
+        Returns:  The sub-task with this name;  None if there is none
+        """
+        taskId: Optional[TaskId] = self._byName.get(parentId, {}).get(TaskName(name))
+        if taskId is None:
+            return None
+
+        return self._tasks[taskId]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
@@ -0,0 +1,288 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from hashlib import sha256
+
+from json import JSONDecodeError
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from requests import HTTPError
+from requests import Session
+
+from todoist_api_python.endpoints import get_sync_url
+from todoist_api_python.http_requests import post
+
+from todoist_api_python.models import Comment
+from todoist_api_python.models import Project
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.strategy.TodoistStrategyTypes import Tasks
+
+TODOIST_REPLICA_DIRECTORY_NAME: str = '.todoist-sync'
+
+FULL_SYNC_TOKEN: str       = '*'
+RESOURCE_TYPES:  List[str] = ['projects', 'items', 'notes']
+REPLICA_VERSION: int       = 1
+
+ReplicaRecord = Dict[str, Any]
+RecordStore   = Dict[str, ReplicaRecord]
+
+
+def todoistCacheDirectory() -> Path:
+    """
+    Returns:  Where the local Todoist state is kept
+    """
+    return Path.home() / TODOIST_REPLICA_DIRECTORY_NAME
+
+
+def todoistAccountKey(apiToken: str) -> str:
+    """
+    Args:
+        apiToken:   The Todoist API token
+
+    Returns:  A file name safe key per Todoist account;  The token itself is never written down
+    """
+    return sha256(apiToken.encode('utf-8')).hexdigest()[:16]
+
+
+class TodoistReplica:
+    """
+    A local copy of the user's Todoist projects, active tasks and task comments.  The first
+    refresh downloads everything;  Later ones send the stored Sync API token and only apply
+    what changed since, so a run costs one small request instead of a get_projects and a
+    get_tasks per project.
+
+    The copy is a JSON file per Todoist account in the `.todoist-sync` directory.  A file that
+    cannot be read, or a sync token that Todoist no longer accepts, costs one full sync;
+    Deleting the directory is always safe
+    """
+    def __init__(self, apiToken: str, replicaDirectory: Optional[Path] = None, session: Optional[Session] = None):
+        """
+
+        Args:
+            apiToken:           The Todoist API token
+            replicaDirectory:   Where the copy is kept;  Defaults to ~/.todoist-sync
+            session:            Lets callers share connections;  By default the replica has its own
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if replicaDirectory is None:
+            replicaDirectory = todoistCacheDirectory()
+
+        self._apiToken:    str     = apiToken
+        self._session:     Session = Session() if session is None else session
+        self._replicaPath: Path    = replicaDirectory / f'replica-{todoistAccountKey(apiToken)}.json'
+
+        self._syncToken: str         = FULL_SYNC_TOKEN
+        self._projects:  RecordStore = {}
+        self._items:     RecordStore = {}
+        self._notes:     RecordStore = {}
+
+        self._deletedTaskIds: List[str] = []
+
+        self._load()
+
+    @property
+    def isEmpty(self) -> bool:
+        return self._syncToken == FULL_SYNC_TOKEN
+
+    @property
+    def deletedTaskIds(self) -> List[str]:
+        """
+        Returns:  The tasks the last refresh reported as deleted;  A full sync does not report any
+        """
+        return self._deletedTaskIds
+
+    def refresh(self):
+        """
+        Bring the copy up to date and save it
+
+        Raises:
+            HTTPError:  When Todoist rejects a full sync
+        """
+        try:
+            response: Dict[str, Any] = self._sync(syncToken=self._syncToken)
+        except HTTPError as e:
+            if self._syncToken == FULL_SYNC_TOKEN:
+                raise
+            self.logger.warning(f'Todoist rejected the stored sync token;  Doing a full sync: {e}')
+            response = self._sync(syncToken=FULL_SYNC_TOKEN)
+
+        if response.get('full_sync', False) is True:
+            self._projects = {}
+            self._items    = {}
+            self._notes    = {}
+
+        self._apply(store=self._projects, records=response.get('projects', []))
+        self._apply(store=self._items,    records=response.get('items', []))
+        self._deletedTaskIds = [str(record['id']) for record in response.get('items', []) if record.get('is_deleted', False) is True]
+        self._apply(store=self._notes,    records=response.get('notes', []))
+
+        self._syncToken = response['sync_token']
+
+        self.logger.info(f'Todoist replica: {len(self._projects)} projects, {len(self._items)} tasks, {len(self._notes)} comments')
+        self._save()
+
+    def addItems(self, items: List[ReplicaRecord]):
+        """
+        Add tasks created since the last refresh, so that the copy has them before the next one.
+        The next refresh reports them again and replaces them
+
+        Args:
+            items:  Sync API item records
+        """
+        self._apply(store=self._items, records=items)
+        self._save()
+
+    def projects(self) -> List[Project]:
+        return [self._toProject(record) for record in self._projects.values()]
+
+    def tasks(self, projectId: str) -> Tasks:
+        """
+        Args:
+            projectId:  The project
+
+        Returns:  The project's active tasks, as get_tasks would return them
+        """
+        return Tasks([self._toTask(record) for record in self._items.values() if record['project_id'] == projectId])
+
+    def hasTask(self, taskId: str) -> bool:
+        """
+        Args:
+            taskId:  A task id
+
+        Returns:  `True` if the task is active;  Deleted and completed tasks have left the copy
+        """
+        return taskId in self._items
+
+    def comments(self, tasks: Iterable[Task]) -> List[Comment]:
+        """
+        Args:
+            tasks:  Some tasks
+
+        Returns:  The comments on those tasks
+        """
+        taskIds: Set[str] = {task.id for task in tasks}
+
+        return [self._toComment(record) for record in self._notes.values() if record.get('item_id') in taskIds]
+
+    def _sync(self, syncToken: str) -> Dict[str, Any]:
+
+        return post(self._session, get_sync_url('sync'), self._apiToken, data={'sync_token': syncToken, 'resource_types': RESOURCE_TYPES})
+
+    def _apply(self, store: RecordStore, records: List[ReplicaRecord]):
+        """
+        Deleted records and completed tasks leave the copy;  Everything else is replaced
+        """
+        for record in records:
+            recordId: str = str(record['id'])
+            if record.get('is_deleted', False) is True or record.get('checked', False) is True or record.get('is_archived', False) is True:
+                store.pop(recordId, None)
+            else:
+                store[recordId] = record
+
+    def _load(self):
+
+        try:
+            replica: Dict[str, Any] = jsonLoads(self._replicaPath.read_text())
+            if replica['version'] != REPLICA_VERSION:
+                raise ValueError(f'Unknown version {replica["version"]}')
+
+            projects:  RecordStore = replica['projects']
+            items:     RecordStore = replica['items']
+            notes:     RecordStore = replica['notes']
+            syncToken: str         = replica['syncToken']
+        except FileNotFoundError:
+            return
+        except (JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f'Ignoring damaged Todoist replica {self._replicaPath}: {e}')
+            return
+
+        self._projects  = projects
+        self._items     = items
+        self._notes     = notes
+        self._syncToken = syncToken
+
+    def _save(self):
+
+        replica: Dict[str, Any] = {
+            'version':   REPLICA_VERSION,
+            'syncToken': self._syncToken,
+            'projects':  self._projects,
+            'items':     self._items,
+            'notes':     self._notes,
+        }
+        #
+        # Write a sibling and swap it in, so that a crash never leaves half a file behind
+        #
+        self._replicaPath.parent.mkdir(parents=True, exist_ok=True)
+
+        temporaryPath: Path = self._replicaPath.with_suffix('.tmp')
+        temporaryPath.write_text(jsonDumps(replica))
+        temporaryPath.replace(self._replicaPath)
+
+    def _toProject(self, record: ReplicaRecord) -> Project:
+
+        return Project.from_dict({
+            'color':            record.get('color', ''),
+            'comment_count':    0,
+            'id':               str(record['id']),
+            'is_favorite':      record.get('is_favorite', False),
+            'is_inbox_project': record.get('inbox_project'),
+            'is_shared':        record.get('shared', False),
+            'is_team_inbox':    record.get('team_inbox'),
+            'can_assign_tasks': record.get('can_assign_tasks'),
+            'name':             record['name'],
+            'order':            record.get('child_order', 0),
+            'parent_id':        record.get('parent_id'),
+            'url':              f'https://todoist.com/showProject?id={record["id"]}',
+            'view_style':       record.get('view_style', 'list'),
+        })
+
+    def _toTask(self, record: ReplicaRecord) -> Task:
+
+        due: Optional[Dict[str, Any]] = record.get('due')
+        if due is not None:
+            due = {**due, 'is_recurring': due.get('is_recurring', False), 'string': due.get('string', '')}
+
+        return Task.from_dict({
+            'assignee_id':   record.get('responsible_uid'),
+            'assigner_id':   record.get('assigned_by_uid'),
+            'comment_count': 0,
+            'is_completed':  False,
+            'content':       record['content'],
+            'created_at':    record.get('added_at', ''),
+            'creator_id':    record.get('added_by_uid', ''),
+            'description':   record.get('description', ''),
+            'due':           due,
+            'id':            str(record['id']),
+            'labels':        record.get('labels', []),
+            'order':         record.get('child_order', 0),
+            'parent_id':     record.get('parent_id'),
+            'priority':      record.get('priority', 1),
+            'project_id':    record['project_id'],
+            'section_id':    record.get('section_id'),
+            'url':           f'https://todoist.com/showTask?id={record["id"]}',
+            'duration':      record.get('duration'),
+        })
+
+    def _toComment(self, record: ReplicaRecord) -> Comment:
+
+        return Comment.from_dict({
+            'content':    record['content'],
+            'id':         str(record['id']),
+            'posted_at':  record.get('posted_at', ''),
+            'project_id': None,
+            'task_id':    record.get('item_id'),
+        })
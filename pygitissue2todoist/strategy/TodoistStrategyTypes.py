@@ -2,6 +2,7 @@
 from typing import Dict
 from typing import List
 from typing import NewType
+from typing import Optional
 
 from dataclasses import dataclass
 from dataclasses import field
@@ -37,3 +38,73 @@ def tasksFactory() -> Tasks:
 TaskName     = NewType('TaskName',     str)
 TaskId       = NewType('TaskId',       str)
 TaskNameMap  = NewType('TaskNameMap',  Dict[TaskName, TaskId])
+
+TempId        = NewType('TempId',        str)
+TempIdMapping = NewType('TempIdMapping', Dict[TempId, TaskId])
+
+
+@dataclass
+class CreationResult:
+    """
+    The outcome of one queued task or comment
+    """
+    content:   str            = ''
+    isNote:    bool           = False
+    taskId:    Optional[str]  = None      # The created task or the task the comment belongs to
+    error:     str            = ''
+    errorCode: int            = -1        # Todoist's code, when Todoist rejected the creation
+    skipped:   bool           = False     # Not sent because the user cancelled or an earlier request failed
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error == '' and self.skipped is False
+
+
+CreationResults = NewType('CreationResults', List[CreationResult])
+
+
+def createNamesFactory() -> List[str]:
+    return []
+
+
+def createGitIssueInfosFactory() -> List[GitIssueInfo]:
+    return []
+
+
+@dataclass
+class TodoistPlan:
+    """
+    What creating the tasks would do, worked out from the local copy of Todoist
+    """
+    projectName:            str                = ''
+    createProject:          bool               = False
+    repositoryTasks:        List[str]          = field(default_factory=createNamesFactory)          # To create
+    milestoneTasks:         List[str]          = field(default_factory=createNamesFactory)          # To create
+    issuesToCreate:         List[GitIssueInfo] = field(default_factory=createGitIssueInfosFactory)
+    issuesToSkip:           List[GitIssueInfo] = field(default_factory=createGitIssueInfosFactory)
+    requestCount:           int                = 0
+    fromSnapshot:           bool               = True       # False when there was no local copy to plan against
+
+    @property
+    def hasWork(self) -> bool:
+        return self.createProject is True or len(self.repositoryTasks) > 0 or len(self.milestoneTasks) > 0 or len(self.issuesToCreate) > 0
+
+    def summary(self) -> List[str]:
+        """
+        Returns:  The plan as lines of text for the user
+        """
+        lines: List[str] = []
+        if self.createProject is True:
+            lines.append(f'Create project: {self.projectName}')
+        else:
+            lines.append(f'Use project: {self.projectName}')
+
+        lines.extend(f'Create repository task: {name}' for name in self.repositoryTasks)
+        lines.extend(f'Create milestone task: {name}' for name in self.milestoneTasks)
+
+        lines.append(f'Create {len(self.issuesToCreate)} issue tasks;  Skip {len(self.issuesToSkip)} already in Todoist')
+        lines.append(f'About {self.requestCount} Todoist requests')
+        if self.fromSnapshot is False:
+            lines.append('There is no local copy of Todoist yet;  Existing tasks are not accounted for')
+
+        return lines
@@ -0,0 +1,144 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Pattern
+
+from logging import Logger
+from logging import getLogger
+
+from re import IGNORECASE
+from re import compile as regExCompile
+
+from todoist_api_python.models import Comment
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.strategy.AbstractTodoistTaskWriter import ParentId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+
+#
+# A hyperlinked task name;  [Issue title](https://github.com/owner/repository/issues/42)
+#
+HYPERLINKED_NAME_PATTERN: Pattern = regExCompile(r'^\s*\[(?P<name>.*)\]\((?P<url>[^)\s]+)\)\s*$')
+ISSUE_URL_PATTERN:        Pattern = regExCompile(r'github\.com/(?P<owner>[^/\s]+)/(?P<repository>[^/\s]+)/(?:issues|pull)/(?P<number>\d+)', flags=IGNORECASE)
+
+
+class TodoistTaskIndex:
+    """
+    Answers "does this issue already have a Todoist task" without scanning the project's tasks.
+    Tasks are indexed once, by their normalized name and by the GitHub issue URL found in their
+    content, description or comments.  The URL survives an issue rename;  The name catches tasks
+    created without one, unless that task belongs to a different issue URL.
+
+    Lookups are exact;  An issue whose title is part of another issue's title is not a duplicate
+    """
+    def __init__(self, tasks: Optional[Iterable[Task]] = None):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._byName:     Dict[str, List[ParentId]] = {}
+        self._byURL:      Dict[str, ParentId]       = {}
+        self._issueKeyOf: Dict[ParentId, str]       = {}
+
+        if tasks is not None:
+            for task in tasks:
+                self.addTask(task)
+
+    @classmethod
+    def normalizeName(cls, name: str) -> str:
+        """
+        Args:
+            name:   A task name or issue title
+
+        Returns:  The name without the case or whitespace differences Todoist and GitHub introduce
+        """
+        return ' '.join(name.split()).casefold()
+
+    @classmethod
+    def issueKey(cls, text: str) -> Optional[str]:
+        """
+        Args:
+            text:   Text that may contain a GitHub issue URL
+
+        Returns:  'owner/repository#number' for the first issue URL in the text;  None if there is none
+        """
+        match = ISSUE_URL_PATTERN.search(text)
+        if match is None:
+            return None
+
+        return f'{match.group("owner")}/{match.group("repository")}#{match.group("number")}'.casefold()
+
+    def addTask(self, task: Task):
+        """
+        Index an existing Todoist task
+
+        Args:
+            task:   The task
+        """
+        self.add(taskId=TaskId(task.id), content=task.content, description=task.description)
+
+    def add(self, taskId: ParentId, content: str, description: str = ''):
+        """
+        Index a task;  Also used for queued tasks, so that an issue is not queued twice
+
+        Args:
+            taskId:         A Todoist task id or the temporary id of a queued task
+            content:        The task name;  May be hyperlinked
+            description:    The task description
+        """
+        name: str = content
+        match = HYPERLINKED_NAME_PATTERN.match(content)
+        if match is not None:
+            name = match.group('name')
+
+        self._byName.setdefault(self.normalizeName(name), []).append(taskId)
+
+        for text in (content, description):
+            self._addURL(taskId=taskId, text=text)
+
+    def addComments(self, comments: Iterable[Comment]):
+        """
+        Index the issue URLs kept in task comments
+
+        Args:
+            comments:   Comments of indexed tasks
+        """
+        for comment in comments:
+            if comment.task_id is not None:
+                self._addURL(taskId=TaskId(comment.task_id), text=comment.content)
+
+    def find(self, name: str, url: str = '') -> Optional[ParentId]:
+        """
+        Args:
+            name:   The issue title
+            url:    The issue URL
+
+        Returns:  The id of the task for this issue;  None if there is none
+        """
+        issueKey: Optional[str] = self.issueKey(url)
+        if issueKey is not None and issueKey in self._byURL:
+            return self._byURL[issueKey]
+
+        for taskId in self._byName.get(self.normalizeName(name), []):
+            # A task with the same name for some other issue is not this issue's task
+            if issueKey is None or self._issueKeyOf.get(taskId, issueKey) == issueKey:
+                return taskId
+
+        return None
+
+    def contains(self, name: str, url: str = '') -> bool:
+        return self.find(name=name, url=url) is not None
+
+    def __len__(self) -> int:
+        return sum(len(taskIds) for taskIds in self._byName.values())
+
+    def _addURL(self, taskId: ParentId, text: Optional[str]):
+
+        if text is None or text == '':
+            return
+
+        issueKey: Optional[str] = self.issueKey(text)
+        if issueKey is not None:
+            self._byURL.setdefault(issueKey, taskId)
+            self._issueKeyOf.setdefault(taskId, issueKey)
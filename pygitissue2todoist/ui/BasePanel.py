@@ -8,11 +8,14 @@ from wx import SYS_COLOUR_BACKGROUND
 from wx import SYS_COLOUR_LISTBOXTEXT
 
 from wx import Colour
+from wx import ProgressDialog
 from wx import Window
 from wx import SystemSettings
 
 from wx.lib.sized_controls import SizedPanel
 
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
 
 class MyMetaBasePanel(ABCMeta, type(SizedPanel)):        # type: ignore
     """
@@ -33,6 +36,10 @@ class BasePanel(SizedPanel):
     RESOURCES_PATH:         str = f'pygitissue2todoist{osSep}resources'
 
     RESOURCE_ENV_VAR:       str = 'RESOURCEPATH'
+    #
+    # A progress dialog at its maximum considers itself done;  Only the panel closes it
+    #
+    PROGRESS_DIALOG_MAXIMUM: int = 100
 
     def __init__(self, parent: Window):
 
@@ -50,6 +57,24 @@ class BasePanel(SizedPanel):
         """
         pass
 
+    def _showProgress(self, progressDlg: ProgressDialog, report: ProgressReport) -> bool:
+        """
+        A gauge for a phase with a known total;  A pulse otherwise
+
+        Args:
+            progressDlg:    A dialog created with `PROGRESS_DIALOG_MAXIMUM`
+            report:         The latest report
+
+        Returns:  False when the user pressed the dialog's Cancel button
+        """
+        if report.isDeterminate is True:
+            value: int = min(report.percent, BasePanel.PROGRESS_DIALOG_MAXIMUM - 1)
+            keepGoing, _ = progressDlg.Update(value, report.describe())
+        else:
+            keepGoing, _ = progressDlg.Pulse(report.describe())
+
+        return keepGoing
+
     @property
     def backgroundColor(self) -> Colour:
         return self._bkColor
@@ -1,5 +1,6 @@
 
 from typing import List
+from typing import Optional
 from typing import cast
 
 from logging import Logger
@@ -8,11 +9,17 @@ from logging import getLogger
 from wx import EVT_BUTTON
 
 from wx import ICON_ERROR
+from wx import ICON_INFORMATION
+from wx import ICON_QUESTION
+from wx import ID_YES
 from wx import ID_ANY
 from wx import LB_ALWAYS_SB
 from wx import LB_OWNERDRAW
 from wx import OK
+from wx import PD_CAN_ABORT
 from wx import PD_ELAPSED_TIME
+from wx import YES_DEFAULT
+from wx import YES_NO
 
 from wx import MessageDialog
 from wx import Button
@@ -22,7 +29,7 @@ from wx import CommandEvent
 from wx import ListBox
 from wx import STAY_ON_TOP
 
-from wx import Yield as wxYield
+from wx import CallAfter as wxCallAfter
 
 from wx.lib.sized_controls import SizedPanel
 from wx.lib.sized_controls import SizedStaticBox
@@ -38,10 +45,16 @@ from pygitissue2todoist.adapters.AdapterAuthenticationError import AdapterAuthen
 from pygitissue2todoist.strategy.TodoistCreation import TodoistCreation
 from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
 
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJob
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJobExecutor
+from pygitissue2todoist.general.BackgroundJobExecutor import JobContext
 from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
 
 from pygitissue2todoist.general.exceptions.NoteCreationError import NoteCreationError
+from pygitissue2todoist.general.exceptions.OperationCancelledError import OperationCancelledError
 from pygitissue2todoist.general.exceptions.TaskCreationError import TaskCreationError
 
 
@@ -74,7 +87,10 @@ class TodoistPanel(BasePanel):
         self._preferences: Preferences = Preferences()
         self._apiToken:    str         = self._preferences.todoistAPIToken
 
-        self._todoistCreation: TodoistCreation = TodoistCreation()
+        self._todoistCreation: TodoistCreation         = TodoistCreation()
+        self._jobExecutor:     BackgroundJobExecutor   = BackgroundJobExecutor(dispatcher=wxCallAfter, name='TodoistJobs')
+        self._creationJob:     Optional[BackgroundJob] = None
+        self._progressLog:     List[str]               = []
 
         self._taskList:         ListBox = cast(ListBox, None)
         self._createTaskButton: Button  = cast(Button, None)
@@ -137,52 +153,117 @@ class TodoistPanel(BasePanel):
 
     # noinspection PyUnusedLocal
     def _onCreateTaskClicked(self, event: CommandEvent):
+        """
+        The tasks are created on the job executor;  The progress dialog does not block the
+        other panels, so the user can pick the next issues meanwhile.  Its Cancel button lets the
+        requests in flight finish and skips the rest
+        """
+        ci: CloneInformation = self._cloneInformation
+        if self._confirmPlan(info=ci) is False:
+            return
+
+        def work(context: JobContext):
+            self._todoistCreation.createTasks(info=ci, progressCb=context.monitor)
+
+        self._setupProgressDialog()
+        self._createTaskButton.Disable()
+        self._creationJob = self._jobExecutor.submit(BackgroundJob(name=f'Create {len(ci.tasksToClone)} tasks', work=work,
+                                               onResult=self._onTasksCreated,
+                                               onError=self._onTaskCreationError,
+                                               onProgress=self._adapterCallback))
+
+    # noinspection PyUnusedLocal
+    def _onTasksCreated(self, result: None):
 
-        dlg: ProgressDialog   = self._setupProgressDialog()
-        ci:  CloneInformation = self._cloneInformation
+        self._keepProgressLog()
+        self._creationJob = None
+        self._progressDlg.Destroy()
+        self.clearTasks()
+        self._eventEngine.sendEvent(eventType=EventType.TaskCreationComplete)
 
-        try:
+    def _onTaskCreationError(self, e: Exception):
 
-            self._todoistCreation.createTasks(info=ci, progressCb=self._adapterCallback)
-            self._progressDlg.Destroy()
-            self.clearTasks()
-        except AdapterAuthenticationError as e:
-            self._progressDlg.Destroy()
-            self._handleAuthenticationError(event)
-        except (TaskCreationError, NoteCreationError) as tce:
-            self._progressDlg.Destroy()
+        self._keepProgressLog()
+        self._creationJob = None
+        self._progressDlg.Destroy()
+        self._createTaskButton.Enable(True)
+
+        if isinstance(e, OperationCancelledError):
+            # Keep the list;  Creating again only creates the skipped tasks
+            cancelledDlg: MessageDialog = MessageDialog(parent=self, message=str(e), caption='Task Creation Cancelled', style=OK | ICON_INFORMATION)
+            cancelledDlg.ShowModal()
+            cancelledDlg.Destroy()
+            return
+        elif isinstance(e, AdapterAuthenticationError):
+            self._handleAuthenticationError()
+        elif isinstance(e, (TaskCreationError, NoteCreationError)):
             errorHandler: ErrorHandler = ErrorHandler()
 
-            if errorHandler.isErrorHandled(tce.errorCode) is True:
-                errorHandler.handleError(tce.message, tce.errorCode)
+            if errorHandler.isErrorHandled(e.errorCode) is True:
+                errorHandler.handleError(e.message, e.errorCode)
             else:
-                booBoo: MessageDialog = MessageDialog(parent=None, message=tce.message, caption='Task Creation Error!', style=OK | ICON_ERROR)
+                booBoo: MessageDialog = MessageDialog(parent=None, message=e.message, caption='Task Creation Error!', style=OK | ICON_ERROR)
                 booBoo.ShowModal()
-        except Exception as ue:
-            message: str = str(ue)
+        else:
+            message: str = str(e)
             uhOh: MessageDialog = MessageDialog(parent=None, message=message, caption='Task Creation Error!', style=OK | ICON_ERROR)
             uhOh.ShowModal()
-        finally:
-            self._eventEngine.sendEvent(eventType=EventType.TaskCreationComplete)
+
+        self._eventEngine.sendEvent(eventType=EventType.TaskCreationComplete)
+
+    def _keepProgressLog(self):
+        """
+        The dialog only showed a few of the messages;  Keep the log for later
+        """
+        if self._creationJob is not None:
+            self._progressLog = self._creationJob.progressLog
+            self.logger.debug(f'{self._creationJob.name}: {len(self._progressLog)} progress messages')
+            for message in self._progressLog:
+                self.logger.debug(message)
+
+    def _confirmPlan(self, info: CloneInformation) -> bool:
+        """
+        Show the user what creating the tasks would do;  Planning refreshes the local copy of Todoist
+        and reads only that
+
+        Args:
+            info:   The clone information
+
+        Returns:  `True` if the user wants to go ahead
+        """
+        plan: TodoistPlan = self._todoistCreation.planTasks(info=info)
+        if plan.hasWork is False:
+            nothingDlg: MessageDialog = MessageDialog(parent=self, message=f'All {len(plan.issuesToSkip)} issues are already in Todoist',
+                                                      caption='Nothing To Create', style=OK | ICON_INFORMATION)
+            nothingDlg.ShowModal()
+            nothingDlg.Destroy()
+            return False
+
+        planDlg: MessageDialog = MessageDialog(parent=self, message='\n'.join(plan.summary()), caption='Create Todoist Tasks',
+                                               style=YES_NO | YES_DEFAULT | ICON_QUESTION)
+        answer: int = planDlg.ShowModal()
+        planDlg.Destroy()
+
+        return answer == ID_YES
 
     def _setupProgressDialog(self) -> ProgressDialog:
 
-        self._progressDlg: ProgressDialog = ProgressDialog("Creating Tasks", "", parent=self, style=PD_ELAPSED_TIME | STAY_ON_TOP)
+        self._progressDlg: ProgressDialog = ProgressDialog("Creating Tasks", "", maximum=BasePanel.PROGRESS_DIALOG_MAXIMUM, parent=self,
+                                                           style=PD_ELAPSED_TIME | PD_CAN_ABORT | STAY_ON_TOP)
 
         position: Position = self._preferences.progressDialogPosition
         self._progressDlg.SetPosition(pt=Point(x=position.x, y=position.y))
         return self._progressDlg
 
-    def _adapterCallback(self, statusMsg: str):
-        self._updateDialog(newMsg=statusMsg)
+    def _adapterCallback(self, report: ProgressReport):
+        self._updateDialog(report=report)
 
-    def _updateDialog(self, newMsg: str):
+    def _updateDialog(self, report: ProgressReport):
 
-        self._progressDlg.Pulse(newMsg)
-        wxYield()
-        # wxMilliSleep(delay)
+        if self._showProgress(progressDlg=self._progressDlg, report=report) is False and self._creationJob is not None:
+            self._creationJob.monitor.cancel()
 
-    def _handleAuthenticationError(self, event: CommandEvent):
+    def _handleAuthenticationError(self):
 
         eDlg = GenericMessageDialog(self, 'The supplied todoist token is invalid', "", agwStyle=ICON_ERROR | OK)
         eDlg.ShowModal()
@@ -194,4 +275,4 @@ class TodoistPanel(BasePanel):
                 # self._apiToken       = Preferences().todoistAPIToken
                 self._todoistCreation = TodoistCreation()
 
-                self._onCreateTaskClicked(event)    # Dang I hate recursion
+                self._onCreateTaskClicked(cast(CommandEvent, None))    # Dang I hate recursion
@@ -11,6 +11,7 @@ from wx import NOT_FOUND
 from wx import RA_SPECIFY_COLS
 from wx import RadioBox
 
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
 from pygitissue2todoist.general.GitHubURLOption import GitHubURLOption
 from pygitissue2todoist.ui.dialogs.configuration.AbstractConfigurationPanel import AbstractConfigurationPanel
 
@@ -20,19 +21,25 @@ URL_OPTIONS: List[str] = [GitHubURLOption.DoNotAdd.value,
                           GitHubURLOption.HyperLinkedTaskName.value
                           ]
 
+FETCH_BACKEND_OPTIONS: List[str] = [GitHubFetchBackend.REST.value,
+                                    GitHubFetchBackend.GraphQL.value
+                                    ]
+
 
 class GitHubConfigurationPanel(AbstractConfigurationPanel):
 
     def __init__(self, parent, *args, **kwargs):
         """
         """
-        self._URLOption:  RadioBox = cast(RadioBox, None)
+        self._URLOption:     RadioBox = cast(RadioBox, None)
+        self._backendOption: RadioBox = cast(RadioBox, None)
 
         super().__init__(parent, *args, **kwargs)
 
         self.SetSizerType('vertical')
 
-        self.Bind(EVT_RADIOBOX, self.__URLOptionChanged, self._URLOption)
+        self.Bind(EVT_RADIOBOX, self.__URLOptionChanged,     self._URLOption)
+        self.Bind(EVT_RADIOBOX, self.__backendOptionChanged, self._backendOption)
 
     def _layoutContent(self):
         """
@@ -46,6 +53,14 @@ class GitHubConfigurationPanel(AbstractConfigurationPanel):
                                    majorDimension=1,
                                    style=RA_SPECIFY_COLS
                                    )
+        self._backendOption = RadioBox(parent=self, id=ID_ANY,
+                                       label="Retrieve GitHub Issues Via",
+                                       pos=DefaultPosition,
+                                       size=DefaultSize,
+                                       choices=FETCH_BACKEND_OPTIONS,
+                                       majorDimension=1,
+                                       style=RA_SPECIFY_COLS
+                                       )
 
     def _setControlValues(self):
         """
@@ -55,6 +70,10 @@ class GitHubConfigurationPanel(AbstractConfigurationPanel):
         assert idx != NOT_FOUND, "Developer Error; Enumeration may have changed"
         self._URLOption.SetSelection(idx)
 
+        idx = self._backendOption.FindString(self._preferences.gitHubFetchBackend.value, bCase=False)
+        assert idx != NOT_FOUND, "Developer Error; Enumeration may have changed"
+        self._backendOption.SetSelection(idx)
+
     def __URLOptionChanged(self, event: CommandEvent):
 
         selectedIdx: int = event.GetInt()
@@ -64,3 +83,10 @@ class GitHubConfigurationPanel(AbstractConfigurationPanel):
         newOption:      GitHubURLOption = GitHubURLOption(selectedOption)
 
         self._preferences.gitHubURLOption = newOption
+
+    def __backendOptionChanged(self, event: CommandEvent):
+
+        selectedOption: str                = self._backendOption.GetString(event.GetInt())
+        newBackend:     GitHubFetchBackend = GitHubFetchBackend(selectedOption)
+
+        self._preferences.gitHubFetchBackend = newBackend
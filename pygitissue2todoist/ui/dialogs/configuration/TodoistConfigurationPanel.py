@@ -21,6 +21,7 @@ from wx import RadioBox
 from wx import NewIdRef as wxNewIdRef
 from wx import STAY_ON_TOP
 
+from pygitissue2todoist.general.TodoistCreationMode import TodoistCreationMode
 from pygitissue2todoist.strategy.TodoistTaskCreationStrategy import TodoistTaskCreationStrategy
 from pygitissue2todoist.ui.dialogs.configuration.AbstractConfigurationPanel import AbstractConfigurationPanel
 from pygitissue2todoist.ui.dialogs.configuration.TextContainer import TextContainer
@@ -31,6 +32,11 @@ TASK_CREATION_STRATEGY_OPTIONS: List[str] = [
     TodoistTaskCreationStrategy.ALL_ISSUES_ASSIGNED_TO_USER.value,
 ]
 
+CREATION_MODE_OPTIONS: List[str] = [
+    TodoistCreationMode.Batched.value,
+    TodoistCreationMode.Concurrent.value,
+]
+
 
 class TodoistConfigurationPanel(AbstractConfigurationPanel):
 
@@ -39,6 +45,7 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
         self._cacheOptionControl:         CheckBox      = cast(CheckBox, None)
         # self._tasksInParentOption:        CheckBox      = cast(CheckBox, None)
         self._taskCreationStrategyOption: RadioBox      = cast(RadioBox, None)
+        self._creationModeOption:         RadioBox      = cast(RadioBox, None)
         self._parentProjectNameContainer: TextContainer = cast(TextContainer, None)
 
         super().__init__(parent)
@@ -49,6 +56,7 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
 
         self.Bind(EVT_CHECKBOX, self.__onCacheOption,        self._cacheOptionControl)
         self.Bind(EVT_RADIOBOX, self.__onTaskStrategyChanges, self._taskCreationStrategyOption)
+        self.Bind(EVT_RADIOBOX, self.__onCreationModeChanged, self._creationModeOption)
         # self.Bind(EVT_CHECKBOX, self.__onTasksInParentProject, self._tasksInParentOption)
 
     def _layoutContent(self):
@@ -59,6 +67,7 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
 
         self._cacheOptionControl         = CheckBox(parent=self, label="Allow Todoist Cache Cleanup", id=ID_ANY)
         self._layoutStrategySelector()
+        self._layoutCreationModeSelector()
         self._parentProjectNameContainer = TextContainer(parent=self, labelText='Todoist Project Name:',
                                                          valueChangedCallback=self.__onParentProjectNameChange)
 
@@ -73,6 +82,17 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
                                                     style=RA_SPECIFY_COLS
                                                     )
 
+    def _layoutCreationModeSelector(self):
+
+        self._creationModeOption = RadioBox(parent=self, id=ID_ANY,
+                                            label="Send New Tasks To Todoist",
+                                            pos=DefaultPosition,
+                                            size=DefaultSize,
+                                            choices=CREATION_MODE_OPTIONS,
+                                            majorDimension=1,
+                                            style=RA_SPECIFY_COLS
+                                            )
+
     def _setControlValues(self):
         """
         Set the current configuration values on the controls.
@@ -84,6 +104,10 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
         assert idx != NOT_FOUND, "Developer Error; Enumeration may have changed"
         self._taskCreationStrategyOption.SetSelection(idx)
 
+        idx = self._creationModeOption.FindString(self._preferences.todoistCreationMode.value, bCase=False)
+        assert idx != NOT_FOUND, "Developer Error; Enumeration may have changed"
+        self._creationModeOption.SetSelection(idx)
+
         self._parentProjectNameContainer.textValue = self._preferences.todoistProjectName
 
         option: RadioBox = self._taskCreationStrategyOption
@@ -121,3 +145,16 @@ class TodoistConfigurationPanel(AbstractConfigurationPanel):
                    parent=self,
                    style=OK | ICON_INFORMATION | STAY_ON_TOP
                    )
+
+    def __onCreationModeChanged(self, event: CommandEvent):
+
+        selection: str                 = event.GetString()
+        mode:      TodoistCreationMode = TodoistCreationMode(selection)
+
+        self._preferences.todoistCreationMode = mode
+
+        MessageBox(message='You must manually exit and restart the application for this option to take effect',
+                   caption='Action Required',
+                   parent=self,
+                   style=OK | ICON_INFORMATION | STAY_ON_TOP
+                   )
@@ -1,4 +1,5 @@
 
+from typing import Optional
 from typing import cast
 
 from logging import Logger
@@ -7,14 +8,38 @@ from logging import INFO
 
 from abc import abstractmethod
 
+from pathlib import Path
+
+from datetime import timedelta
+
 from wx import Window
 
+from codeallybasic.ConfigurationLocator import ConfigurationLocator
+
+from pygitissue2todoist.adapters.ConditionalRequestCache import ConditionalRequestCache
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssue
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssues
+from pygitissue2todoist.adapters.GitHubAdapter import GithubAdapter
+from pygitissue2todoist.adapters.GitHubIssueCache import GitHubIssueCache
+from pygitissue2todoist.adapters.RepositoryNameCache import RepositoryNameCache
+from pygitissue2todoist.adapters.RetryPolicy import RetryPolicy
+
+from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.Resources import Resources
+
 from pygitissue2todoist.ui.BasePanel import BasePanel
 
+ISSUE_CACHE_FILE_NAME:      str = 'gitHubIssues.sqlite'
+RESPONSE_CACHE_FILE_NAME:   str = 'gitHubResponses.sqlite'
+REPOSITORY_NAMES_FILE_NAME: str = 'gitHubRepositories.json'
+
 
 class AbstractGitHubPanel(BasePanel):
+    #
+    # Shared by every panel, so that they all see the same cached repositories
+    #
+    issueCache:    Optional[GitHubIssueCache]        = None
+    responseCache: Optional[ConditionalRequestCache] = None
 
     def __init__(self, parent: Window):
         super().__init__(parent=parent)
@@ -24,6 +49,55 @@ class AbstractGitHubPanel(BasePanel):
     def clearIssues(self):
         pass
 
+    def _createGithubAdapter(self) -> GithubAdapter:
+        """
+        Create an adapter from the current preferences
+
+        Returns:  The adapter
+        """
+        preferences: Preferences = Preferences()
+
+        return GithubAdapter(userName=preferences.gitHubUserName,
+                             authenticationToken=preferences.gitHubAPIToken,
+                             maxConcurrency=preferences.gitHubMaxConcurrency,
+                             fetchBackend=preferences.gitHubFetchBackend,
+                             issueCache=self._getIssueCache(preferences=preferences),
+                             repositoryNameCache=self._createRepositoryNameCache(preferences=preferences),
+                             retryPolicy=RetryPolicy(maxAttempts=preferences.gitHubRetryAttempts,
+                                                     deadlineSeconds=preferences.gitHubRetryDeadlineSeconds),
+                             responseCache=self._getResponseCache(preferences=preferences)
+                             )
+
+    def _getIssueCache(self, preferences: Preferences) -> Optional[GitHubIssueCache]:
+
+        if preferences.gitHubIssueCache is False:
+            return None
+
+        if AbstractGitHubPanel.issueCache is None:
+            databasePath: Path = self._applicationPath() / ISSUE_CACHE_FILE_NAME
+
+            AbstractGitHubPanel.issueCache = GitHubIssueCache(databasePath=databasePath, maxIssues=preferences.gitHubIssueCacheSize)
+
+        return AbstractGitHubPanel.issueCache
+
+    def _createRepositoryNameCache(self, preferences: Preferences) -> RepositoryNameCache:
+
+        return RepositoryNameCache(cacheFilePath=self._applicationPath() / REPOSITORY_NAMES_FILE_NAME,
+                                   timeToLive=timedelta(hours=preferences.gitHubRepositoryCacheHours))
+
+    def _getResponseCache(self, preferences: Preferences) -> Optional[ConditionalRequestCache]:
+
+        if preferences.gitHubConditionalRequests is False:
+            return None
+
+        if AbstractGitHubPanel.responseCache is None:
+            AbstractGitHubPanel.responseCache = ConditionalRequestCache(databasePath=self._applicationPath() / RESPONSE_CACHE_FILE_NAME)
+
+        return AbstractGitHubPanel.responseCache
+
+    def _applicationPath(self) -> Path:
+        return ConfigurationLocator().applicationPath(Resources.CANONICAL_APPLICATION_NAME.lower())
+
     def _infoLogSelectedIssues(self, selectedIssues: AbbreviatedGitIssues):
         if self.logger.isEnabledFor(INFO) is True:
 
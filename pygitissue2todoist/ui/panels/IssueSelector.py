@@ -1,8 +1,6 @@
 
-from typing import Any
-from typing import Dict
-from typing import NewType
-from typing import cast
+from typing import List
+from typing import Optional
 
 from logging import Logger
 from logging import getLogger
@@ -11,9 +9,9 @@ from wx import DefaultPosition
 from wx import DefaultSize
 from wx import ID_ANY
 from wx import LC_REPORT
-from wx import LIST_AUTOSIZE
+from wx import LC_VIRTUAL
+from wx import LIST_STATE_SELECTED
 from wx import ListCtrl
-from wx import ListItem
 from wx import Window
 
 from wx.lib.mixins.listctrl import ListCtrlAutoWidthMixin
@@ -21,86 +19,166 @@ from wx.lib.mixins.listctrl import ListCtrlAutoWidthMixin
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssue
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssues
 
-NO_ITEM: int = -1       # Syntactic sugar for wxPython
+from pygitissue2todoist.general.IssueFilterIndex import IssueFilterIndex
+from pygitissue2todoist.general.IssueFilterIndex import IssueIndices
 
-IssueMap = NewType('IssueMap', Dict[int, AbbreviatedGitIssue])
+NO_ITEM:   int = -1     # Syntactic sugar for wxPython
+ALL_ITEMS: int = -1     # SetItemState applies to every row of a virtual list
+
+REPOSITORY_COLUMN: int = 0
+ISSUE_COLUMN:      int = 1
+
+COLUMN_WIDTH_SAMPLE:  int = 200     # Rows measured when sizing the columns
+COLUMN_WIDTH_PADDING: int = 16
 
 
 class IssueSelector(ListCtrl, ListCtrlAutoWidthMixin):
     """
-    We have to create an Issue map in order to indirectly associate
-    item data with the items in the list control.  How silly
+    A virtual list;  The control only asks for the rows it shows, so tens of thousands of
+    issues cost one array entry each.  Row indices are indices into that array, unless a
+    filter is set;  Then they are indices into the filter's matches
     """
     def __init__(self, parent: Window):
 
         super().__init__()
-        ListCtrl.__init__(self, parent, ID_ANY, pos=DefaultPosition, size=DefaultSize, style=LC_REPORT)
+        ListCtrl.__init__(self, parent, ID_ANY, pos=DefaultPosition, size=DefaultSize, style=LC_REPORT | LC_VIRTUAL)
 
         ListCtrlAutoWidthMixin.__init__(self)
 
         self.logger:  Logger = getLogger(__name__)
-        self._issues: AbbreviatedGitIssues = cast(AbbreviatedGitIssues, None)
+        self._issues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
 
-        self._issueMap: IssueMap = IssueMap({})
+        self._filterIndex: IssueFilterIndex       = IssueFilterIndex()
+        self._filter:      str                    = ''
+        self._rowIssues:   Optional[IssueIndices] = None     # None while unfiltered
 
         self._createHeader()
 
     @property
     def selectedIssues(self) -> AbbreviatedGitIssues:
         """
-        A wrapper around the complex logic needed to get the issues
-        associated with the items that are displayed
-
-        Returns:  The selected data
+        Returns:  The issues of the selected rows
         """
-
         selectedIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
 
-        idx:  int      = self.GetFirstSelected()
-        issue: AbbreviatedGitIssue = self._issueMap[idx]
-        selectedIssues.append(issue)
+        idx: int = self.GetFirstSelected()
+        while idx != NO_ITEM:
+            selectedIssues.append(self._issues[self._issueIndex(row=idx)])
+            idx = self.GetNextSelected(idx)
 
-        while True:
-            idx  = self.GetNextSelected(idx)
-            if idx == NO_ITEM:
-                break
+        return selectedIssues
 
-            issue = self._issueMap[idx]
-            selectedIssues.append(issue)
+    def selectAll(self):
+        """
+        Select every row with a single call instead of one per row
+        """
+        if self.GetItemCount() > 0:
+            self.SetItemState(ALL_ITEMS, LIST_STATE_SELECTED, LIST_STATE_SELECTED)
 
-        return selectedIssues
+    def clearIssues(self):
+        """
+        Remove every row but keep the header
+        """
+        self._issues = AbbreviatedGitIssues([])
+        self._filterIndex.clear()
+        self._showRows()
 
-    def _issueSetter(self, issues: AbbreviatedGitIssues) -> None:
+    def appendIssues(self, issues: AbbreviatedGitIssues):
         """
-        Updates the UI.  Using the index in the control as the key to the issue map
+        Add rows below the current ones;  Lets callers show issues as they stream in
 
         Args:
-            issues:
+            issues: The next page of issues
+        """
+        self._issues.extend(issues)
+        self._filterIndex.add(issues)
+
+        self._showRows()
+        self._sizeColumns(issues=issues)
 
+    def filterIssues(self, query: str):
         """
-        self._issues = issues
+        Show only the issues whose title, repository or labels have words starting with
+        each word of the query.  Clears the selection, since the rows move
+
+        Args:
+            query:  What the user typed;  Empty shows every issue
+        """
+        self._filter = query.strip()
 
         if self.GetItemCount() > 0:
-            self.ClearAll()
-            self._issueMap = IssueMap({})
+            self.SetItemState(ALL_ITEMS, 0, LIST_STATE_SELECTED)
+        self._showRows()
+        self.Refresh()
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        """
+        The control calls this for each visible cell
+        """
+        issue: AbbreviatedGitIssue = self._issues[self._issueIndex(row=item)]
+        if column == REPOSITORY_COLUMN:
+            return issue.slug
 
-        for issue in issues:
-            realIssue: AbbreviatedGitIssue = cast(AbbreviatedGitIssue, issue)
+        return issue.issueTitle
 
-            index = self.InsertItem(self.GetItemCount(), realIssue.slug)
-            self.logger.debug(f'{index=}')
-            self.SetItem(index=index, column=1, label=realIssue.issueTitle)
-            item: ListItem = self.GetItem(index)
+    @property
+    def issues(self) -> AbbreviatedGitIssues:
+        """
+        Returns:  Every issue, including the ones the filter hides
+        """
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues: AbbreviatedGitIssues):
+        """
+        Replaces the issues;  Use appendIssues to add more
+
+        Args:
+            issues:     The new issues
+        """
+        self.clearIssues()
+        self.appendIssues(issues)
+
+    def _showRows(self):
+        """
+        Streamed pages are filtered as they arrive
+        """
+        if self._filter == '':
+            self._rowIssues = None
+            self.SetItemCount(len(self._issues))
+        else:
+            self._rowIssues = self._filterIndex.search(query=self._filter)
+            self.SetItemCount(len(self._rowIssues))
+
+    def _issueIndex(self, row: int) -> int:
+
+        if self._rowIssues is None:
+            return row
+
+        return self._rowIssues[row]
+
+    def _sizeColumns(self, issues: AbbreviatedGitIssues):
+        """
+        Measure evenly spaced rows of the new page instead of every row;  Columns only grow,
+        so streamed pages do not make them jump back and forth
+
+        Args:
+            issues: The rows just added
+        """
+        if len(issues) == 0:
+            return
 
-            item.SetData(index)
-            self._issueMap[index] = realIssue
+        step:   int                       = max(1, len(issues) // COLUMN_WIDTH_SAMPLE)
+        sample: List[AbbreviatedGitIssue] = issues[::step]
 
-        self.SetColumnWidth(0, LIST_AUTOSIZE)
-        self.SetColumnWidth(1, LIST_AUTOSIZE)
+        slugWidth:  int = max(self.GetTextExtent(issue.slug).GetWidth() for issue in sample) + COLUMN_WIDTH_PADDING
+        titleWidth: int = max(self.GetTextExtent(issue.issueTitle).GetWidth() for issue in sample) + COLUMN_WIDTH_PADDING
 
-    # noinspection PyTypeChecker
-    issues = property(fget=cast(Any, None), fset=_issueSetter, doc='Repeated calls append the issues')     # type ignore
+        if slugWidth > self.GetColumnWidth(REPOSITORY_COLUMN):
+            self.SetColumnWidth(REPOSITORY_COLUMN, slugWidth)
+        if titleWidth > self.GetColumnWidth(ISSUE_COLUMN):
+            self.SetColumnWidth(ISSUE_COLUMN, titleWidth)
 
     def _createHeader(self):
-        self.InsertColumn(0, "Repository")
-        self.InsertColumn(1, "Issue")
+        self.InsertColumn(REPOSITORY_COLUMN, "Repository")
+        self.InsertColumn(ISSUE_COLUMN,      "Issue")
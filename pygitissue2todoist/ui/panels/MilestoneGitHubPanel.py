@@ -1,5 +1,6 @@
 
 from typing import List
+from typing import Optional
 from typing import cast
 
 from logging import Logger
@@ -10,9 +11,9 @@ from wx import CB_READONLY
 from wx import EVT_BUTTON
 from wx import EVT_COMBOBOX
 from wx import EVT_LISTBOX
+from wx import EVT_TEXT
 from wx import ICON_ERROR
 from wx import ID_ANY
-from wx import LB_MULTIPLE
 from wx import LB_OWNERDRAW
 from wx import LB_SINGLE
 from wx import OK
@@ -21,13 +22,15 @@ from wx import Button
 from wx import CommandEvent
 from wx import ListBox
 from wx import ComboBox
+from wx import SearchCtrl
+
+from wx import CallAfter as wxCallAfter
 
 from wx.lib.agw.genericmessagedialog import GenericMessageDialog
 
 from wx.lib.sized_controls import SizedPanel
 from wx.lib.sized_controls import SizedStaticBox
 
-from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssue
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssues
 from pygitissue2todoist.adapters.GitHubAdapter import GithubAdapter
 from pygitissue2todoist.adapters.GitHubAdapter import Slug
@@ -35,6 +38,9 @@ from pygitissue2todoist.adapters.GitHubAdapter import Slugs
 from pygitissue2todoist.adapters.AdapterAuthenticationError import AdapterAuthenticationError
 from pygitissue2todoist.adapters.GitHubConnectionError import GitHubConnectionError
 
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJob
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJobExecutor
+from pygitissue2todoist.general.BackgroundJobExecutor import JobContext
 from pygitissue2todoist.general.Preferences import Preferences
 
 from pygitissue2todoist.ui.BasePanel import BasePanel
@@ -45,6 +51,7 @@ from pygitissue2todoist.ui.eventengine.IEventEngine import IEventEngine
 from pygitissue2todoist.ui.eventengine.Events import EVT_TASK_CREATION_COMPLETE
 from pygitissue2todoist.ui.eventengine.Events import TaskCreationCompleteEvent
 from pygitissue2todoist.ui.panels.AbstractGitHubPanel import AbstractGitHubPanel
+from pygitissue2todoist.ui.panels.IssueSelector import IssueSelector
 
 
 class MilestoneGitHubPanel(AbstractGitHubPanel):
@@ -68,23 +75,28 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
         self._preferences:             Preferences          = Preferences()
         self._selectedSimpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
 
-        self._githubAdapter: GithubAdapter = GithubAdapter(userName=self._preferences.gitHubUserName, authenticationToken=self._preferences.gitHubAPIToken)
+        self._githubAdapter: GithubAdapter           = self._createGithubAdapter()
+        self._jobExecutor:   BackgroundJobExecutor   = BackgroundJobExecutor(dispatcher=wxCallAfter, name='MilestoneGitHubJobs')
+        self._milestoneJob:  Optional[BackgroundJob] = None
+        self._issueJob:      Optional[BackgroundJob] = None
 
-        self._repositorySelection: ComboBox = cast(ComboBox, None)
-        self._milestoneList:       ListBox  = cast(ListBox, None)
-        self._issueList:           ListBox  = cast(ListBox, None)
+        self._repositorySelection: ComboBox      = cast(ComboBox, None)
+        self._milestoneList:       ListBox       = cast(ListBox, None)
+        self._issueFilter:         SearchCtrl    = cast(SearchCtrl, None)
+        self._issueSelector:       IssueSelector = cast(IssueSelector, None)
         self._layoutContent(parent=self)
 
         self._populateRepositories()
 
         self.Bind(EVT_COMBOBOX, self._onRepositorySelected, self._repositorySelection)
         self.Bind(EVT_LISTBOX,  self._onMilestoneSelected,  self._milestoneList)
+        self.Bind(EVT_TEXT,     self._onIssueFilterChanged, self._issueFilter)
         self.Bind(EVT_BUTTON,   self._onCloneClicked,       self._cloneButton)
 
         self._eventEngine.registerListener(event=EVT_TASK_CREATION_COMPLETE, callback=self._onTaskCreationComplete)
 
     def clearIssues(self):
-        self._issueList.Clear()
+        self._issueSelector.clearIssues()
         self._selectedSimpleGitIssues = AbbreviatedGitIssues([])
 
     def _layoutContent(self, parent: BasePanel):
@@ -117,10 +129,15 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
         box: SizedStaticBox = SizedStaticBox(parent, ID_ANY, "Repository Issues")
         box.SetSizerProps(expand=True, proportion=4)
 
-        self._issueList = ListBox(box, style=LB_MULTIPLE | LB_OWNERDRAW)
-        self._issueList.SetSizerProps(expand=True, proportion=1)
+        self._issueFilter = SearchCtrl(box, ID_ANY)
+        self._issueFilter.SetDescriptiveText('Filter by title or label')
+        self._issueFilter.SetSizerProps(expand=True)
+
+        self._issueSelector = IssueSelector(parent=box)
+        # noinspection PyUnresolvedReferences
+        self._issueSelector.SetSizerProps(expand=True, proportion=1)
 
-        self._issueList.Enable(False)
+        self._issueSelector.Enable(False)
 
     def _layoutCloneButton(self, parent: SizedPanel):
 
@@ -151,15 +168,19 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
         self._populateIssues(repoName=Slug(repoName), milestoneTitle=milestoneTitle)
         self._eventEngine.sendEvent(eventType=EventType.MilestoneSelected)
 
+    def _onIssueFilterChanged(self, event: CommandEvent):
+        """
+        Filtering clears the selection
+        """
+        self._issueSelector.filterIssues(query=event.GetString())
+
     # noinspection PyUnusedLocal
     def _onCloneClicked(self, event: CommandEvent):
 
-        selectedIndices: List[int] = self._issueList.GetSelections()
-        self.logger.info(f'{selectedIndices=}')
+        selectedIssues: AbbreviatedGitIssues = self._issueSelector.selectedIssues
+        self.logger.info(f'{len(selectedIssues)} issues selected')
 
-        for idx in selectedIndices:
-            simpleGitIssue: AbbreviatedGitIssue = self._issueList.GetClientData(idx)
-            self._selectedSimpleGitIssues.append(simpleGitIssue)
+        self._selectedSimpleGitIssues.extend(selectedIssues)
 
         self._infoLogSelectedIssues(selectedIssues=self._selectedSimpleGitIssues)
 
@@ -172,38 +193,77 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
                                     selectedSimpleGitIssues=self._selectedSimpleGitIssues)
 
     def _populateRepositories(self):
+        """
+        Like every GitHub request of this panel, runs on the job executor's worker thread
+        """
+        def work(context: JobContext) -> Slugs:
+            return self._githubAdapter.getRepositoryNames(onRefresh=self._onRepositoriesRefreshed)
 
-        try:
-            repoNames: Slugs = self._githubAdapter.getRepositoryNames()
+        self._jobExecutor.submit(BackgroundJob(name='Repository names', work=work, onResult=self._repositorySelection.SetItems, onError=self._onGitHubError))
 
-            self._repositorySelection.SetItems(repoNames)
-        except AdapterAuthenticationError:
-            self._handleAuthenticationError()
-        except GitHubConnectionError:
-            self._handleGitHubConnectionError()
+    def _onRepositoriesRefreshed(self, repoNames: Slugs):
+        """
+        Called on the adapter's background thread
+        """
+        wxCallAfter(self._refreshRepositories, repoNames)
+
+    def _refreshRepositories(self, repoNames: Slugs):
+
+        selectedRepository: str = self._repositorySelection.GetStringSelection()
+
+        self._repositorySelection.SetItems(repoNames)
+        if selectedRepository != '':
+            self._repositorySelection.SetStringSelection(selectedRepository)
 
     def _populateMilestones(self, repoName: Slug):
+        """
+        A newer repository selection replaces a milestone request that has not finished
+
+        Args:
+            repoName:   The repository name
+        """
+        def work(context: JobContext) -> List[str]:
+            return self._githubAdapter.getMileStoneTitles(repoName)
 
-        mileStoneTitles: List[str] = self._githubAdapter.getMileStoneTitles(repoName)
+        if self._milestoneJob is not None:
+            self._milestoneJob.cancel()
+
+        self._milestoneList.Clear()
+        self._milestoneJob = self._jobExecutor.submit(BackgroundJob(name=f'Milestones of {repoName}', work=work,
+                                                                    onResult=self._onMilestonesRetrieved,
+                                                                    onError=self._onGitHubError))
+
+    def _onMilestonesRetrieved(self, mileStoneTitles: List[str]):
 
         self._milestoneList.SetItems(mileStoneTitles)
         self._milestoneList.Enable(True)
 
     def _populateIssues(self, repoName: Slug, milestoneTitle: str):
         """
-        The UI control can only display strings
+        Pages are appended as they arrive;  A newer milestone selection stops the retrieval
+        and drops whatever it had not appended yet
+
         Args:
             repoName:       The repository name
             milestoneTitle: The milestone for which we will filter
         """
-        abbreviatedGitIssues: AbbreviatedGitIssues = self._githubAdapter.getAbbreviatedIssues(repoName, milestoneTitle)
+        def work(context: JobContext):
+            for page in self._githubAdapter.iterateAbbreviatedIssues(repoName, milestoneTitle):
+                if context.cancelled is True:
+                    break
+                context.deliver(self._issueSelector.appendIssues, page)
 
-        for abbreviatedGitIssue in abbreviatedGitIssues:
-            simpleGitIssue: AbbreviatedGitIssue = cast(AbbreviatedGitIssue, abbreviatedGitIssue)
-            # Insert string in list box;  Attach client data to it
-            self._issueList.Append(simpleGitIssue.issueTitle, simpleGitIssue)
+        if self._issueJob is not None:
+            self._issueJob.cancel()
 
-        self._issueList.Enable(True)
+        self._issueSelector.Enable(True)
+        self._cloneButton.Enable(False)
+        self._issueJob = self._jobExecutor.submit(BackgroundJob(name=f'Issues of {repoName} {milestoneTitle}', work=work,
+                                                                onResult=self._onIssuesRetrieved,
+                                                                onError=self._onGitHubError))
+
+    # noinspection PyUnusedLocal
+    def _onIssuesRetrieved(self, result: None):
         self._cloneButton.Enable(True)
 
     def _extractTitles(self, abbreviatedGitIssues: AbbreviatedGitIssues) -> List[str]:
@@ -214,6 +274,17 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
 
         return issueTitles
 
+    def _onGitHubError(self, e: Exception):
+
+        if isinstance(e, AdapterAuthenticationError):
+            self._handleAuthenticationError()
+        elif isinstance(e, GitHubConnectionError):
+            self._handleGitHubConnectionError()
+        else:
+            eDlg = GenericMessageDialog(None, f'GitHub error:  {e}', "", agwStyle=ICON_ERROR | OK)
+            eDlg.ShowModal()
+            eDlg.Destroy()
+
     def _handleAuthenticationError(self):
 
         eDlg = GenericMessageDialog(None, 'GitHub authentication error', "", agwStyle=ICON_ERROR | OK)
@@ -222,9 +293,7 @@ class MilestoneGitHubPanel(AbstractGitHubPanel):
 
         with DlgConfigure(self) as dlg:
             if dlg.ShowModal() == OK:
-                githubToken: str = self._preferences.gitHubAPIToken
-                userName:    str = self._preferences.gitHubUserName
-                self._githubAdapter = GithubAdapter(userName=userName, authenticationToken=githubToken)
+                self._githubAdapter = self._createGithubAdapter()
 
                 self._populateRepositories()  # I hate recursion
 
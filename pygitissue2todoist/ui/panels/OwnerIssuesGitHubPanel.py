@@ -1,6 +1,7 @@
 
 from typing import List
 from typing import NewType
+from typing import Optional
 from typing import cast
 
 from logging import Logger
@@ -10,20 +11,24 @@ from wx import CENTRE
 from wx import EVT_BUTTON
 from wx import EVT_LISTBOX
 from wx import EVT_LIST_ITEM_SELECTED
+from wx import EVT_TEXT
+from wx import ICON_ERROR
 from wx import ICON_WARNING
 from wx import ID_ANY
 from wx import OK
+from wx import PD_CAN_ABORT
 from wx import PD_ELAPSED_TIME
 
 from wx import Button
 from wx import CommandEvent
 from wx import Point
 from wx import ProgressDialog
+from wx import SearchCtrl
 from wx import MessageBox
 
 from codeallybasic.Position import Position
 
-from wx import Yield as wxYield
+from wx import CallAfter as wxCallAfter
 
 from wx.lib.sized_controls import SizedPanel
 from wx.lib.sized_controls import SizedStaticBox
@@ -33,7 +38,11 @@ from pygitissue2todoist.adapters.GitHubAdapter import GithubAdapter
 from pygitissue2todoist.adapters.GitHubAdapter import IssueOwner
 from pygitissue2todoist.adapters.GitHubAdapter import Slugs
 
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJob
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJobExecutor
+from pygitissue2todoist.general.BackgroundJobExecutor import JobContext
 from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
 
 from pygitissue2todoist.ui.BasePanel import BasePanel
 from pygitissue2todoist.ui.eventengine.Events import EventType
@@ -90,15 +99,17 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
         self._eventEngine: IEventEngine = eventEngine
         self._preferences: Preferences  = Preferences()
 
-        self._selectedSimpleGitIssues: AbbreviatedGitIssues = AbbreviatedGitIssues([])
-        self._githubAdapter:           GithubAdapter        = GithubAdapter(userName=self._preferences.gitHubUserName,
-                                                                            authenticationToken=self._preferences.gitHubAPIToken
-                                                                            )
+        self._selectedSimpleGitIssues: AbbreviatedGitIssues    = AbbreviatedGitIssues([])
+        self._githubAdapter:           GithubAdapter           = self._createGithubAdapter()
+        self._jobExecutor:             BackgroundJobExecutor   = BackgroundJobExecutor(dispatcher=wxCallAfter, name='OwnerIssuesGitHubJobs')
+        self._issueJob:                Optional[BackgroundJob] = None
 
         self._repositorySelector:        RepositorySelector = cast(RepositorySelector, None)
         self._selectAllReposButton:      Button             = cast(Button, None)
         self._retrieveReposIssuesButton: Button             = cast(Button, None)
+        self._retrieveAllAssignedButton: Button             = cast(Button, None)
 
+        self._issueFilter:           SearchCtrl    = cast(SearchCtrl, None)
         self._issueSelector:         IssueSelector = cast(IssueSelector, None)
         self._selectAllIssuesButton: Button        = cast(Button, None)
         self._cloneButton:           Button        = cast(Button, None)
@@ -128,11 +139,13 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
 
         self.Bind(EVT_BUTTON, self._onSelectAllRepositories,         self._selectAllReposButton)
         self.Bind(EVT_BUTTON, self._onRetrieveIssuesForRepositories, self._retrieveReposIssuesButton)
+        self.Bind(EVT_BUTTON, self._onRetrieveAllAssignedIssues,     self._retrieveAllAssignedButton)
         self.Bind(EVT_BUTTON, self._onSelectAllIssues,               self._selectAllIssuesButton)
         self.Bind(EVT_BUTTON, self._onCloneClicked,                  self._cloneButton)
 
         self.Bind(EVT_LISTBOX,            self._onRepositorySelected, self._repositorySelector)
         self.Bind(EVT_LIST_ITEM_SELECTED, self._onIssueSelected,      self._issueSelector)
+        self.Bind(EVT_TEXT,               self._onIssueFilterChanged, self._issueFilter)
 
     # noinspection PyUnusedLocal
     def _onRetrieveIssuesForRepositories(self, event: CommandEvent):
@@ -151,18 +164,86 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
             self._populateIssueSelector(repositoryNames=repositoryNames)
 
     def _populateIssueSelector(self, repositoryNames: RepositoryNames):
+        """
+        The retrieval runs on the job executor;  Each page is shown as soon as it arrives instead
+        of waiting for the last repository.  A newer retrieval replaces one that has not finished;
+        The dialog's Cancel button keeps the issues retrieved so far.  The job's result is the
+        repositories that could not be retrieved
 
+        Args:
+            repositoryNames:    The selected repositories
+        """
         self.logger.debug(f'{repositoryNames}')
 
-        self._setupProgressDialog()
-
         issueOwner: IssueOwner = IssueOwner(self._preferences.gitHubUserName)
         slugs:      Slugs      = self._toSlugs(repositoryNames=repositoryNames)
 
-        issues: AbbreviatedGitIssues = self._githubAdapter.getIssuesAssignedToOwner(slugs=slugs, issueOwner=issueOwner, callback=self._updateDialog)
+        def work(context: JobContext) -> Slugs:
+            for page in self._githubAdapter.iterateIssuesAssignedToOwner(slugs=slugs, issueOwner=issueOwner, callback=context.monitor):
+                if context.cancelled is True:
+                    break
+                context.deliver(self._issueSelector.appendIssues, page)
+
+            return Slugs(list(self._githubAdapter.lastFetchStatistics.failedSlugs))
+
+        self._startIssueRetrieval(BackgroundJob(name=f'Issues of {len(slugs)} repositories', work=work,
+                                                onResult=self._onOwnerIssuesRetrieved,
+                                                onError=self._onRetrieveError,
+                                                onProgress=self._updateDialog))
+
+    # noinspection PyUnusedLocal
+    def _onRetrieveAllAssignedIssues(self, event: CommandEvent):
+        """
+        Does not need a repository selection;  Asks GitHub for every open issue assigned
+        to us across all repositories and organizations
+        """
+        def work(context: JobContext) -> AbbreviatedGitIssues:
+            return self._githubAdapter.getIssuesAssignedToAuthenticatedUser(callback=context.monitor)
+
+        self._startIssueRetrieval(BackgroundJob(name='All assigned issues', work=work,
+                                                onResult=self._onIssuesRetrieved,
+                                                onError=self._onRetrieveError,
+                                                onProgress=self._updateDialog))
+
+    def _startIssueRetrieval(self, job: BackgroundJob):
+
+        if self._issueJob is not None:
+            self._issueJob.cancel()
+            self._progressDlg.Destroy()
 
+        self._issueSelector.clearIssues()
+        self._setupProgressDialog()
+
+        self._issueJob = self._jobExecutor.submit(job)
+
+    def _onIssuesRetrieved(self, issues: Optional[AbbreviatedGitIssues]):
+        """
+        Args:
+            issues:     All the issues;  None when they were streamed in pages
+        """
+        self._issueJob = None
         self._progressDlg.Destroy()
-        self._issueSelector.issues = issues
+        if issues is not None:
+            self._issueSelector.issues = issues
+
+    def _onOwnerIssuesRetrieved(self, failedSlugs: Slugs):
+        """
+        The issues were streamed in;  Make sure a partial list does not pass for a complete one
+
+        Args:
+            failedSlugs:    The repositories whose retries ran out
+        """
+        self._onIssuesRetrieved(issues=None)
+        if len(failedSlugs) > 0:
+            repositories: str = '\n'.join(failedSlugs)
+            MessageBox(f'The issues of these repositories are missing from the list:\n\n{repositories}',
+                       'Could not retrieve every repository', OK | ICON_WARNING | CENTRE)
+
+    def _onRetrieveError(self, e: Exception):
+
+        self._issueJob = None
+        self._progressDlg.Destroy()
+        MessageBox(f'{e}', 'Could not retrieve the issues', OK | ICON_ERROR | CENTRE)
 
     # noinspection PyUnusedLocal
     def _onSelectAllRepositories(self, event: CommandEvent):
@@ -176,10 +257,11 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
     # noinspection PyUnusedLocal
     def _onSelectAllIssues(self, event: CommandEvent):
 
-        itemCount: int = self._issueSelector.GetItemCount()
-
-        for idx in range(itemCount):
-            self._issueSelector.Select(idx, on=SELECT_ITEM)
+        self._issueSelector.selectAll()
+        #
+        # A virtual list does not send a selection event per row
+        #
+        self._cloneButton.Enable(self._issueSelector.GetItemCount() > 0)
 
     # noinspection PyUnusedLocal
     def _onRepositorySelected(self, event: CommandEvent):
@@ -198,6 +280,13 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
     def _onIssueSelected(self, event: CommandEvent):
         self._cloneButton.Enable(True)
 
+    def _onIssueFilterChanged(self, event: CommandEvent):
+        """
+        Filtering clears the selection
+        """
+        self._issueSelector.filterIssues(query=event.GetString())
+        self._cloneButton.Enable(False)
+
     # noinspection PyUnusedLocal
     def _onCloneClicked(self, event: CommandEvent):
 
@@ -211,17 +300,17 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
 
     def _setupProgressDialog(self) -> ProgressDialog:
 
-        self._progressDlg = ProgressDialog("Retrieve Issues", "Hello", style=PD_ELAPSED_TIME)
+        self._progressDlg = ProgressDialog("Retrieve Issues", "Hello", maximum=BasePanel.PROGRESS_DIALOG_MAXIMUM, style=PD_ELAPSED_TIME | PD_CAN_ABORT)
 
         position: Position = self._preferences.progressDialogPosition
         self._progressDlg.SetPosition(pt=Point(x=position.x, y=position.y))
 
         return self._progressDlg
 
-    def _updateDialog(self, newMsg: str):
+    def _updateDialog(self, report: ProgressReport):
 
-        self._progressDlg.Pulse(newMsg)
-        wxYield()
+        if self._showProgress(progressDlg=self._progressDlg, report=report) is False and self._issueJob is not None:
+            self._issueJob.monitor.cancel()
 
     def _toSlugs(self, repositoryNames: RepositoryNames) -> Slugs:
         """
@@ -239,7 +328,7 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
         box: SizedStaticBox = SizedStaticBox(parent, ID_ANY, "Repositories")
         box.SetSizerProps(expand=True, proportion=1)
 
-        repositorySelector: RepositorySelector = RepositorySelector(parent=box, gitHubAdapter=self._githubAdapter)
+        repositorySelector: RepositorySelector = RepositorySelector(parent=box, gitHubAdapter=self._githubAdapter, jobExecutor=self._jobExecutor)
 
         # noinspection PyUnresolvedReferences
         repositorySelector.SetSizerProps(expand=True, proportion=1)
@@ -256,21 +345,29 @@ class OwnerIssuesGitHubPanel(AbstractGitHubPanel):
 
         selectAllButton:      Button = Button(parent=buttonPanel, id=ID_ANY, label='Select All')
         retrieveIssuesButton: Button = Button(parent=buttonPanel, id=ID_ANY, label='Retrieve Issues')
+        allAssignedButton:    Button = Button(parent=buttonPanel, id=ID_ANY, label='All Assigned')
 
         retrieveIssuesButton.Enable(False)
 
         self._selectAllReposButton  = selectAllButton
         self._retrieveReposIssuesButton = retrieveIssuesButton
+        self._retrieveAllAssignedButton = allAssignedButton
 
     def _layoutIssueSelector(self, parent: SizedPanel):
 
         box: SizedStaticBox = SizedStaticBox(parent, ID_ANY, "Issues")
         box.SetSizerProps(expand=True, proportion=1)
 
+        issueFilter: SearchCtrl = SearchCtrl(box, ID_ANY)
+        issueFilter.SetDescriptiveText('Filter by title, repository or label')
+        # noinspection PyUnresolvedReferences
+        issueFilter.SetSizerProps(expand=True)
+
         issueSelector: IssueSelector = IssueSelector(parent=box)
         # noinspection PyUnresolvedReferences
         issueSelector.SetSizerProps(expand=True, proportion=1)
 
+        self._issueFilter   = issueFilter
         self._issueSelector = issueSelector
 
     def _layoutIssueButtons(self, parent: SizedPanel):
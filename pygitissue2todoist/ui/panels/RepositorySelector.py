@@ -1,5 +1,9 @@
 
+from logging import Logger
+from logging import getLogger
+
 from wx import LB_EXTENDED
+from wx import NOT_FOUND
 
 from wx import ListBox
 from wx import Size
@@ -7,28 +11,69 @@ from wx import Window
 
 from wx import BeginBusyCursor as wxBeginBusyCursor
 from wx import EndBusyCursor as wxEndBusyCursor
-from wx import Yield as wxYield
 from wx import CallAfter as wxCallAfter
 
 from pygitissue2todoist.adapters.GitHubAdapter import GithubAdapter
 from pygitissue2todoist.adapters.GitHubAdapter import Slugs
+from pygitissue2todoist.adapters.GitHubAdapter import Slug
+
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJob
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJobExecutor
+from pygitissue2todoist.general.BackgroundJobExecutor import JobContext
 
 
 class RepositorySelector(ListBox):
 
-    def __init__(self, parent: Window, gitHubAdapter: GithubAdapter):
+    def __init__(self, parent: Window, gitHubAdapter: GithubAdapter, jobExecutor: BackgroundJobExecutor):
+        """
 
+        Args:
+            parent:         The parent window
+            gitHubAdapter:  Lists the repositories
+            jobExecutor:    Runs the listing off the UI thread;  Share the one that uses the adapter
+        """
         super().__init__(parent, size=Size(width=-1, height=300), style=LB_EXTENDED)
 
-        self._githubAdapter: GithubAdapter = gitHubAdapter
+        self.logger: Logger = getLogger(__name__)
+
+        self._githubAdapter: GithubAdapter         = gitHubAdapter
+        self._jobExecutor:   BackgroundJobExecutor = jobExecutor
         wxCallAfter(self._populate)
 
     def _populate(self):
+
+        def work(context: JobContext) -> Slugs:
+            return self._githubAdapter.getRepositoryNames(onRefresh=self._onRepositoriesRefreshed)
+
         wxBeginBusyCursor()
-        wxYield()
+        self._jobExecutor.submit(BackgroundJob(name='Repository names', work=work, onResult=self._onRepositoriesRetrieved, onError=self._onRetrieveError))
+
+    def _onRepositoriesRetrieved(self, slugs: Slugs):
 
-        slugs: Slugs = self._githubAdapter.getRepositoryNames()
-        slugs.sort()
         wxEndBusyCursor()
+        self._setRepositories(slugs)
 
+    def _onRetrieveError(self, e: Exception):
+
+        wxEndBusyCursor()
+        self.logger.error(f'Could not list the repositories: {e}')
+
+    def _onRepositoriesRefreshed(self, slugs: Slugs):
+        """
+        Called on the adapter's background thread
+        """
+        wxCallAfter(self._setRepositories, slugs)
+
+    def _setRepositories(self, slugs: Slugs):
+        """
+        Replace the list but keep whatever the user already selected
+        """
+        selectedSlugs: Slugs = Slugs([Slug(self.GetString(idx)) for idx in self.GetSelections()])
+
+        slugs.sort()
         self.Set(slugs)
+
+        for slug in selectedSlugs:
+            idx: int = self.FindString(slug)
+            if idx != NOT_FOUND:
+                self.SetSelection(idx)
@@ -1,9 +1,18 @@
 
+from typing import Any
+from typing import List
+from typing import Optional
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from threading import current_thread
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
@@ -12,6 +21,14 @@ from unittest.mock import Mock
 from unittest.mock import PropertyMock
 from unittest.mock import patch
 
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from github import GithubException
+
+from codeallybasic.DynamicConfiguration import KeyName
+from codeallybasic.DynamicConfiguration import ValueDescription
+
+from pygitissue2todoist.adapters.GitHubConnectionError import GitHubConnectionError
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssue
 from pygitissue2todoist.adapters.GitHubAdapter import GithubAdapter
 from pygitissue2todoist.adapters.GitHubAdapter import IssueOwner
@@ -19,11 +36,42 @@ from pygitissue2todoist.adapters.GitHubAdapter import MilestoneTitles
 from pygitissue2todoist.adapters.GitHubAdapter import AbbreviatedGitIssues
 from pygitissue2todoist.adapters.GitHubAdapter import Slug
 from pygitissue2todoist.adapters.GitHubAdapter import Slugs
+from pygitissue2todoist.adapters.GitHubIssueCache import GitHubIssueCache
+from pygitissue2todoist.adapters.RepositoryCache import RepositoryCache
+from pygitissue2todoist.adapters.RepositoryNameCache import RepositoryNameCache
+from pygitissue2todoist.adapters.RetryPolicy import RetryPolicy
+from pygitissue2todoist.general.GitHubFetchBackend import GitHubFetchBackend
 from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.Preferences import SECTION_GITHUB
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
 
 from tests.ProjectTestBase import ProjectTestBase
 
 
+def createPaginatedList(items: List) -> Mock:
+    """
+    The adapter walks listings by page number
+    """
+    paginatedList = Mock()
+    paginatedList.get_page.side_effect = lambda pageNumber: items[pageNumber * GithubAdapter.ISSUES_PER_PAGE:(pageNumber + 1) * GithubAdapter.ISSUES_PER_PAGE]
+
+    return paginatedList
+
+
+def createMockRepo(issueTitles: List[str], failure: Optional[Exception] = None) -> Mock:
+    """
+    A repository whose open issues have these titles;  With a failure, every page request raises it
+    """
+    mockRepo = Mock()
+    if failure is None:
+        mockRepo.get_issues.return_value = createPaginatedList([Mock(title=issueTitle, labels=[]) for issueTitle in issueTitles])
+    else:
+        mockRepo.get_issues.return_value.get_page.side_effect = failure
+
+    return mockRepo
+
+
 class TestGithubAdapter(ProjectTestBase):
 
     TEST_REPOSITORY_NAME: Slug = Slug('hasii2011/StarTrekPy')
@@ -41,6 +89,10 @@ class TestGithubAdapter(ProjectTestBase):
 
         self.logger: Logger = TestGithubAdapter.clsLogger
 
+        self._progressMonitor: ProgressMonitor = ProgressMonitor(listener=self._statusCallback)
+
+        RepositoryCache().clear()
+
     def tearDown(self):
         pass
 
@@ -56,7 +108,7 @@ class TestGithubAdapter(ProjectTestBase):
                 type(mockRepo1).full_name = PropertyMock(return_value='Mock/Repo1')
                 type(mockRepo2).full_name = PropertyMock(return_value='Mock/Repo2')
 
-                githubAdapter._github.search_repositories.return_value = [mockRepo1, mockRepo2]
+                githubAdapter._github.get_user.return_value.get_repos.return_value = createPaginatedList([mockRepo1, mockRepo2])
 
                 repoNames: Slugs = githubAdapter.getRepositoryNames()
 
@@ -65,6 +117,23 @@ class TestGithubAdapter(ProjectTestBase):
                 for repoName in repoNames:
                     self.logger.info(f'{repoName=}')
 
+                githubAdapter._github.get_user.return_value.get_repos.assert_called_once_with(affiliation=GithubAdapter.REPOSITORY_AFFILIATION,
+                                                                                              sort=GithubAdapter.REPOSITORY_SORT)
+
+    def testGetRepositoryNamesFromCache(self):
+
+        with TemporaryDirectory() as cacheDirectory:
+            repositoryNameCache: RepositoryNameCache = RepositoryNameCache(cacheFilePath=Path(cacheDirectory) / 'repositoryNames.json')
+            repositoryNameCache.save(userName='mockUserName', slugs=Slugs([Slug('Mock/Repo1')]))
+
+            githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', repositoryNameCache=repositoryNameCache)
+            githubAdapter._github = MagicMock()
+
+            repoNames: Slugs = githubAdapter.getRepositoryNames()
+
+            self.assertEqual(['Mock/Repo1'], repoNames, 'Current listing should come from the cache')
+            githubAdapter._github.get_user.assert_not_called()
+
     def testGetMilestones(self):
 
         githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
@@ -77,7 +146,7 @@ class TestGithubAdapter(ProjectTestBase):
                 type(mockMileStone2).title = PropertyMock(return_value='MockMilestone2')
 
                 mockRepo = Mock()
-                mockRepo.get_milestones.return_value = [mockMileStone1, mockMileStone2]
+                mockRepo.get_milestones.return_value = createPaginatedList([mockMileStone1, mockMileStone2])
 
                 githubAdapter._github.get_repo.return_value = mockRepo
                 #
@@ -108,7 +177,8 @@ class TestGithubAdapter(ProjectTestBase):
 
                 githubAdapter._github.get_repo.return_value = mockRepo
 
-                mockRepo.get_issues.return_value = [mockIssue1]
+                mockRepo.get_milestones.return_value = createPaginatedList([mockMileStone1])
+                mockRepo.get_issues.return_value     = createPaginatedList([mockIssue1])
                 #
                 # Done patching
                 #
@@ -116,9 +186,339 @@ class TestGithubAdapter(ProjectTestBase):
                                                                                            TestGithubAdapter.TEST_MILESTONE_TITLE)
                 self.assertTrue(len(simpleGitIssues) != 0, "We should have found some open issues")
 
+                mockRepo.get_issues.assert_called_once_with(state=GithubAdapter.OPEN_ISSUE_INDICATOR, milestone=mockMileStone1)
+
                 for issueTitle in simpleGitIssues:
                     self.logger.info(f'{issueTitle=}')
 
+    def testGetIssuesReusesLoadedMilestones(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
+        githubAdapter._github = Mock()
+
+        mockMileStone = Mock()
+        mockMileStone.title = TestGithubAdapter.TEST_MILESTONE_TITLE
+
+        mockRepo = Mock()
+        mockRepo.get_milestones.return_value = createPaginatedList([mockMileStone])
+        mockRepo.get_issues.return_value     = createPaginatedList([])
+
+        githubAdapter._github.get_repo.return_value = mockRepo
+
+        githubAdapter.getMileStoneTitles(TestGithubAdapter.TEST_REPOSITORY_NAME)
+        githubAdapter.getAbbreviatedIssues(TestGithubAdapter.TEST_REPOSITORY_NAME, TestGithubAdapter.TEST_MILESTONE_TITLE)
+        githubAdapter.getAbbreviatedIssues(TestGithubAdapter.TEST_REPOSITORY_NAME, 'Not A Milestone')
+
+        self.assertEqual(1, mockRepo.get_milestones.call_count, 'Milestones should only be loaded once')
+        self.assertEqual(1, mockRepo.get_issues.call_count,     'Unknown milestones should not go to GitHub')
+
+    def testRepositoriesAreSharedAcrossAdapters(self):
+
+        mockRepo   = Mock()
+        mockGithub = Mock()
+        mockGithub.get_repo.return_value = mockRepo
+        mockRepo.get_milestones.return_value = createPaginatedList([])
+        mockRepo.get_issues.return_value     = createPaginatedList([])
+
+        for x in range(2):
+            githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
+            githubAdapter._github = mockGithub
+            githubAdapter.getMileStoneTitles(TestGithubAdapter.TEST_REPOSITORY_NAME)
+            githubAdapter.getAbbreviatedIssues(TestGithubAdapter.TEST_REPOSITORY_NAME, GithubAdapter.ALL_ISSUES_INDICATOR)
+
+        self.assertEqual(1, mockGithub.get_repo.call_count, 'The repository handle should be memoized')
+
+    def testIterateAbbreviatedIssuesYieldsPages(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
+        githubAdapter._github = Mock()
+
+        mockRepo = Mock()
+        mockRepo.get_issues.return_value = createPaginatedList([Mock(title=f'Issue {x}', labels=[]) for x in range(250)])
+        githubAdapter._github.get_repo.return_value = mockRepo
+
+        pageSizes: List[int] = [len(page) for page in githubAdapter.iterateAbbreviatedIssues(TestGithubAdapter.TEST_REPOSITORY_NAME, GithubAdapter.ALL_ISSUES_INDICATOR)]
+
+        self.assertEqual([100, 100, 50], pageSizes, 'Issues should arrive a page at a time')
+        self.assertEqual(3, githubAdapter.lastFetchStatistics.requestCount, 'One request per page')
+
+    def testIterateIssuesAssignedToOwnerStopsEarly(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', maxConcurrency=2)
+
+        mockGithub = Mock()
+        mockGithub.get_repo.side_effect = lambda slug, lazy: createMockRepo(issueTitles=[f'{slug} issue {x}' for x in range(1000)])
+        githubAdapter._createGithub = Mock(return_value=mockGithub)     # type: ignore
+
+        slugs: Slugs = Slugs([Slug(f'Mock/Repo{x}') for x in range(6)])
+
+        pages = githubAdapter.iterateIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=self._progressMonitor)
+
+        firstPage: AbbreviatedGitIssues = next(pages)
+        pages.close()       # Must not hang waiting for the blocked workers
+
+        self.assertEqual(GithubAdapter.ISSUES_PER_PAGE, len(firstPage), 'Should get a full first page')
+
+    def testGetIssuesAssignedToOwnerFiltersOnServer(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
+        githubAdapter._github = Mock()
+
+        mockRepo = Mock()
+
+        with patch('github.Issue.Issue') as mockIssue1:
+
+            type(mockIssue1).title    = PropertyMock(return_value='MockIssue1')
+            type(mockIssue1).html_url = PropertyMock(return_value=TestGithubAdapter.TEST_ISSUE_URL)
+
+            githubAdapter._github.get_repo.return_value = mockRepo
+            mockRepo.get_issues.return_value = createPaginatedList([mockIssue1])
+
+            issueOwner: IssueOwner = IssueOwner('mockUserName')
+            slugs:      Slugs      = Slugs([TestGithubAdapter.TEST_REPOSITORY_NAME])
+
+            simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._progressMonitor)
+
+            mockRepo.get_issues.assert_called_once_with(state=GithubAdapter.OPEN_ISSUE_INDICATOR, assignee=issueOwner)
+            self.assertEqual(1, len(simpleGitIssues), 'The server already filtered these')
+
+    def testGetIssuesAssignedToOwnerConcurrently(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', maxConcurrency=3)
+
+        mockGithub = Mock()
+        mockGithub.get_repo.side_effect = lambda slug, lazy: createMockRepo(issueTitles=[f'{slug} issue'])
+        githubAdapter._createGithub = Mock(return_value=mockGithub)     # type: ignore
+
+        callbackThreads: List[str] = []
+
+        def recordingCallback(report: ProgressReport):
+            callbackThreads.append(current_thread().name)
+
+        slugs:   Slugs           = Slugs([Slug('Mock/Repo1'), Slug('Mock/Repo2'), Slug('Mock/Repo3'), Slug('Mock/Repo4')])
+        monitor: ProgressMonitor = ProgressMonitor(listener=recordingCallback)
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=monitor)
+
+        actualTitles: List[str] = [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues]
+
+        self.assertEqual([f'{slug} issue' for slug in slugs], actualTitles, 'Merged result must follow the slug order')
+        self.assertEqual({current_thread().name}, set(callbackThreads), 'Callbacks must arrive on the calling thread')
+        self.assertEqual(len(slugs), monitor.report.completed, 'Each repository is a step')
+        self.assertEqual(len(slugs), monitor.report.total)
+
+    def testCancelStopsAfterTheCurrentRepository(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', maxConcurrency=1)
+
+        githubAdapter._github = Mock()
+        githubAdapter._github.get_repo.side_effect = lambda slug, lazy=False: createMockRepo(issueTitles=[f'{slug} issue'])
+
+        def cancelAfterFirstRepository(report: ProgressReport):
+            if report.completed == 1:
+                monitor.cancel()
+
+        slugs:   Slugs           = Slugs([Slug('Mock/Repo1'), Slug('Mock/Repo2'), Slug('Mock/Repo3')])
+        monitor: ProgressMonitor = ProgressMonitor(listener=cancelAfterFirstRepository)
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=monitor)
+
+        self.assertEqual(['Mock/Repo1 issue'], [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues], 'The issues retrieved before the cancel are kept')
+        self.assertEqual(1, githubAdapter._github.get_repo.call_count, 'The other repositories should not be requested')
+
+    def testFailedPageIsRetriedAlone(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken',
+                                                     retryPolicy=RetryPolicy(initialBackoff=0.0))
+        githubAdapter._github = Mock()
+
+        issues = [Mock(title=f'Issue {x}', labels=[]) for x in range(150)]
+        pages  = [issues[:100], GithubException(502, None, None), issues[100:]]
+
+        mockRepo = Mock()
+        mockRepo.get_issues.return_value.get_page.side_effect = pages
+        githubAdapter._github.get_repo.return_value = mockRepo
+
+        slugs: Slugs = Slugs([TestGithubAdapter.TEST_REPOSITORY_NAME])
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=self._progressMonitor)
+
+        requestedPages: List[int] = [call.args[0] for call in mockRepo.get_issues.return_value.get_page.call_args_list]
+
+        self.assertEqual(150, len(simpleGitIssues), 'No issue should be lost or repeated')
+        self.assertEqual([0, 1, 1], requestedPages, 'Only the failed page should be requested again')
+
+    def testRepositoryThatKeepsFailingIsSkipped(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', maxConcurrency=2,
+                                                     retryPolicy=RetryPolicy(maxAttempts=2, initialBackoff=0.0))
+
+        def createMaybeBrokenRepo(slug: str, lazy: bool) -> Mock:
+            failure: Optional[Exception] = GithubException(502, None, None) if slug == 'Mock/Broken' else None
+            return createMockRepo(issueTitles=[f'{slug} issue'], failure=failure)
+
+        mockGithub = Mock()
+        mockGithub.get_repo.side_effect = createMaybeBrokenRepo
+        githubAdapter._createGithub = Mock(return_value=mockGithub)     # type: ignore
+
+        slugs: Slugs = Slugs([Slug('Mock/Repo1'), Slug('Mock/Broken'), Slug('Mock/Repo2')])
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=self._progressMonitor)
+
+        self.assertEqual(['Mock/Repo1 issue', 'Mock/Repo2 issue'], [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues], 'Finished repositories must be kept')
+        self.assertEqual(['Mock/Broken'], githubAdapter.lastFetchStatistics.failedSlugs, 'The failure should be recorded')
+
+    def testOutageIsNotAnEmptyResult(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', maxConcurrency=2,
+                                                     retryPolicy=RetryPolicy(maxAttempts=2, initialBackoff=0.0))
+
+        mockGithub = Mock()
+        mockGithub.get_repo.side_effect = lambda slug, lazy: createMockRepo(issueTitles=[], failure=RequestsConnectionError('Name resolution failed'))
+        githubAdapter._createGithub = Mock(return_value=mockGithub)     # type: ignore
+
+        slugs: Slugs = Slugs([Slug('Mock/Repo1'), Slug('Mock/Repo2')])
+
+        with self.assertRaises(GitHubConnectionError):
+            githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=self._progressMonitor)
+
+        self.assertEqual(['Mock/Repo1', 'Mock/Repo2'], sorted(githubAdapter.lastFetchStatistics.failedSlugs), 'Every failure should be recorded')
+
+    def testGetIssuesAssignedToAuthenticatedUserGroupsBySlug(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken')
+        githubAdapter._github = Mock()
+
+        mockIssues = []
+        for slug, title in [('Mock/Repo1', 'Issue1'), ('Mock/Repo2', 'Issue2'), ('Mock/Repo1', 'Issue3')]:
+            mockIssue = Mock()
+            mockIssue.title = title
+            mockIssue.labels = []
+            mockIssue.repository.full_name = slug
+            mockIssues.append(mockIssue)
+
+        githubAdapter._github.get_user.return_value.get_issues.return_value = createPaginatedList(mockIssues)
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToAuthenticatedUser(callback=self._progressMonitor)
+
+        actualTitles: List[str] = [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues]
+        actualSlugs:  List[str] = [simpleGitIssue.slug for simpleGitIssue in simpleGitIssues]
+
+        self.assertEqual(['Issue1', 'Issue3', 'Issue2'], actualTitles, 'Issues should be grouped by repository')
+        self.assertEqual(['Mock/Repo1', 'Mock/Repo1', 'Mock/Repo2'], actualSlugs, 'Slug comes from the embedded repository')
+
+    def testGetIssuesAssignedToOwnerWithGraphQL(self):
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', fetchBackend=GitHubFetchBackend.GraphQL)
+
+        def createNode(title: str):
+            return {'title': title, 'url': TestGithubAdapter.TEST_ISSUE_URL, 'body': '', 'labels': {'nodes': [{'name': 'bug'}]}}
+
+        firstPage = {
+            'data': {
+                'r0': {'issues': {'pageInfo': {'hasNextPage': True,  'endCursor': 'cursor1'}, 'nodes': [createNode('Issue1')]}},
+                'r1': {'issues': {'pageInfo': {'hasNextPage': False, 'endCursor': None},      'nodes': [createNode('Issue2')]}},
+            }
+        }
+        secondPage = {
+            'data': {
+                'r0': {'issues': {'pageInfo': {'hasNextPage': False, 'endCursor': None}, 'nodes': [createNode('Issue3')]}},
+            }
+        }
+        mockRequester = Mock()
+        mockRequester.graphql_query.side_effect = [({}, firstPage), ({}, secondPage)]
+        githubAdapter._graphQLFetcher._requester = mockRequester
+
+        slugs: Slugs = Slugs([Slug('Mock/Repo1'), Slug('Mock/Repo2')])
+
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=IssueOwner('mockUserName'), callback=self._progressMonitor)
+
+        actualTitles: List[str] = [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues]
+
+        self.assertEqual(['Issue1', 'Issue3', 'Issue2'], actualTitles, 'Pages must be merged per repository')
+        self.assertEqual(2, mockRequester.graphql_query.call_count, 'Both repositories share the first query')
+
+        secondVariables = mockRequester.graphql_query.call_args.kwargs['variables']
+        self.assertEqual('cursor1',      secondVariables['r0Cursor'], 'Second query must resume from the cursor')
+        self.assertEqual('mockUserName', secondVariables['assignee'], 'Assignee is filtered on the server')
+        self.assertEqual(2, githubAdapter.lastFetchStatistics.requestCount, 'Statistics should count each query')
+
+    def testGetIssuesAssignedToOwnerSynchronizesCache(self):
+
+        def createMockIssue(number: int, state: str, assignee: str):
+            mockIssue = Mock()
+            mockIssue.number    = number
+            mockIssue.state     = state
+            mockIssue.title     = f'Issue {number}'
+            mockIssue.html_url  = TestGithubAdapter.TEST_ISSUE_URL
+            mockIssue.body      = ''
+            mockIssue.labels    = []
+            mockIssue.milestone = None
+            mockIssue.assignees = [Mock(login=assignee)]
+            return mockIssue
+
+        with TemporaryDirectory() as cacheDirectory:
+            issueCache:    GitHubIssueCache = GitHubIssueCache(databasePath=Path(cacheDirectory) / 'issues.sqlite')
+            githubAdapter: GithubAdapter    = GithubAdapter(userName='mockUserName', authenticationToken='mockToken', issueCache=issueCache)
+            githubAdapter._github = Mock()
+
+            mockRepo = Mock()
+            githubAdapter._github.get_repo.return_value = mockRepo
+
+            slugs:      Slugs      = Slugs([TestGithubAdapter.TEST_REPOSITORY_NAME])
+            issueOwner: IssueOwner = IssueOwner('mockUserName')
+
+            mockRepo.get_issues.return_value = createPaginatedList([createMockIssue(1, 'open', 'mockUserName'), createMockIssue(2, 'open', 'someoneElse')])
+            firstIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._progressMonitor)
+
+            mockRepo.get_issues.assert_called_once_with(state=GithubAdapter.OPEN_ISSUE_INDICATOR)
+
+            mockRepo.get_issues.return_value = createPaginatedList([createMockIssue(1, 'closed', 'mockUserName'), createMockIssue(3, 'open', 'mockUserName')])
+            secondIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._progressMonitor)
+
+            self.assertEqual(GithubAdapter.ALL_STATES_INDICATOR, mockRepo.get_issues.call_args.kwargs['state'], 'Refresh must see closed issues')
+            self.assertIn('since', mockRepo.get_issues.call_args.kwargs, 'Refresh must be incremental')
+
+            self.assertEqual(['Issue 1'], [simpleGitIssue.issueTitle for simpleGitIssue in firstIssues],  'Filtered from the cache')
+            self.assertEqual(['Issue 3'], [simpleGitIssue.issueTitle for simpleGitIssue in secondIssues], 'Closed issue should be dropped')
+
+            issueCache.close()
+
+    def testDefaultConfigurationFiltersOnTheServer(self):
+        """
+        Builds the adapter the way the GitHub panels do from the default preferences
+        """
+        issueCacheEnabled: bool               = self._defaultPreference(keyName='gitHubIssueCache')
+        fetchBackend:      GitHubFetchBackend = self._defaultPreference(keyName='gitHubFetchBackend')
+        maxConcurrency:    int                = self._defaultPreference(keyName='gitHubMaxConcurrency')
+
+        self.assertFalse(issueCacheEnabled, 'The issue cache would bypass the server side filters')
+
+        githubAdapter: GithubAdapter = GithubAdapter(userName='mockUserName', authenticationToken='mockToken',
+                                                     maxConcurrency=maxConcurrency, fetchBackend=fetchBackend)
+
+        mockMileStone = Mock()
+        mockMileStone.title = TestGithubAdapter.TEST_MILESTONE_TITLE
+
+        mockRepo = Mock()
+        mockRepo.get_milestones.return_value = createPaginatedList([mockMileStone])
+        mockRepo.get_issues.return_value     = createPaginatedList([Mock(title=f'Issue {x}', labels=[]) for x in range(250)])
+
+        mockGithub = Mock()
+        mockGithub.get_repo.return_value = mockRepo
+        githubAdapter._github       = mockGithub
+        githubAdapter._createGithub = Mock(return_value=mockGithub)     # type: ignore
+
+        pageSizes: List[int] = [len(page) for page in githubAdapter.iterateAbbreviatedIssues(TestGithubAdapter.TEST_REPOSITORY_NAME, TestGithubAdapter.TEST_MILESTONE_TITLE)]
+
+        self.assertEqual([100, 100, 50], pageSizes, 'Milestone issues should stream a page at a time')
+        mockRepo.get_issues.assert_called_with(state=GithubAdapter.OPEN_ISSUE_INDICATOR, milestone=mockMileStone)
+
+        issueOwner: IssueOwner = IssueOwner('mockUserName')
+        githubAdapter.getIssuesAssignedToOwner(Slugs([TestGithubAdapter.TEST_REPOSITORY_NAME]), issueOwner=issueOwner, callback=self._progressMonitor)
+
+        mockRepo.get_issues.assert_called_with(state=GithubAdapter.OPEN_ISSUE_INDICATOR, assignee=issueOwner)
+
     def testGetIssuesAssignedToOwner(self):
 
         preferences: Preferences = Preferences()
@@ -139,7 +539,7 @@ class TestGithubAdapter(ProjectTestBase):
         )
 
         issueOwner: IssueOwner = IssueOwner(preferences.gitHubUserName)
-        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._statusCallback)
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._progressMonitor)
 
         print(f'Retrieved a total of {len(simpleGitIssues)} issues')
 
@@ -157,15 +557,21 @@ class TestGithubAdapter(ProjectTestBase):
         )
 
         issueOwner: IssueOwner = IssueOwner(preferences.gitHubUserName)
-        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._statusCallback)
+        simpleGitIssues: AbbreviatedGitIssues = githubAdapter.getIssuesAssignedToOwner(slugs, issueOwner=issueOwner, callback=self._progressMonitor)
 
         for issue in simpleGitIssues:
             simpleIssue: AbbreviatedGitIssue = cast(AbbreviatedGitIssue, issue)
 
             self.assertNotEqual('Not Assigned To Me', simpleIssue.issueTitle, 'Should not get this one')
 
-    def _statusCallback(self, msg: str):
-        self.logger.info(f'{msg}')
+    def _defaultPreference(self, keyName: str) -> Any:
+
+        valueDescription: ValueDescription = SECTION_GITHUB[KeyName(keyName)]
+
+        return valueDescription.deserializer(valueDescription.defaultValue)
+
+    def _statusCallback(self, report: ProgressReport):
+        self.logger.info(f'{report.message}')
 
 
 def suite() -> TestSuite:
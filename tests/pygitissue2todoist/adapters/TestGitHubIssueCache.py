@@ -0,0 +1,123 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from datetime import datetime
+from datetime import timezone
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import CachedIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import CachedIssues
+from pygitissue2todoist.adapters.GitHubAdapterTypes import Slug
+
+from pygitissue2todoist.adapters.GitHubIssueCache import GitHubIssueCache
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_SLUG:       Slug = Slug('hasii2011/MockRepo')
+TEST_OTHER_SLUG: Slug = Slug('hasii2011/OtherMockRepo')
+
+SYNCHRONIZED_AT: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class TestGitHubIssueCache(ProjectTestBase):
+
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        ProjectTestBase.setUpLogging()
+        TestGitHubIssueCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestGitHubIssueCache.clsLogger
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._issueCache:         GitHubIssueCache   = GitHubIssueCache(databasePath=Path(self._temporaryDirectory.name) / 'issues.sqlite', maxIssues=5)
+
+    def tearDown(self):
+        self._issueCache.close()
+        self._temporaryDirectory.cleanup()
+
+    def testUnknownRepositoryIsNotSynchronized(self):
+        self.assertIsNone(self._issueCache.synchronizedAt(TEST_SLUG), 'Never saw this repository')
+
+    def testReplaceIssues(self):
+
+        self._issueCache.replaceIssues(slug=TEST_SLUG, cachedIssues=self._createIssues(1, 2), synchronizedAt=SYNCHRONIZED_AT)
+
+        self.assertEqual(SYNCHRONIZED_AT, self._issueCache.synchronizedAt(TEST_SLUG), 'Synchronization time not recorded')
+        self.assertEqual(['Issue 1', 'Issue 2'], self._titles(self._issueCache.openIssues(slug=TEST_SLUG)), 'Wrong issues')
+
+    def testApplyChangesUpsertsAndDeletes(self):
+
+        self._issueCache.replaceIssues(slug=TEST_SLUG, cachedIssues=self._createIssues(1, 2, 3), synchronizedAt=SYNCHRONIZED_AT)
+
+        changedIssues: CachedIssues = self._createIssues(2, 4)
+        changedIssues[0].issueTitle = 'Issue 2 Renamed'
+        changedIssues.append(CachedIssue(number=1, isOpen=False))
+
+        self._issueCache.applyChanges(slug=TEST_SLUG, changedIssues=changedIssues, synchronizedAt=SYNCHRONIZED_AT)
+
+        actualTitles: List[str] = self._titles(self._issueCache.openIssues(slug=TEST_SLUG))
+
+        self.assertEqual(['Issue 2 Renamed', 'Issue 3', 'Issue 4'], actualTitles, 'Closed issue should be gone, the others upserted')
+
+    def testOpenIssuesFilters(self):
+
+        cachedIssues: CachedIssues = self._createIssues(1, 2, 3)
+        cachedIssues[0].milestoneNumber = 7
+        cachedIssues[1].assignees       = ['hasii2011']
+
+        self._issueCache.replaceIssues(slug=TEST_SLUG, cachedIssues=cachedIssues, synchronizedAt=SYNCHRONIZED_AT)
+
+        self.assertEqual(['Issue 1'], self._titles(self._issueCache.openIssues(slug=TEST_SLUG, milestoneNumber=7)), 'Milestone filter failed')
+        self.assertEqual(['Issue 2'], self._titles(self._issueCache.openIssues(slug=TEST_SLUG, assignee='hasii2011')), 'Assignee filter failed')
+
+    def testInvalidate(self):
+
+        self._issueCache.replaceIssues(slug=TEST_SLUG,       cachedIssues=self._createIssues(1), synchronizedAt=SYNCHRONIZED_AT)
+        self._issueCache.replaceIssues(slug=TEST_OTHER_SLUG, cachedIssues=self._createIssues(1), synchronizedAt=SYNCHRONIZED_AT)
+
+        self._issueCache.invalidate(TEST_SLUG)
+
+        self.assertIsNone(self._issueCache.synchronizedAt(TEST_SLUG), 'Repository should be forgotten')
+        self.assertEqual(1, self._issueCache.issueCount, 'Only the other repository should remain')
+
+    def testSizeCapEvictsLeastRecentlyRead(self):
+
+        self._issueCache.replaceIssues(slug=TEST_SLUG,       cachedIssues=self._createIssues(1, 2, 3), synchronizedAt=SYNCHRONIZED_AT)
+        self._issueCache.replaceIssues(slug=TEST_OTHER_SLUG, cachedIssues=self._createIssues(1, 2, 3), synchronizedAt=SYNCHRONIZED_AT)
+
+        self.assertIsNone(self._issueCache.synchronizedAt(TEST_SLUG), 'Older repository should be evicted')
+        self.assertEqual(3, self._issueCache.issueCount, 'Newest repository should survive')
+
+    def _createIssues(self, *numbers: int) -> CachedIssues:
+        return CachedIssues([CachedIssue(number=number, issueTitle=f'Issue {number}', issueHTMLURL=f'https://github.com/{number}') for number in numbers])
+
+    def _titles(self, simpleGitIssues: AbbreviatedGitIssues) -> List[str]:
+        return [simpleGitIssue.issueTitle for simpleGitIssue in simpleGitIssues]
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGitHubIssueCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,125 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import time
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import patch
+
+from requests.structures import CaseInsensitiveDict
+
+from pygitissue2todoist.adapters.RateLimitScheduler import RateLimitBudget
+from pygitissue2todoist.adapters.RateLimitScheduler import RateLimitScheduler
+
+from tests.ProjectTestBase import ProjectTestBase
+
+SLEEP_PATH: str = 'pygitissue2todoist.adapters.RateLimitScheduler.sleep'
+
+
+class TestRateLimitScheduler(ProjectTestBase):
+
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        ProjectTestBase.setUpLogging()
+        TestRateLimitScheduler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRateLimitScheduler.clsLogger
+
+        self._scheduler: RateLimitScheduler = RateLimitScheduler()
+        self._scheduler.reset()
+
+    def tearDown(self):
+        self._scheduler.reset()
+
+    def testBudgetFollowsHeaders(self):
+
+        self._scheduler.update(status=200, headers=self._createHeaders(remaining=4000, limit=5000, resetIn=1800))
+
+        budget: RateLimitBudget = cast(RateLimitBudget, self._scheduler.budget())
+
+        self.assertEqual(4000, budget.remaining, 'Remaining not recorded')
+        self.assertEqual(5000, budget.limit,     'Limit not recorded')
+        self.assertEqual(0.0, self._scheduler.expectedWait, 'A healthy budget should not wait')
+
+    def testRetryAfterBlocksEveryRequest(self):
+
+        headers: CaseInsensitiveDict = self._createHeaders(remaining=4000, limit=5000, resetIn=1800)
+        headers['Retry-After'] = '30'
+
+        waitSeconds = self._scheduler.update(status=403, headers=headers, body='You have exceeded a secondary rate limit')
+
+        self.assertEqual(30.0, waitSeconds, 'Retry-After not honored')
+        self.assertGreater(self._scheduler.expectedWait, 25.0, 'Requests should be held back')
+
+        with patch(SLEEP_PATH) as mockSleep:
+            messages = []
+            with self._scheduler.reportingTo(messages.append):
+                self._scheduler.acquire()
+
+        self.assertGreater(mockSleep.call_args[0][0], 25.0, 'Did not wait for Retry-After')
+        self.assertEqual(1, len(messages), 'The wait was not reported')
+
+    def testSecondaryLimitWithoutRetryAfterBacksOff(self):
+
+        first  = self._scheduler.update(status=429, headers=CaseInsensitiveDict())
+        second = self._scheduler.update(status=429, headers=CaseInsensitiveDict())
+
+        self.assertEqual(RateLimitScheduler.SECONDARY_LIMIT_WAIT,     first,  'Wrong initial wait')
+        self.assertEqual(RateLimitScheduler.SECONDARY_LIMIT_WAIT * 2, second, 'Consecutive limits should double the wait')
+
+    def testExhaustedBudgetWaitsForReset(self):
+
+        waitSeconds = self._scheduler.update(status=403, headers=self._createHeaders(remaining=0, limit=5000, resetIn=120))
+
+        self.assertIsNotNone(waitSeconds, 'An exhausted budget should be retried')
+        self.assertAlmostEqual(120.0, cast(float, waitSeconds), delta=2.0, msg='Should wait for the reset')
+
+    def testLowBudgetSpacesRequests(self):
+
+        self._scheduler.update(status=200, headers=self._createHeaders(remaining=100, limit=5000, resetIn=1000))
+
+        with patch(SLEEP_PATH) as mockSleep:
+            self._scheduler.acquire()
+            self._scheduler.acquire()
+
+        self.assertEqual(1, mockSleep.call_count, 'Only the second request should wait')
+        self.assertAlmostEqual(10.0, mockSleep.call_args[0][0], delta=1.0, msg='Requests should be spread until the reset')
+
+    def testPermissionDeniedIsFinal(self):
+
+        waitSeconds = self._scheduler.update(status=403, headers=self._createHeaders(remaining=4000, limit=5000, resetIn=1800),
+                                             body='{"message": "Resource not accessible by integration"}')
+
+        self.assertIsNone(waitSeconds, 'A permission problem is not a rate limit')
+        self.assertEqual(0.0, self._scheduler.expectedWait, 'Nothing should be blocked')
+
+    def _createHeaders(self, remaining: int, limit: int, resetIn: int) -> CaseInsensitiveDict:
+
+        return CaseInsensitiveDict({
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Limit':     str(limit),
+            'X-RateLimit-Reset':     str(int(time()) + resetIn),
+            'X-RateLimit-Resource':  'core',
+        })
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestRateLimitScheduler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,104 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from github import GithubException
+from github import UnknownObjectException
+
+from pygitissue2todoist.adapters.GitHubRetriesExhaustedError import GitHubRetriesExhaustedError
+from pygitissue2todoist.adapters.RetryPolicy import RetryPolicy
+
+from tests.ProjectTestBase import ProjectTestBase
+
+SLEEP_PATH: str = 'pygitissue2todoist.adapters.RetryPolicy.sleep'
+
+
+class TestRetryPolicy(ProjectTestBase):
+
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        ProjectTestBase.setUpLogging()
+        TestRetryPolicy.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRetryPolicy.clsLogger
+
+    def testRetriesServerErrors(self):
+
+        operation: Mock = Mock(side_effect=[GithubException(502, None, None), RequestsConnectionError('reset'), 'page'])
+
+        with patch(SLEEP_PATH) as mockSleep:
+            result: str = RetryPolicy(maxAttempts=3).call(operation, description='Mock listing')
+
+        self.assertEqual('page', result, 'Should return the successful attempt')
+        self.assertEqual(3, operation.call_count, 'Should have tried three times')
+        self.assertEqual(2, mockSleep.call_count, 'Should back off before each retry')
+
+    def testDoesNotRetryPermanentFailures(self):
+
+        operation: Mock = Mock(side_effect=UnknownObjectException(404, None, None))
+
+        with self.assertRaises(UnknownObjectException):
+            RetryPolicy().call(operation, description='Mock listing')
+
+        self.assertEqual(1, operation.call_count, 'A missing object will not appear on retry')
+
+    def testGivesUpAfterMaxAttempts(self):
+
+        operation: Mock = Mock(side_effect=GithubException(503, None, None))
+
+        with patch(SLEEP_PATH):
+            with self.assertRaises(GitHubRetriesExhaustedError):
+                RetryPolicy(maxAttempts=4).call(operation, description='Mock listing')
+
+        self.assertEqual(4, operation.call_count, 'Wrong number of attempts')
+
+    def testDeadlineStopsRetries(self):
+
+        operation: Mock = Mock(side_effect=GithubException(500, None, None))
+
+        with patch(SLEEP_PATH) as mockSleep:
+            with self.assertRaises(GitHubRetriesExhaustedError):
+                RetryPolicy(maxAttempts=10, initialBackoff=5.0, deadlineSeconds=1.0, jitter=False).call(operation, description='Mock listing')
+
+        self.assertEqual(1, operation.call_count, 'The first backoff already passes the deadline')
+        mockSleep.assert_not_called()
+
+    def testBackoffGrowsAndIsCapped(self):
+
+        retryPolicy: RetryPolicy = RetryPolicy(initialBackoff=1.0, maximumBackoff=5.0, jitter=False)
+
+        self.assertEqual([1.0, 2.0, 4.0, 5.0], [retryPolicy.backoff(attempt=attempt) for attempt in range(1, 5)], 'Backoff should double up to the maximum')
+
+    def testJitterStaysBelowBackoff(self):
+
+        retryPolicy: RetryPolicy = RetryPolicy(initialBackoff=8.0)
+
+        for _ in range(50):
+            self.assertTrue(0.0 <= retryPolicy.backoff(attempt=1) <= 8.0, 'Jitter must not exceed the backoff')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestRetryPolicy))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,142 @@
+
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from requests import Response
+
+from github.Requester import RequestsResponse
+
+from pygitissue2todoist.adapters.ConditionalRequestCache import CachedResponse
+from pygitissue2todoist.adapters.ConditionalRequestCache import ConditionalRequestCache
+from pygitissue2todoist.adapters.RevalidatingHTTPSConnection import RevalidatingHTTPSConnection
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_HOST: str = 'api.github.com'
+TEST_URL:  str = '/repos/hasii2011/MockRepo/issues?state=open'
+TEST_ETAG: str = 'W/"mockETag"'
+TEST_BODY: str = '[{"title": "Mock Issue"}]'
+
+
+class TestRevalidatingHTTPSConnection(ProjectTestBase):
+
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        ProjectTestBase.setUpLogging()
+        TestRevalidatingHTTPSConnection.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestRevalidatingHTTPSConnection.clsLogger
+
+        self._temporaryDirectory: TemporaryDirectory      = TemporaryDirectory()
+        self._cache:              ConditionalRequestCache = ConditionalRequestCache(databasePath=Path(self._temporaryDirectory.name) / 'responses.sqlite')
+
+    def tearDown(self):
+        self._cache.close()
+        self._temporaryDirectory.cleanup()
+
+    def testNotModifiedReplaysStoredBody(self):
+
+        mockSession = Mock()
+        mockSession.get.side_effect = [
+            self._createResponse(status=200, body=TEST_BODY, headers={'ETag': TEST_ETAG, 'Link': '<next>; rel="next"', 'X-RateLimit-Remaining': '4999'}),
+            self._createResponse(status=304, body='',        headers={'ETag': TEST_ETAG, 'X-RateLimit-Remaining': '4998'}),
+        ]
+
+        firstResponse:  RequestsResponse = self._request(mockSession)
+        secondResponse: RequestsResponse = self._request(mockSession)
+
+        sentHeaders = mockSession.get.call_args.kwargs['headers']
+
+        self.assertEqual(TEST_ETAG, sentHeaders['If-None-Match'], 'Second request should be conditional')
+        self.assertEqual(200, secondResponse.status, 'PyGithub must see a normal response')
+        self.assertEqual(firstResponse.read(), secondResponse.read(), 'Stored body should be replayed')
+        self.assertEqual('<next>; rel="next"', secondResponse.headers['Link'], 'Pagination must survive the replay')
+        self.assertEqual('4998', secondResponse.headers['X-RateLimit-Remaining'], 'Fresh rate limit headers should win')
+        self.assertEqual(1, self._cache.hitCount, 'One revalidated response')
+
+    def testChangedBodyCountsAsMiss(self):
+
+        mockSession = Mock()
+        mockSession.get.side_effect = [
+            self._createResponse(status=200, body=TEST_BODY, headers={'ETag': TEST_ETAG}),
+            self._createResponse(status=200, body='[]',      headers={'ETag': 'W/"changedETag"'}),
+        ]
+
+        self._request(mockSession)
+        self.assertEqual(0, self._cache.missCount, 'The first request was not conditional')
+
+        self._request(mockSession)
+        self.assertEqual(1, self._cache.missCount, 'GitHub sent a new body for a conditional request')
+
+    def testSizeCapCountsBytes(self):
+
+        body:  str                     = '"\u00e9\u00e9"'     # Four characters, six bytes
+        cache: ConditionalRequestCache = ConditionalRequestCache(databasePath=Path(self._temporaryDirectory.name) / 'capped.sqlite', maxBytes=10)
+
+        cache.store(cache.createKey(url='first',  credentials=''), CachedResponse(etag=TEST_ETAG, body=body))
+        cache.store(cache.createKey(url='second', credentials=''), CachedResponse(etag=TEST_ETAG, body=body))
+
+        self.assertIsNone(cache.lookup(cache.createKey(url='first',  credentials='')), 'Twelve bytes exceed the cap;  The older entry goes')
+        self.assertIsNotNone(cache.lookup(cache.createKey(url='second', credentials='')))
+
+        cache.close()
+
+    def testRequestsWithoutValidatorsAreNotStored(self):
+
+        mockSession = Mock()
+        mockSession.get.side_effect = [
+            self._createResponse(status=200, body=TEST_BODY, headers={}),
+            self._createResponse(status=200, body=TEST_BODY, headers={}),
+        ]
+
+        self._request(mockSession)
+        self._request(mockSession)
+
+        self.assertNotIn('If-None-Match', mockSession.get.call_args.kwargs['headers'], 'Nothing to revalidate')
+
+    def _request(self, mockSession: Mock) -> RequestsResponse:
+
+        connection: RevalidatingHTTPSConnection = RevalidatingHTTPSConnection(host=TEST_HOST, cache=self._cache)
+        connection.session = mockSession
+
+        connection.request('GET', TEST_URL, None, {'Authorization': 'token mockToken'})
+
+        return connection.getresponse()
+
+    def _createResponse(self, status: int, body: str, headers) -> Response:
+
+        response: Response = Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.encoding = 'utf-8'
+        response._content = body.encode('utf-8')
+
+        return response
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestRevalidatingHTTPSConnection))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
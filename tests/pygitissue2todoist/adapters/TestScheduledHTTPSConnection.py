@@ -0,0 +1,81 @@
+
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from requests import Session
+
+from github import Github
+from github.Requester import HTTPSRequestsConnectionClass
+from github.Requester import Requester
+
+from pygitissue2todoist.adapters.ScheduledHTTPSConnection import ScheduledHTTPSConnection
+
+from tests.ProjectTestBase import ProjectTestBase
+
+TEST_HOST: str = 'api.github.com'
+
+
+class TestScheduledHTTPSConnection(ProjectTestBase):
+    """
+    Only builds clients and connections;  Nothing is sent
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        ProjectTestBase.setUpLogging()
+        TestScheduledHTTPSConnection.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestScheduledHTTPSConnection.clsLogger
+
+    def testAttachOnlyChangesThatClient(self):
+
+        scheduled: Github = ScheduledHTTPSConnection.attach(Github())
+        plain:     Github = Github()
+
+        self.assertIsInstance(self._createConnection(scheduled), ScheduledHTTPSConnection)
+        self.assertNotIsInstance(self._createConnection(plain), ScheduledHTTPSConnection, 'Other clients keep their connections')
+
+        # noinspection PyProtectedMember
+        self.assertIs(HTTPSRequestsConnectionClass, Requester._Requester__httpsConnectionClass, 'Nothing process wide should change')     # type: ignore
+
+    def testConnectionsShareTheThreadsSession(self):
+
+        first:  ScheduledHTTPSConnection = ScheduledHTTPSConnection(TEST_HOST)
+        second: ScheduledHTTPSConnection = ScheduledHTTPSConnection(TEST_HOST)
+
+        otherThreadSessions: List[Session] = []
+        worker: Thread = Thread(target=lambda: otherThreadSessions.append(ScheduledHTTPSConnection(TEST_HOST).session))
+        worker.start()
+        worker.join()
+
+        self.assertIs(first.session, second.session, 'Connections on one thread reuse the session')
+        self.assertIsNot(first.session, otherThreadSessions[0], 'Threads never share a session')
+
+    def _createConnection(self, github: Github) -> HTTPSRequestsConnectionClass:
+
+        # noinspection PyProtectedMember
+        return github.requester._Requester__createConnection()     # type: ignore
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestScheduledHTTPSConnection))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
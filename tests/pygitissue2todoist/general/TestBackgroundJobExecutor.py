@@ -0,0 +1,123 @@
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from queue import Queue
+
+from threading import Event
+from threading import current_thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJob
+from pygitissue2todoist.general.BackgroundJobExecutor import BackgroundJobExecutor
+from pygitissue2todoist.general.BackgroundJobExecutor import JobContext
+
+from tests.ProjectTestBase import ProjectTestBase
+
+WAIT_SECONDS: float = 5.0
+
+
+class TestBackgroundJobExecutor(ProjectTestBase):
+    """
+    The test thread plays the UI thread;  The dispatcher queues calls for it to run
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._dispatched: Queue                 = Queue()
+        self._executor:   BackgroundJobExecutor = BackgroundJobExecutor(dispatcher=self._dispatch)
+
+    def tearDown(self):
+        super().tearDown()
+        self._executor.shutdown()
+
+    def testResultArrivesOnTheUIThread(self):
+
+        threadNames: List[str] = []
+
+        def work(context: JobContext) -> int:
+            threadNames.append(current_thread().name)
+            context.monitor('Working')
+            return 42
+
+        messages: List[str] = []
+        results:  List[Any] = []
+        self._executor.submit(BackgroundJob(name='answer', work=work, onResult=results.append,
+                                            onProgress=lambda report: messages.append(report.message)))
+
+        self._runDispatched(count=2)
+
+        self.assertEqual(['BackgroundJobs'], threadNames, 'The work should run on the worker thread')
+        self.assertEqual(['Working'], messages)
+        self.assertEqual([42], results)
+
+    def testErrorIsHandedOver(self):
+
+        def work(context: JobContext):
+            raise ValueError('No network')
+
+        errors: List[Exception] = []
+        self._executor.submit(BackgroundJob(name='failing', work=work, onError=errors.append))
+
+        self._runDispatched(count=1)
+
+        self.assertEqual(['No network'], [str(error) for error in errors])
+
+    def testCancelledJobDeliversNothing(self):
+
+        started: Event = Event()
+        release: Event = Event()
+
+        def blocking(context: JobContext) -> str:
+            started.set()
+            release.wait(WAIT_SECONDS)
+            context.deliver(pages.append, 'page')
+            return 'blocking'
+
+        pages:   List[str] = []
+        results: List[str] = []
+        blockingJob: BackgroundJob = self._executor.submit(BackgroundJob(name='blocking', work=blocking, onResult=results.append))
+        queuedJob:   BackgroundJob = self._executor.submit(BackgroundJob(name='queued',   work=lambda context: 'queued', onResult=results.append))
+        self._executor.submit(BackgroundJob(name='next', work=lambda context: 'next', onResult=results.append))
+
+        started.wait(WAIT_SECONDS)
+        blockingJob.cancel()
+        queuedJob.cancel()
+        release.set()
+
+        self._runDispatched(count=3)
+
+        self.assertEqual([], pages, 'A cancelled job should not deliver partial results')
+        self.assertEqual(['next'], results, 'Only the job that was not cancelled should report')
+
+    def _dispatch(self, callback: Callable, *args):
+        self._dispatched.put((callback, args))
+
+    def _runDispatched(self, count: int):
+
+        for _ in range(count):
+            dispatched: Tuple[Callable, Tuple] = self._dispatched.get(timeout=WAIT_SECONDS)
+            callback, args = dispatched
+            callback(*args)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBackgroundJobExecutor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,141 @@
+
+from typing import List
+
+from threading import Event
+from threading import Thread
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.general.CoalescingProgressSink import CoalescingProgressSink
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+from tests.ProjectTestBase import ProjectTestBase
+
+#
+# Long enough that the real timer never fires while a test drives the clock
+#
+REFRESH_INTERVAL: float = 10.0
+WAIT_SECONDS:     float = 5.0
+
+
+class TestCoalescingProgressSink(ProjectTestBase):
+    """
+    Drives the sink with a clock the test controls;  Only the trailing timer runs on real time
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._now:    float                = 100.0
+        self._passed: List[ProgressReport] = []
+
+        self._sink:    CoalescingProgressSink = CoalescingProgressSink(onReport=self._passed.append, refreshInterval=REFRESH_INTERVAL, clock=self._clock)
+        self._monitor: ProgressMonitor        = ProgressMonitor(listener=self._sink, clock=self._clock)
+
+    def tearDown(self):
+        super().tearDown()
+        self._sink.flush()      # Stops a pending timer
+
+    def testBurstIsCoalesced(self):
+
+        self._monitor.startPhase(phase='Creating', total=100)
+        for count in range(100):
+            self._monitor.advance(message=f'Created task {count}')
+        self._now += 2 * REFRESH_INTERVAL
+        self._monitor.advance(count=0, message='Next refresh')
+
+        self.assertEqual(['Creating', 'Next refresh'], [report.message for report in self._passed])
+        self.assertEqual(102, len(self._sink.log), 'Every message is logged')
+
+    def testFlushShowsTheLastReport(self):
+
+        self._monitor.startPhase(phase='Creating', total=2)
+        self._monitor.advance(message='Created the first task')
+        self._monitor.advance(message='Created the second task')
+        self._sink.flush()
+        self._sink.flush()
+
+        self.assertEqual(['Creating', 'Created the second task'], [report.message for report in self._passed])
+        self.assertEqual(2, self._passed[-1].completed)
+
+    def testHeldBackReportArrivesWithoutAnotherReport(self):
+
+        delivered: Event = Event()
+
+        def onReport(report: ProgressReport):
+            passed.append(report.message)
+            if report.message == 'GitHub rate limit: waiting 60 seconds':
+                delivered.set()
+
+        passed:  List[str]              = []
+        sink:    CoalescingProgressSink = CoalescingProgressSink(onReport=onReport, refreshInterval=0.05)
+        monitor: ProgressMonitor        = ProgressMonitor(listener=sink)
+
+        monitor.startPhase(phase='Retrieving issues')
+        monitor('GitHub rate limit: waiting 60 seconds')
+
+        self.assertTrue(delivered.wait(WAIT_SECONDS), 'The timer should pass on the held back report')
+        self.assertEqual(['Retrieving issues', 'GitHub rate limit: waiting 60 seconds'], passed)
+
+    def testLogKeepsTheLatestMessages(self):
+
+        sink: CoalescingProgressSink = CoalescingProgressSink(clock=self._clock, logLimit=3)
+        for count in range(5):
+            sink(ProgressReport(phase='Creating', message=f'Created task {count}'))
+
+        self.assertEqual(['Created task 2', 'Created task 3', 'Created task 4'], sink.log)
+
+    def testOnReportMayReportBack(self):
+
+        def onReport(report: ProgressReport):
+            passed.append(report.message)
+            if report.message == 'Created a task':
+                sink(ProgressReport(phase='Creating', message='Reported back'))
+
+        passed: List[str]              = []
+        sink:   CoalescingProgressSink = CoalescingProgressSink(onReport=onReport, refreshInterval=REFRESH_INTERVAL, clock=self._clock)
+
+        reporter: Thread = Thread(target=sink, args=(ProgressReport(phase='Creating', message='Created a task'),), daemon=True)
+        reporter.start()
+        reporter.join(WAIT_SECONDS)
+        sink.flush()
+
+        self.assertFalse(reporter.is_alive(), '`onReport` should run outside the lock')
+        self.assertEqual(['Created a task', 'Reported back'], passed)
+
+    def testNewPhaseIsPassedAtOnce(self):
+
+        self._monitor.startPhase(phase='Retrieving')
+        self._monitor.startPhase(phase='Creating', total=3)
+
+        self.assertEqual(['Retrieving', 'Creating'], [report.phase for report in self._passed])
+
+    def testWithoutUIOnlyLogs(self):
+
+        sink: CoalescingProgressSink = CoalescingProgressSink(clock=self._clock)
+        sink(ProgressReport(phase='Creating', message='Created a task'))
+        sink.flush()
+
+        self.assertEqual(['Created a task'], sink.log)
+
+    def _clock(self) -> float:
+        return self._now
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestCoalescingProgressSink))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
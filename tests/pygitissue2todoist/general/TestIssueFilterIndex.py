@@ -0,0 +1,87 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssue
+from pygitissue2todoist.adapters.GitHubAdapterTypes import AbbreviatedGitIssues
+
+from pygitissue2todoist.general.IssueFilterIndex import IssueFilterIndex
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestIssueFilterIndex(ProjectTestBase):
+    """
+    Indexes two pages the way the selectors receive them
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._index: IssueFilterIndex = IssueFilterIndex()
+        self._index.add(AbbreviatedGitIssues([
+            AbbreviatedGitIssue(slug='hasii2011/PyGitIssue2Todoist', issueTitle='Fix the cache',   labels=['bug']),
+            AbbreviatedGitIssue(slug='hasii2011/code-ally-basic',    issueTitle='Add a logger',    labels=['enhancement']),
+        ]))
+        self._index.add(AbbreviatedGitIssues([
+            AbbreviatedGitIssue(slug='hasii2011/PyGitIssue2Todoist', issueTitle='Speed up sync',   labels=['enhancement', 'good first issue']),
+            AbbreviatedGitIssue(slug='hasii2011/code-ally-basic',    issueTitle='Cache the fonts', labels=[]),
+        ]))
+
+    def testEmptyQueryMatchesEverything(self):
+
+        self.assertEqual(4, len(self._index))
+        self.assertEqual([0, 1, 2, 3], self._index.search(query='  '))
+
+    def testWordPrefixesAcrossFields(self):
+
+        self.assertEqual([0, 3], self._index.search(query='CACH'),  'Titles are matched by word prefix, ignoring case')
+        self.assertEqual([1, 3], self._index.search(query='ally'),  'Slugs are split into words')
+        self.assertEqual([1, 2], self._index.search(query='enh'),   'Labels are indexed')
+
+    def testEveryWordMustMatch(self):
+
+        self.assertEqual([2],  self._index.search(query='enhancement pygit'))
+        self.assertEqual([],   self._index.search(query='cache logger'))
+        self.assertEqual([],   self._index.search(query='missing'))
+
+    def testWordsInAnyScript(self):
+
+        self._index.add(AbbreviatedGitIssues([
+            AbbreviatedGitIssue(slug='hasii2011/code-ally-basic', issueTitle='Übersetzung der Straße', labels=['ドキュメント']),
+        ]))
+
+        self.assertEqual([4], self._index.search(query='über'),       'Case folds outside ASCII')
+        self.assertEqual([4], self._index.search(query='STRASSE'),    'Case folding maps ß to ss')
+        self.assertEqual([4], self._index.search(query='ドキュ'),      'Labels in other scripts are indexed')
+        self.assertEqual([],  self._index.search(query='日本語'),      'A query in another script is not empty')
+
+    def testShortWordsAreIgnored(self):
+
+        self.assertEqual([0, 1, 2, 3], self._index.search(query='ca'),        'Too short to search for')
+        self.assertEqual([0, 3],       self._index.search(query='cache a'),   'Only the long enough words count')
+
+    def testClear(self):
+
+        self._index.clear()
+        self._index.add(AbbreviatedGitIssues([AbbreviatedGitIssue(slug='hasii2011/code-ally-basic', issueTitle='Add a logger')]))
+
+        self.assertEqual([0], self._index.search(query='logger'))
+        self.assertEqual([],  self._index.search(query='cache'))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIssueFilterIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,88 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+from pygitissue2todoist.general.exceptions.OperationCancelledError import OperationCancelledError
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestProgressMonitor(ProjectTestBase):
+    """
+    Drives the monitor with a clock the test controls
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._now:     float                = 100.0
+        self._reports: List[ProgressReport] = []
+
+        self._monitor: ProgressMonitor = ProgressMonitor(listener=self._reports.append, clock=self._clock)
+
+    def testPhaseReportsRateAndEta(self):
+
+        self._monitor.startPhase(phase='Creating', total=40)
+        self._now += 2.0
+        self._monitor.advance(count=10, message='Sent 10')
+
+        report: ProgressReport = self._reports[-1]
+
+        self.assertEqual('Sent 10', report.message)
+        self.assertEqual(25, report.percent)
+        self.assertAlmostEqual(5.0, report.itemsPerSecond)
+        self.assertAlmostEqual(6.0, report.etaSeconds)
+
+    def testNewPhaseStartsOver(self):
+
+        self._monitor.startPhase(phase='Retrieving', total=3)
+        self._monitor.advance(count=3)
+        self._monitor.startPhase(phase='Creating')
+
+        report: ProgressReport = self._reports[-1]
+
+        self.assertEqual('Creating', report.phase)
+        self.assertEqual(0, report.completed)
+        self.assertFalse(report.isDeterminate, 'A phase without a total only pulses')
+        self.assertIsNone(report.etaSeconds)
+
+    def testMessageDoesNotAdvance(self):
+
+        self._monitor.startPhase(phase='Creating', total=2)
+        self._monitor('Found the repository task')
+
+        self.assertEqual(['Creating', 'Found the repository task'], [report.message for report in self._reports])
+        self.assertEqual(0, self._reports[-1].completed)
+
+    def testCancel(self):
+
+        self._monitor.raiseIfCancelled()
+        self._monitor.cancel()
+
+        self.assertTrue(self._monitor.cancelled)
+        self.assertRaises(OperationCancelledError, self._monitor.raiseIfCancelled)
+
+    def _clock(self) -> float:
+        return self._now
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProgressMonitor))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
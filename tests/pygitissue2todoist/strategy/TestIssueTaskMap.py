@@ -0,0 +1,93 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.strategy.IssueTaskMap import IssueKey
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskMap
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskRows
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskScope
+from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+
+from tests.ProjectTestBase import ProjectTestBase
+
+ISSUE_URL: str = 'https://github.com/hasii2011/PyGitIssue2Todoist/issues/42'
+
+SINGLE_PROJECT_SCOPE: IssueTaskScope = IssueTaskMap.scope(strategyName='TodoistCreateSingleProject', projectName='Development')
+
+
+class TestIssueTaskMap(ProjectTestBase):
+    """
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._databasePath:       Path               = Path(self._temporaryDirectory.name) / 'issueTasks.sqlite'
+        self._issueTaskMap:       IssueTaskMap       = IssueTaskMap(databasePath=self._databasePath)
+
+    def tearDown(self):
+        super().tearDown()
+        self._issueTaskMap.close()
+        self._temporaryDirectory.cleanup()
+
+    def testRenamedIssueFindsItsTask(self):
+
+        self._issueTaskMap.record(IssueTaskRows({IssueKey('hasii2011/pygitissue2todoist#42'): TaskId('1')}), scope=SINGLE_PROJECT_SCOPE)
+
+        gitIssueInfo: GitIssueInfo = GitIssueInfo(slug='hasii2011/PyGitIssue2Todoist', gitIssueName='A new title', gitIssueURL=ISSUE_URL)
+
+        self.assertEqual(TaskId('1'), self._issueTaskMap.taskIdFor(gitIssueInfo, scope=SINGLE_PROJECT_SCOPE))
+
+    def testMapIsPersistent(self):
+
+        self._issueTaskMap.record(IssueTaskRows({IssueKey('hasii2011/pygitissue2todoist#42'): TaskId('1')}), scope=SINGLE_PROJECT_SCOPE)
+        self._issueTaskMap.close()
+
+        self._issueTaskMap = IssueTaskMap(databasePath=self._databasePath)
+
+        self.assertEqual(1, len(self._issueTaskMap))
+
+    def testDeletedTaskIsForgotten(self):
+
+        self._issueTaskMap.record(IssueTaskRows({IssueKey('hasii2011/pygitissue2todoist#42'): TaskId('1')}), scope=SINGLE_PROJECT_SCOPE)
+        self._issueTaskMap.forgetTasks(['1'])
+
+        self.assertIsNone(self._issueTaskMap.taskIdFor(GitIssueInfo(gitIssueURL=ISSUE_URL), scope=SINGLE_PROJECT_SCOPE))
+
+    def testOtherLayoutClonesAgain(self):
+
+        self._issueTaskMap.record(IssueTaskRows({IssueKey('hasii2011/pygitissue2todoist#42'): TaskId('1')}), scope=SINGLE_PROJECT_SCOPE)
+
+        gitIssueInfo:  GitIssueInfo   = GitIssueInfo(gitIssueURL=ISSUE_URL)
+        otherProject:  IssueTaskScope = IssueTaskMap.scope(strategyName='TodoistCreateSingleProject', projectName='Side Projects')
+        otherStrategy: IssueTaskScope = IssueTaskMap.scope(strategyName='TodoistCreateByRepository',  projectName='')
+
+        self.assertIsNone(self._issueTaskMap.taskIdFor(gitIssueInfo, scope=otherProject),  'Another project has no task for the issue')
+        self.assertIsNone(self._issueTaskMap.taskIdFor(gitIssueInfo, scope=otherStrategy), 'Another strategy has no task for the issue')
+
+    def testIssueWithoutGitHubURL(self):
+
+        self.assertIsNone(self._issueTaskMap.taskIdFor(GitIssueInfo(gitIssueName='Task', gitIssueURL='https://Task.org'), scope=SINGLE_PROJECT_SCOPE))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIssueTaskMap))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
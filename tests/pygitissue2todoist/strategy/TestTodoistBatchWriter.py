@@ -0,0 +1,177 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import loads as jsonLoads
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+from pygitissue2todoist.strategy.TodoistBatchWriter import TodoistBatchWriter
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+
+from tests.ProjectTestBase import ProjectTestBase
+
+MOCK_PROJECT_ID: str = 'mockProjectId'
+
+
+class TestTodoistBatchWriter(ProjectTestBase):
+    """
+    Answers the Sync API requests from a mock session, so no Todoist account is needed
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._sentBatches: List[List[Dict[str, Any]]] = []
+        self._failures:    Dict[str, Dict[str, Any]] = {}
+
+        self._session: Mock = Mock()
+        self._session.post.side_effect = self._answerSync
+
+        self._batchWriter: TodoistBatchWriter = TodoistBatchWriter(apiToken='mockToken', session=self._session)
+
+    def testBatchesCommands(self):
+
+        for x in range(150):
+            self._batchWriter.addTask(content=f'Task {x}', projectId=MOCK_PROJECT_ID)
+
+        self.assertEqual(150, self._batchWriter.pendingCount, 'Nothing should be sent before the flush')
+
+        self._batchWriter.flush()
+
+        self.assertEqual([100, 50], [len(batch) for batch in self._sentBatches], 'At most 100 commands per request')
+        self.assertEqual(0, self._batchWriter.pendingCount, 'The flush should empty the queue')
+        self.assertEqual(150, len(self._batchWriter.tempIdMapping), 'Every task should have a real id')
+
+    def testCancelSkipsTheRemainingRequests(self):
+
+        for x in range(250):
+            self._batchWriter.addTask(content=f'Task {x}', projectId=MOCK_PROJECT_ID)
+
+        def cancelAfterFirstRequest(report: ProgressReport):
+            monitor.cancel()
+
+        monitor: ProgressMonitor = ProgressMonitor()
+        monitor.startPhase(phase='Creating', total=250)
+        monitor.listener = cancelAfterFirstRequest
+
+        results: CreationResults = self._batchWriter.flush(monitor=monitor)
+
+        self.assertEqual(1, len(self._sentBatches), 'The request in flight finishes;  No other is sent')
+        self.assertEqual(100, monitor.report.completed)
+        self.assertEqual(150, len([result for result in results if result.skipped is True]))
+        self.assertEqual(100, len([result for result in results if result.succeeded is True]))
+
+    def testNoteRefersToQueuedTask(self):
+
+        tempId: TempId = self._batchWriter.addTask(content='Task', projectId=MOCK_PROJECT_ID)
+        self._batchWriter.addNote(taskId=tempId, content='https://github.com')
+
+        self._batchWriter.flush()
+
+        commands: List[Dict[str, Any]] = self._sentBatches[0]
+
+        self.assertEqual(['item_add', 'note_add'], [command['type'] for command in commands], 'Both commands belong in a single request')
+        self.assertEqual(tempId, commands[1]['args']['item_id'], 'The note should refer to the temporary id')
+
+    def testReferencesAcrossRequestsAreResolved(self):
+
+        batchWriter: TodoistBatchWriter = TodoistBatchWriter(apiToken='mockToken', session=self._session, maxCommandsPerRequest=1)
+
+        parentId: TempId = batchWriter.addTask(content='Repository', projectId=MOCK_PROJECT_ID)
+        batchWriter.addTask(content='Issue', projectId=MOCK_PROJECT_ID, parentId=parentId)
+
+        batchWriter.flush()
+
+        realParentId: TaskId = batchWriter.resolve(parentId)
+
+        self.assertNotEqual(parentId, realParentId, 'The parent should have a real id')
+        self.assertEqual(realParentId, self._sentBatches[1][0]['args']['parent_id'], 'The second request must use the real id')
+
+    def testCreatedItemsUseRealIds(self):
+
+        parentId: TempId = self._batchWriter.addTask(content='Repository', projectId=MOCK_PROJECT_ID)
+        self._batchWriter.addTask(content='Issue', projectId=MOCK_PROJECT_ID, parentId=parentId)
+        self._batchWriter.addNote(taskId=parentId, content='https://github.com')
+
+        self._batchWriter.flush()
+
+        items: List[Dict[str, Any]] = self._batchWriter.createdItems
+        realParentId: TaskId = self._batchWriter.resolve(parentId)
+
+        self.assertEqual(['Repository', 'Issue'], [item['content'] for item in items], 'Only the tasks are items')
+        self.assertEqual(realParentId, items[0]['id'])
+        self.assertEqual(realParentId, items[1]['parent_id'], 'The replica must not see temporary ids')
+
+    def testFailedCommandIsReported(self):
+
+        tempId: TempId = self._batchWriter.addTask(content='Task', projectId=MOCK_PROJECT_ID)
+        self._batchWriter.addNote(taskId=tempId, content='https://github.com')
+        self._failures['note_add'] = {'error_code': 16, 'error': 'Invalid temporary id'}
+
+        results: CreationResults = self._batchWriter.flush()
+
+        self.assertEqual([True, False], [result.succeeded for result in results], 'One result per creation')
+        self.assertEqual(self._batchWriter.resolve(tempId), results[0].taskId, 'The accepted task keeps its id')
+        self.assertEqual(16, results[1].errorCode, 'The error code should be kept for the error handler')
+
+    def testRequestsAfterAFailureAreSkipped(self):
+
+        batchWriter: TodoistBatchWriter = TodoistBatchWriter(apiToken='mockToken', session=self._session, maxCommandsPerRequest=2)
+
+        firstId: TempId = batchWriter.addTask(content='First task', projectId=MOCK_PROJECT_ID)
+        batchWriter.addNote(taskId=firstId, content='https://github.com')
+        batchWriter.addTask(content='Second task', projectId=MOCK_PROJECT_ID)
+        self._failures['note_add'] = {'error_code': 16, 'error': 'Invalid temporary id'}
+
+        results: CreationResults = batchWriter.flush()
+
+        self.assertEqual(1, len(self._sentBatches), 'Nothing is sent after the failed request')
+        self.assertEqual(['First task', 'https://github.com', 'Second task'], [result.content for result in results])
+        self.assertEqual([True, False, False], [result.succeeded for result in results])
+        self.assertTrue(results[2].skipped, 'The unsent creation is skipped')
+        self.assertIn(firstId, batchWriter.tempIdMapping, 'The accepted task is known')
+
+    def _answerSync(self, url: str, headers: Dict[str, str], data: str) -> Mock:
+
+        commands: List[Dict[str, Any]] = jsonLoads(data)['commands']
+        self._sentBatches.append(commands)
+
+        syncStatus:    Dict[str, Any] = {}
+        tempIdMapping: Dict[str, str] = {}
+        for command in commands:
+            syncStatus[command['uuid']] = self._failures.get(command['type'], 'ok')
+            if 'temp_id' in command:
+                tempIdMapping[command['temp_id']] = f'real-{len(self._sentBatches)}-{len(tempIdMapping)}'
+
+        response: Mock = Mock()
+        response.status_code = 200
+        response.json.return_value = {'sync_status': syncStatus, 'temp_id_mapping': tempIdMapping}
+
+        return response
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistBatchWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
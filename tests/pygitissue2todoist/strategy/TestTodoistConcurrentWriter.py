@@ -0,0 +1,113 @@
+
+from typing import List
+
+from asyncio import sleep
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.strategy.TodoistConcurrentWriter import TodoistConcurrentWriter
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CreationResults
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+
+from tests.ProjectTestBase import ProjectTestBase
+
+MOCK_PROJECT_ID: str = 'mockProjectId'
+
+
+class TestTodoistConcurrentWriter(ProjectTestBase):
+    """
+    Answers the REST calls from a mock asynchronous client, so no Todoist account is needed
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._inFlight:    int       = 0
+        self._maxInFlight: int       = 0
+        self._created:     List[str] = []
+        self._failing:     List[str] = []
+
+        self._todoistAsync: Mock = Mock()
+        self._todoistAsync.add_task    = self._addTask
+        self._todoistAsync.add_comment = self._addComment
+
+    def testConcurrencyIsBounded(self):
+
+        writer: TodoistConcurrentWriter = TodoistConcurrentWriter(todoistAsync=self._todoistAsync, maxConcurrency=3)
+        for x in range(12):
+            writer.addTask(content=f'Task {x}', projectId=MOCK_PROJECT_ID)
+
+        results: CreationResults = writer.flush()
+
+        self.assertEqual(12, len([result for result in results if result.succeeded]), 'Every task should be created')
+        self.assertEqual(3, self._maxInFlight, 'Should use, but not exceed, the allowed concurrency')
+        self.assertEqual(12, writer.requestCount, 'One request per task')
+
+    def testParentIsCreatedFirst(self):
+
+        writer: TodoistConcurrentWriter = TodoistConcurrentWriter(todoistAsync=self._todoistAsync)
+
+        parentId: TempId = writer.addTask(content='Repository', projectId=MOCK_PROJECT_ID)
+        writer.addTask(content='Issue 1', projectId=MOCK_PROJECT_ID, parentId=parentId)
+        writer.addNote(taskId=parentId, content='https://github.com')
+
+        writer.flush()
+
+        self.assertEqual('Repository', self._created[0], 'The parent must exist before its children')
+        self.assertEqual(writer.resolve(parentId), 'id-Repository', 'The temporary id should resolve')
+
+    def testFailuresAreReportedPerTask(self):
+
+        self._failing.append('Repository')
+
+        writer: TodoistConcurrentWriter = TodoistConcurrentWriter(todoistAsync=self._todoistAsync)
+
+        parentId: TempId = writer.addTask(content='Repository', projectId=MOCK_PROJECT_ID)
+        writer.addTask(content='Orphan', projectId=MOCK_PROJECT_ID, parentId=parentId)
+        writer.addTask(content='Independent', projectId=MOCK_PROJECT_ID)
+
+        results: CreationResults = writer.flush()
+
+        self.assertEqual([False, False, True], [result.succeeded for result in results], 'Results follow the queue order')
+        self.assertNotIn('Orphan', self._created, 'A child of a failed task must not be created elsewhere')
+
+    async def _addTask(self, content: str, **kwargs) -> Task:
+
+        self._inFlight += 1
+        self._maxInFlight = max(self._maxInFlight, self._inFlight)
+        await sleep(0.01)
+        self._inFlight -= 1
+
+        if content in self._failing:
+            raise RuntimeError(f'Mock failure for {content}')
+
+        self._created.append(content)
+        task: Mock = Mock()
+        task.id = f'id-{content}'
+
+        return task
+
+    async def _addComment(self, content: str, task_id: str):
+        self._created.append(content)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistConcurrentWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
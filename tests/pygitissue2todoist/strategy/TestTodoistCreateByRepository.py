@@ -68,7 +68,7 @@ class TestTodoistCreateByRepository(TodoistStrategyUnitTestBase):
         ci.milestoneNameTask = 'MockMilestone'
         ci.tasksToClone      = self._createTasksToClone()
 
-        self._strategy.createTasks(info=ci, progressCb=self._sampleCallback)
+        self._strategy.createTasks(info=ci, progressCb=self._progressMonitor)
 
     def testGetCurrentProjects(self):
 
@@ -143,7 +143,7 @@ class TestTodoistCreateByRepository(TodoistStrategyUnitTestBase):
         info.milestoneNameTask = 'MockMilestone2'
         info.tasksToClone      = [GitIssueInfo(gitIssueName='MockTask3'), GitIssueInfo(gitIssueName='MockTask4')]
 
-        milestoneTask: Task = strategy._getMilestoneTaskItem(projectId=projectId, milestoneName='MockMilestone2', progressCb=self._sampleCallback)
+        milestoneTask: Task = strategy._getMilestoneTaskItem(projectId=projectId, milestoneName='MockMilestone2', progressCb=self._progressMonitor)
 
         taskName: str = milestoneTask.content
         self.assertEqual('MockMilestone2', taskName, 'Should get existing item')
@@ -191,7 +191,7 @@ class TestTodoistCreateByRepository(TodoistStrategyUnitTestBase):
         preferences.gitHubURLOption  = GitHubURLOption.HyperLinkedTaskName
 
         strategy: TodoistCreateByRepository = self._strategy
-        strategy.createTasks(ci, self._sampleCallback)
+        strategy.createTasks(ci, self._progressMonitor)
 
         preferences.gitHubURLOption = savedOption
 
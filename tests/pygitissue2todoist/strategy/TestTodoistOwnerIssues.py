@@ -0,0 +1,244 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from pygitissue2todoist.general.Preferences import Preferences
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
+
+from pygitissue2todoist.general.exceptions.OperationCancelledError import OperationCancelledError
+
+from pygitissue2todoist.strategy.IssueTaskMap import IssueTaskMap
+from pygitissue2todoist.strategy.TodoistBatchWriter import TodoistBatchWriter
+from pygitissue2todoist.strategy.TodoistOwnerIssues import TodoistOwnerIssues
+from pygitissue2todoist.strategy.TodoistStrategyTypes import CloneInformation
+from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TodoistPlan
+
+from tests.pygitissue2todoist.strategy.TodoistStrategyUnitTestBase import TodoistStrategyUnitTestBase
+
+MOCK_PROJECT_ID: str = 'mockProjectId'
+
+EXISTING_REPOSITORY: str = 'hasii2011/PyGitIssue2Todoist'
+NEW_REPOSITORY:      str = 'hasii2011/code-ally-basic'
+
+
+class TestTodoistOwnerIssues(TodoistStrategyUnitTestBase):
+    """
+    Replaces the Todoist clients with mocks;  Checks which requests the strategy makes
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._sentCommands: List[Dict[str, Any]] = []
+
+        session: Mock = Mock()
+        session.post.side_effect = self._answerSync
+
+        self._todoist: Mock = Mock()
+        self._todoist.get_tasks.return_value = [
+            self._createTask(taskId='1', content='PyGitIssue2Todoist'),
+            self._createTask(taskId='2', content='Fix the cache', parentId='1'),
+        ]
+
+        self._strategy: TodoistOwnerIssues = TodoistOwnerIssues()
+        # noinspection PyProtectedMember
+        self._strategy._todoist    = self._todoist
+        # noinspection PyProtectedMember
+        self._strategy._taskWriter = TodoistBatchWriter(apiToken='mockToken', session=session)
+        # noinspection PyProtectedMember
+        self._strategy._replica    = None
+        # noinspection PyProtectedMember
+        self._strategy._issueTaskMap = None
+
+    def testExistingRepositoryTaskIsNotFetched(self):
+
+        # noinspection PyProtectedMember
+        self._strategy._createProjectTasksInTopLevelProject(info=self._createCloneInformation(), progressCb=self._progressMonitor, projectId=MOCK_PROJECT_ID)
+
+        self._todoist.get_task.assert_not_called()
+        self.assertEqual(1, self._todoist.get_tasks.call_count, 'The project should be loaded once')
+
+    def testRepositoryTaskIsCreatedWithItsIssues(self):
+
+        # noinspection PyProtectedMember
+        self._strategy._createProjectTasksInTopLevelProject(info=self._createCloneInformation(), progressCb=self._progressMonitor, projectId=MOCK_PROJECT_ID)
+
+        taskCommands: List[Dict[str, Any]] = [command for command in self._sentCommands if command['type'] == 'item_add']
+
+        repositoryCommands: List[Dict[str, Any]] = [command for command in taskCommands if command['args']['content'] == 'code-ally-basic']
+        self.assertEqual(1, len(repositoryCommands), 'The new repository task should be queued once')
+
+        parentIds: List[str] = [command['args'].get('parent_id') for command in taskCommands if command is not repositoryCommands[0]]
+        self.assertEqual(['1', repositoryCommands[0]['temp_id'], repositoryCommands[0]['temp_id']], parentIds,
+                         'Issues are grouped under their repository task;  The existing issue is skipped')
+
+    def testReCloneNeedsNoTodoistReads(self):
+
+        replica: Mock = self._createReplica()
+
+        with TemporaryDirectory() as temporaryDirectory:
+            issueTaskMap: IssueTaskMap = IssueTaskMap(databasePath=Path(temporaryDirectory) / 'issueTasks.sqlite')
+            # noinspection PyProtectedMember
+            self._strategy._issueTaskMap = issueTaskMap
+
+            self._strategy.createTasks(info=self._createCloneInformation(), progressCb=self._progressMonitor)
+            self.assertEqual(4, len(issueTaskMap), 'Created and existing issue tasks should be mapped')
+
+            replica.reset_mock()
+            sentCount: int = len(self._sentCommands)
+
+            self._strategy.createTasks(info=self._createCloneInformation(), progressCb=self._progressMonitor)
+            issueTaskMap.close()
+
+        self.assertEqual([], self._todoist.method_calls, 'An already synchronized clone should not read from Todoist')
+        self.assertEqual(1, replica.refresh.call_count, 'Only the replica refresh')
+        replica.tasks.assert_not_called()
+        self.assertEqual(sentCount, len(self._sentCommands), 'Nothing should be created twice')
+
+    def testCreatedTasksAreAddedToTheReplica(self):
+
+        replica: Mock = self._createReplica()
+
+        self._strategy.createTasks(info=self._createCloneInformation(), progressCb=self._progressMonitor)
+
+        createdIds: List[str] = [f'real-{command["temp_id"]}' for command in self._sentCommands if 'temp_id' in command]
+        addedIds:   List[str] = [item['id'] for item in replica.addItems.call_args.args[0]]
+        self.assertEqual(createdIds, addedIds, 'The next plan should know the created tasks before the next refresh')
+
+    def testDeletedTaskIsClonedAgain(self):
+
+        replica: Mock = self._createReplica()
+
+        with TemporaryDirectory() as temporaryDirectory:
+            issueTaskMap: IssueTaskMap = IssueTaskMap(databasePath=Path(temporaryDirectory) / 'issueTasks.sqlite')
+            # noinspection PyProtectedMember
+            self._strategy._issueTaskMap = issueTaskMap
+
+            self._strategy.createTasks(info=self._createCloneInformation(), progressCb=self._progressMonitor)
+            # A full sync does not report deletions;  The task is simply gone
+            replica.hasTask.side_effect = lambda taskId: taskId != '2'
+            sentCount: int = len(self._sentCommands)
+
+            self._strategy.createTasks(info=self._createCloneInformation(), progressCb=self._progressMonitor)
+            issueTaskMap.close()
+
+        recreated: List[str] = [command['args']['content'] for command in self._sentCommands[sentCount:]]
+        self.assertEqual(1, len(recreated), 'Only the issue whose task was deleted should be cloned again')
+        self.assertIn('Fix the cache', recreated[0])
+
+    def testCancelKeepsTheFirstBatch(self):
+
+        self._todoist.get_projects.return_value = [self._createProject()]
+
+        session: Mock = Mock()
+        session.post.side_effect = self._answerSync
+        # noinspection PyProtectedMember
+        self._strategy._taskWriter = TodoistBatchWriter(apiToken='mockToken', session=session, maxCommandsPerRequest=2)
+
+        def cancelAfterFirstRequest(report: ProgressReport):
+            if report.completed > 0:
+                monitor.cancel()
+
+        monitor: ProgressMonitor = ProgressMonitor(listener=cancelAfterFirstRequest)
+
+        self.assertRaises(OperationCancelledError, self._strategy.createTasks, info=self._createCloneInformation(), progressCb=monitor)
+        self.assertEqual(2, len(self._sentCommands), 'The batch in flight finishes;  The rest are skipped')
+
+    def testPlanUsesOnlyTheSnapshot(self):
+
+        replica: Mock = Mock()
+        replica.isEmpty = False
+        replica.projects.return_value = [self._createProject()]
+        replica.tasks.return_value    = self._todoist.get_tasks.return_value
+        replica.comments.return_value = []
+        # noinspection PyProtectedMember
+        self._strategy._replica = replica
+
+        plan: TodoistPlan = self._strategy.planTasks(info=self._createCloneInformation())
+
+        replica.refresh.assert_called_once()
+        self.assertEqual([], self._todoist.method_calls, 'Planning should only refresh the replica')
+        self.assertFalse(plan.createProject)
+        self.assertEqual(['code-ally-basic'], plan.repositoryTasks)
+        self.assertEqual(['Fix the cache'], [gitIssueInfo.gitIssueName for gitIssueInfo in plan.issuesToSkip])
+        self.assertEqual(3, len(plan.issuesToCreate))
+        self.assertEqual(2, plan.requestCount, 'One replica refresh and one batch')
+
+    def _createReplica(self) -> Mock:
+        """
+        A replica with the project;  Once the first task was deleted it holds only the repository task
+        """
+        replica: Mock = Mock()
+        replica.isEmpty = False
+        replica.deletedTaskIds = []
+        replica.projects.return_value = [self._createProject()]
+        replica.tasks.side_effect     = lambda projectId: [task for task in self._todoist.get_tasks.return_value if replica.hasTask(task.id) is True]
+        replica.comments.return_value = []
+        replica.hasTask.return_value  = True
+        # noinspection PyProtectedMember
+        self._strategy._replica = replica
+
+        return replica
+
+    def _createProject(self) -> Mock:
+
+        project: Mock = Mock()
+        project.name = Preferences().todoistProjectName
+        project.id   = MOCK_PROJECT_ID
+
+        return project
+
+    def _createCloneInformation(self) -> CloneInformation:
+
+        cloneInformation: CloneInformation = CloneInformation()
+        for slug, title, number in [(EXISTING_REPOSITORY, 'Fix the cache', 1),
+                                    (NEW_REPOSITORY,      'Add a logger',  1),
+                                    (EXISTING_REPOSITORY, 'Speed up sync', 2),
+                                    (NEW_REPOSITORY,      'Update README', 2)]:
+            cloneInformation.tasksToClone.append(GitIssueInfo(slug=slug, gitIssueName=title, gitIssueURL=f'https://github.com/{slug}/issues/{number}'))
+
+        return cloneInformation
+
+    def _answerSync(self, url: str, headers: Dict[str, str], data: str) -> Mock:
+
+        commands: List[Dict[str, Any]] = jsonLoads(data)['commands']
+        self._sentCommands.extend(commands)
+
+        tempIdMapping: Dict[str, str] = {command['temp_id']: f'real-{command["temp_id"]}' for command in commands if 'temp_id' in command}
+
+        response: Mock = Mock()
+        response.status_code = 200
+        response.json.return_value = {'sync_status': {command['uuid']: 'ok' for command in commands}, 'temp_id_mapping': tempIdMapping}
+
+        return response
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistOwnerIssues))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,65 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pygitissue2todoist.strategy.TodoistProjectTree import TodoistProjectTree
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+
+from tests.pygitissue2todoist.strategy.TodoistStrategyUnitTestBase import TodoistStrategyUnitTestBase
+
+MOCK_PROJECT_ID: str = 'mockProjectId'
+
+
+class TestTodoistProjectTree(TodoistStrategyUnitTestBase):
+    """
+    Builds the "Development" project structure;  repository -> milestone -> issues
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._projectTree: TodoistProjectTree = TodoistProjectTree(projectId=MOCK_PROJECT_ID, tasks=[
+            self._createTask(taskId='1', content='PyGitIssue2Todoist'),
+            self._createTask(taskId='2', content='Release 1.0', parentId='1'),
+            self._createTask(taskId='3', content='Fix the cache', parentId='2'),
+            self._createTask(taskId='4', content='code-ally-basic'),
+            self._createTask(taskId='5', content='Release 1.0', parentId='4'),
+        ])
+
+    def testFindRepositoryTask(self):
+
+        self.assertEqual('1', self._projectTree.findChild(name='PyGitIssue2Todoist').id)
+        self.assertIsNone(self._projectTree.findChild(name='Release 1.0'), 'Milestones are not top level tasks')
+
+    def testMilestoneIsFoundUnderItsRepository(self):
+
+        self.assertEqual('5', self._projectTree.findChild(name='Release 1.0', parentId=TaskId('4')).id)
+
+    def testChildren(self):
+
+        self.assertEqual(['3'], [task.id for task in self._projectTree.children(parentId=TaskId('2'))])
+        self.assertEqual(0, len(self._projectTree.children(parentId=TaskId('3'))))
+
+    def testAddedTaskIsFound(self):
+
+        self._projectTree.add(self._createTask(taskId='6', content='Release 2.0', parentId='1'))
+
+        self.assertEqual('6', self._projectTree.findChild(name='Release 2.0', parentId=TaskId('1')).id)
+        self.assertEqual(6, len(self._projectTree))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistProjectTree))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
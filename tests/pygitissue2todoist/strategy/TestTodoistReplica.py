@@ -0,0 +1,159 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from requests import HTTPError
+
+from pygitissue2todoist.strategy.TodoistReplica import FULL_SYNC_TOKEN
+from pygitissue2todoist.strategy.TodoistReplica import TodoistReplica
+
+from tests.ProjectTestBase import ProjectTestBase
+
+MOCK_PROJECT_ID: str = 'mockProjectId'
+
+
+class TestTodoistReplica(ProjectTestBase):
+    """
+    Answers the Sync API from a queue of canned responses
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._replicaDirectory:   Path               = Path(self._temporaryDirectory.name)
+
+        self._sentTokens: List[str]            = []
+        self._responses:  List[Dict[str, Any]] = []
+
+        self._session: Mock = Mock()
+        self._session.post.side_effect = self._answerSync
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testFullThenIncrementalSync(self):
+
+        self._responses.append(self._createResponse(syncToken='token1', fullSync=True,
+                                                    items=[self._createItem(itemId='1', content='Repository'),
+                                                           self._createItem(itemId='2', content='Issue', parentId='1')]))
+        self._responses.append(self._createResponse(syncToken='token2',
+                                                    items=[self._createItem(itemId='2', content='Issue', parentId='1', checked=True),
+                                                           self._createItem(itemId='3', content='New issue', parentId='1')]))
+
+        replica: TodoistReplica = self._createReplica()
+        replica.refresh()
+        replica.refresh()
+
+        self.assertEqual([FULL_SYNC_TOKEN, 'token1'], self._sentTokens, 'The second refresh should only ask for changes')
+        self.assertEqual(['Repository', 'New issue'], [task.content for task in replica.tasks(projectId=MOCK_PROJECT_ID)],
+                         'Completed tasks should leave the replica')
+
+    def testReplicaSurvivesRestart(self):
+
+        self._responses.append(self._createResponse(syncToken='token1', fullSync=True, items=[self._createItem(itemId='1', content='Repository')]))
+        self._createReplica().refresh()
+
+        self._responses.append(self._createResponse(syncToken='token2'))
+        replica: TodoistReplica = self._createReplica()
+        replica.refresh()
+
+        self.assertEqual('token1', self._sentTokens[-1], 'A new replica should continue from the saved token')
+        self.assertEqual(1, len(replica.tasks(projectId=MOCK_PROJECT_ID)))
+
+    def testDamagedReplicaCausesFullSync(self):
+
+        self._responses.append(self._createResponse(syncToken='token1', fullSync=True))
+        self._createReplica().refresh()
+
+        for replicaPath in self._replicaDirectory.glob('replica-*.json'):
+            replicaPath.write_text('{ "version": 1, "syncTo')
+
+        self._responses.append(self._createResponse(syncToken='token2', fullSync=True))
+        self._createReplica().refresh()
+
+        self.assertEqual(FULL_SYNC_TOKEN, self._sentTokens[-1])
+
+    def testRejectedTokenCausesFullSync(self):
+
+        self._responses.append(self._createResponse(syncToken='token1', fullSync=True))
+        replica: TodoistReplica = self._createReplica()
+        replica.refresh()
+
+        self._responses.append({'status_code': 400})
+        self._responses.append(self._createResponse(syncToken='token2', fullSync=True))
+        replica.refresh()
+
+        self.assertEqual([FULL_SYNC_TOKEN, 'token1', FULL_SYNC_TOKEN], self._sentTokens)
+
+    def testComments(self):
+
+        self._responses.append(self._createResponse(syncToken='token1', fullSync=True,
+                                                    items=[self._createItem(itemId='1', content='Issue')],
+                                                    notes=[{'id': 'n1', 'item_id': '1', 'content': 'https://github.com', 'posted_at': ''}]))
+        replica: TodoistReplica = self._createReplica()
+        replica.refresh()
+
+        self.assertEqual(['1'], [comment.task_id for comment in replica.comments(tasks=replica.tasks(projectId=MOCK_PROJECT_ID))])
+
+    def _createReplica(self) -> TodoistReplica:
+        return TodoistReplica(apiToken='mockToken', replicaDirectory=self._replicaDirectory, session=self._session)
+
+    def _createResponse(self, syncToken: str, fullSync: bool = False, items: Optional[List[Dict[str, Any]]] = None, notes: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+
+        return {
+            'sync_token': syncToken,
+            'full_sync':  fullSync,
+            'projects':   [{'id': MOCK_PROJECT_ID, 'name': 'Development'}] if fullSync is True else [],
+            'items':      [] if items is None else items,
+            'notes':      [] if notes is None else notes,
+        }
+
+    def _createItem(self, itemId: str, content: str, parentId: Optional[str] = None, checked: bool = False) -> Dict[str, Any]:
+        return {'id': itemId, 'content': content, 'project_id': MOCK_PROJECT_ID, 'parent_id': parentId, 'checked': checked, 'is_deleted': False}
+
+    def _answerSync(self, url: str, headers: Dict[str, str], data: str) -> Mock:
+
+        self._sentTokens.append(jsonLoads(data)['sync_token'])
+
+        answer:   Dict[str, Any] = self._responses.pop(0)
+        response: Mock           = Mock()
+        if answer.get('status_code', 200) == 200:
+            response.status_code = 200
+            response.json.return_value = answer
+        else:
+            response.status_code = answer['status_code']
+            response.raise_for_status.side_effect = HTTPError(f'{answer["status_code"]} Client Error')
+
+        return response
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistReplica))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,95 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from todoist_api_python.models import Comment
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TaskId
+from pygitissue2todoist.strategy.TodoistStrategyTypes import TempId
+from pygitissue2todoist.strategy.TodoistTaskIndex import TodoistTaskIndex
+
+from tests.pygitissue2todoist.strategy.TodoistStrategyUnitTestBase import TodoistStrategyUnitTestBase
+
+ISSUE_URL:       str = 'https://github.com/hasii2011/PyGitIssue2Todoist/issues/42'
+OTHER_ISSUE_URL: str = 'https://github.com/hasii2011/code-ally-basic/issues/42'
+
+
+class TestTodoistTaskIndex(TodoistStrategyUnitTestBase):
+    """
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+    def testNameIsNormalized(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content='Fix  the Cache ')])
+
+        self.assertEqual(TaskId('1'), taskIndex.find(name='fix the cache'), 'Case and whitespace should not matter')
+
+    def testContainedTitleIsNotADuplicate(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content='Fix the cache eviction')])
+
+        self.assertFalse(taskIndex.contains(name='Fix the cache'), 'Only exact names should match')
+
+    def testHyperlinkedName(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content=f'[Fix the cache]({ISSUE_URL})')])
+
+        self.assertEqual(TaskId('1'), taskIndex.find(name='Fix the cache'))
+        self.assertEqual(TaskId('1'), taskIndex.find(name='A renamed issue', url=ISSUE_URL), 'The URL should survive a rename')
+
+    def testURLInDescription(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content='Old title', description=ISSUE_URL)])
+
+        self.assertEqual(TaskId('1'), taskIndex.find(name='New title', url=ISSUE_URL))
+
+    def testURLInComment(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content='Old title')])
+        taskIndex.addComments([Comment(attachment=None, content=ISSUE_URL, id='c1', posted_at='', project_id=None, task_id='1')])
+
+        self.assertEqual(TaskId('1'), taskIndex.find(name='New title', url=ISSUE_URL))
+
+    def testSameNameForAnotherIssue(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=[self._createTask(taskId='1', content='Update README', description=ISSUE_URL)])
+
+        self.assertIsNone(taskIndex.find(name='Update README', url=OTHER_ISSUE_URL), 'The same title in another repository is a different issue')
+
+    def testQueuedTask(self):
+
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex()
+        taskIndex.add(taskId=TempId('temp'), content='Fix the cache', description=ISSUE_URL)
+
+        self.assertEqual(TempId('temp'), taskIndex.find(name='Fix the cache', url=ISSUE_URL))
+
+    def testManyTasks(self):
+
+        tasks:     List[Task]       = [self._createTask(taskId=str(x), content=f'Issue {x}') for x in range(5000)]
+        taskIndex: TodoistTaskIndex = TodoistTaskIndex(tasks=tasks)
+
+        self.assertEqual(5000, len(taskIndex))
+        self.assertEqual(TaskId('4999'), taskIndex.find(name='Issue 4999'))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTodoistTaskIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
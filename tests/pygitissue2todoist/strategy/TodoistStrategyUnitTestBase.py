@@ -1,5 +1,11 @@
 
 from typing import List
+from typing import Optional
+
+from todoist_api_python.models import Task
+
+from pygitissue2todoist.general.ProgressMonitor import ProgressMonitor
+from pygitissue2todoist.general.ProgressMonitor import ProgressReport
 
 from pygitissue2todoist.strategy.TodoistStrategyTypes import GitIssueInfo
 
@@ -22,9 +28,11 @@ class TodoistStrategyUnitTestBase(ProjectTestBase):
         self._cbInvoked:     bool = False
         self._cbInvokeCount: int = 0
 
-    def _sampleCallback(self, statusMsg: str):
+        self._progressMonitor: ProgressMonitor = ProgressMonitor(listener=self._sampleCallback)
 
-        self.logger.info(f'{statusMsg=}')
+    def _sampleCallback(self, report: ProgressReport):
+
+        self.logger.info(f'{report.message=}')
 
         self._cbInvoked     = True
         self._cbInvokeCount += 1
@@ -43,3 +51,11 @@ class TodoistStrategyUnitTestBase(ProjectTestBase):
             taskList.append(taskInfo)
 
         return taskList
+
+    def _createTask(self, taskId: str, content: str, description: str = '', parentId: Optional[str] = None) -> Task:
+        """
+        A task as get_tasks returns it, for tests that do not talk to Todoist
+        """
+        return Task(assignee_id=None, assigner_id=None, comment_count=0, is_completed=False, content=content, created_at='',
+                    creator_id='', description=description, due=None, id=taskId, labels=[], order=0, parent_id=parentId,
+                    priority=1, project_id='mockProjectId', section_id=None, url='', duration=None)